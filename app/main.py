@@ -4,27 +4,36 @@
 FastAPI를 사용하여 RESTful API 엔드포인트를 제공합니다.
 
 이 모듈은 다음과 같은 기능을 제공합니다:
+- 서버 기동 시 DB 연결 대기
 - CORS 미들웨어 설정
-- 사용자 관련 라우터 등록
+- 사용자 관련 라우터 등록 (DB_ASYNC_MODE 환경 변수에 따라 동기/비동기 라우터 선택)
 - 기본 루트 엔드포인트 제공
 """
 
+import os
 from contextlib import asynccontextmanager
 
 from fastapi import FastAPI
+from fastapi.concurrency import run_in_threadpool
 from fastapi.middleware.cors import CORSMiddleware
 
-from app.routers.employee import router as employee_router
-from app.routers.feature import router as feature_router
-from app.routers.news import router as news_router
-from app.routers.user import router as user_router
+from app.routers import employee, feature, health, news, user
+from app.utils.category_matcher import load_category_matcher_backend
+from app.utils.db_logging import RouteContextMiddleware
+from app.utils.db_manager import db_manager
 from app.utils.init_elasticsearch_index import create_category_index
 
+# true일 경우 AsyncSession 기반의 async 라우터를 등록 (기본값: 동기 라우터)
+DB_ASYNC_MODE = os.getenv("DB_ASYNC_MODE", "false").lower() == "true"
+
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
-    # 서버 시작 시 실행할 코드
-    create_category_index()
+    # 서버 시작 시 실행할 코드: DB가 뜰 때까지 백오프로 기다린 뒤 요청을 받음 (이벤트 루프 밖 스레드에서 대기)
+    await run_in_threadpool(db_manager.wait_for_connection)
+    # 로컬 카테고리 매처는 Elasticsearch 색인이 필요 없음
+    if load_category_matcher_backend() == "elasticsearch":
+        create_category_index()
     yield
     # 서버 종료 시 실행할 코드 (필요 시 여기에 정리 작업 가능)
 
@@ -44,10 +53,22 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
-app.include_router(user_router, prefix="/user")
-app.include_router(employee_router, prefix="/employee")
-app.include_router(news_router, prefix="/news")
-app.include_router(feature_router, prefix="/feature")
+# 느린 쿼리 로그에 요청 경로를 남기기 위한 미들웨어
+app.add_middleware(RouteContextMiddleware)
+
+def include_routers(app: FastAPI, async_mode: bool):
+    """도메인 라우터를 등록합니다.
+
+    Args:
+        app (FastAPI): 라우터를 등록할 애플리케이션.
+        async_mode (bool): True이면 AsyncSession 기반의 비동기 라우터를 등록합니다.
+    """
+    for prefix, module in (("/user", user), ("/employee", employee), ("/news", news), ("/feature", feature)):
+        app.include_router(module.async_router if async_mode else module.router, prefix=prefix)
+
+include_routers(app, DB_ASYNC_MODE)
+app.include_router(health.router, prefix="/health")
+
 @app.post("/")
 async def root():
     """루트 엔드포인트 핸들러.
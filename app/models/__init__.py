@@ -1,13 +1,21 @@
 from .base import Base
 from .category import Category
 from .employee import Employee
+from .employee_archive import EmployeeArchive
 from .employee_category import EmployeeCategory
+from .employee_category_archive import EmployeeCategoryArchive
 from .employee_hire_type import EmployeeHireType
+from .employee_hire_type_archive import EmployeeHireTypeArchive
 from .feature import Feature
 from .hire_type import HireType
 from .news import News
+from .news_crawl_state import NewsCrawlState
+from .recruit_backfill_checkpoint import RecruitBackfillCheckpoint
 from .user_category import UserCategory
+from .user_feed import UserFeed
 from .users import Users
 
 __all__ = ["Base", "Category", "Feature", "UserCategory", "Users", "Employee", "News",
-           "EmployeeHireType", "EmployeeCategory", "HireType"]
+           "EmployeeHireType", "EmployeeCategory", "HireType", "NewsCrawlState",
+           "RecruitBackfillCheckpoint", "UserFeed", "EmployeeArchive", "EmployeeCategoryArchive",
+           "EmployeeHireTypeArchive"]
@@ -21,6 +21,7 @@ class Category(Base):
         feature_id (int): 기능 유형 ID (Feature 테이블 참조).
         category_name (str): 카테고리 이름.
         created_at (datetime): 카테고리 생성 시간.
+        updated_at (datetime): 카테고리 수정 시간 (Elasticsearch 증분 동기화 기준).
         feature (relationship): Feature 모델과의 관계 객체.
         user_category (relationship): UserCategory 모델과의 관계 객체.
         news (relationship): News 모델과의 관계 객체.
@@ -30,9 +31,10 @@ class Category(Base):
     __tablename__ = "category"
 
     category_id = Column(Integer, primary_key=True, autoincrement=True)
-    feature_id = Column(Integer, ForeignKey("feature.feature_id"), nullable=False)
+    feature_id = Column(Integer, ForeignKey("feature.feature_id"), nullable=False, index=True)
     category_name = Column(String(50), nullable=False)
     created_at = Column(DateTime, default=func.now())
+    updated_at = Column(DateTime, default=func.now(), onupdate=func.now(), index=True)
 
     feature = relationship("Feature", back_populates="category")
     user_category = relationship("UserCategory", back_populates="category")
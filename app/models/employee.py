@@ -4,7 +4,10 @@
 사용자 맞춤 추천, 공고 목록 제공 등에 사용됩니다.
 """
 
-from sqlalchemy import TIMESTAMP, Column, Date, Integer, String, func
+from datetime import date
+from typing import Optional
+
+from sqlalchemy import TIMESTAMP, Column, Date, Index, Integer, String, func
 from sqlalchemy.orm import relationship
 
 from app.models.base import Base
@@ -41,5 +44,17 @@ class Employee(Base):
     recrut_pblnt_sn = Column(Integer, nullable=False, unique=True)  # ALIO 공고 고유번호
     created_at = Column(TIMESTAMP, server_default=func.now())  # 등록 시각
 
+    __table_args__ = (
+        # 추천/검색 정렬 순서이자 페이지 커서 키(start_date DESC, recruit_id DESC)와 동일한 인덱스
+        Index("ix_employee_start_date_recruit_id", start_date.desc(), recruit_id.desc()),
+        # 마감된 공고를 보관 테이블로 옮기는 작업(archive_employee_data)의 범위 조회용
+        Index("ix_employee_end_date", end_date),
+    )
+
     categories = relationship("EmployeeCategory", back_populates="employee", cascade="all, delete-orphan")
     hire_types = relationship("EmployeeHireType", back_populates="employee", cascade="all, delete-orphan")
+
+    @classmethod
+    def is_open(cls, today: Optional[date] = None):
+        """마감일이 today(기본값: 오늘) 이후인, 지원 가능한 공고를 고르는 조건식을 반환합니다."""
+        return cls.end_date >= (today or date.today())
@@ -0,0 +1,41 @@
+"""마감된 채용 공고를 보관하는 데이터베이스 모델 모듈.
+
+이 모듈은 마감일이 지나 employee 테이블에서 옮겨진 채용 공고를 저장하는 데이터베이스 모델을 포함합니다.
+employee 테이블에는 지원 가능한 공고만 남기고, 지난 공고 이력은 이 테이블에서 조회합니다.
+"""
+
+from sqlalchemy import TIMESTAMP, Column, Date, DateTime, Integer, String, func
+
+from app.models.base import Base
+
+
+class EmployeeArchive(Base):
+    """마감된 채용 공고 정보를 저장하는 데이터베이스 모델 클래스.
+
+    Employee와 같은 컬럼에 보관 시각(archived_at)을 더한 구조입니다.
+
+    Attributes:
+        recruit_id (int): 채용 공고의 고유 ID.
+        title (str): 채용 공고 제목.
+        institution (str): 채용 기관명.
+        start_date (date): 공고 시작일.
+        end_date (date): 공고 마감일.
+        recrut_se (str): 경력 구분 (신입/경력).
+        detail_url (str): 공고 상세보기 URL.
+        recrut_pblnt_sn (int): 채용 공고 고유 번호 (숫자 ID).
+        created_at (datetime): 원래 공고가 저장된 시각.
+        archived_at (datetime): 보관 테이블로 옮겨진 시각.
+    """
+
+    __tablename__ = "employee_archive"
+
+    recruit_id = Column(Integer, primary_key=True)
+    title = Column(String(255), nullable=False)
+    institution = Column(String(100), nullable=False)
+    start_date = Column(Date, nullable=False)
+    end_date = Column(Date, nullable=False, index=True)
+    recrut_se = Column(String(100), nullable=True)
+    detail_url = Column(String(255), nullable=True)
+    recrut_pblnt_sn = Column(Integer, nullable=False)
+    created_at = Column(TIMESTAMP, nullable=True)
+    archived_at = Column(DateTime, default=func.now())
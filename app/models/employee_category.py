@@ -1,4 +1,4 @@
-from sqlalchemy import Column, ForeignKey, Integer
+from sqlalchemy import Column, ForeignKey, Index, Integer
 from sqlalchemy.orm import relationship
 
 from app.models.base import Base
@@ -15,6 +15,10 @@ class EmployeeCategory(Base):
     """
 
     __tablename__ = "employee_category"
+    __table_args__ = (
+        # PK(recruit_id, category_id)로는 category_id 단독 조회를 할 수 없으므로 역방향 인덱스 추가
+        Index("ix_employee_category_category_id_recruit_id", "category_id", "recruit_id"),
+    )
 
     recruit_id = Column(Integer, ForeignKey("employee.recruit_id"), primary_key=True)
     category_id = Column(Integer, ForeignKey("category.category_id"), primary_key=True)
@@ -0,0 +1,17 @@
+from sqlalchemy import Column, Integer
+
+from app.models.base import Base
+
+
+class EmployeeCategoryArchive(Base):
+    """마감된 채용공고와 카테고리 간의 연결 정보를 보관하는 모델 클래스.
+
+    Attributes:
+        recruit_id (int): 보관된 채용공고 ID.
+        category_id (int): 카테고리 ID.
+    """
+
+    __tablename__ = "employee_category_archive"
+
+    recruit_id = Column(Integer, primary_key=True)
+    category_id = Column(Integer, primary_key=True)
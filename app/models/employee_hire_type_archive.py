@@ -0,0 +1,17 @@
+from sqlalchemy import Column, Integer
+
+from app.models.base import Base
+
+
+class EmployeeHireTypeArchive(Base):
+    """마감된 채용공고와 채용형태 간의 연결 정보를 보관하는 모델 클래스.
+
+    Attributes:
+        recruit_id (int): 보관된 채용공고 ID.
+        hire_type_id (int): 채용형태 ID.
+    """
+
+    __tablename__ = "employee_hire_type_archive"
+
+    recruit_id = Column(Integer, primary_key=True)
+    hire_type_id = Column(Integer, primary_key=True)
@@ -4,7 +4,7 @@
 데이터베이스 모델을 포함합니다.
 """
 
-from sqlalchemy import Column, Integer, String
+from sqlalchemy import Column, DateTime, Integer, String, func
 from sqlalchemy.orm import relationship
 
 from app.models.base import Base
@@ -19,12 +19,14 @@ class Feature(Base):
     Attributes:
         feature_id (int): 기능 유형의 고유 식별자.
         feature_type (str): 기능의 유형 (예: 뉴스, 채용 정보 등).
+        updated_at (datetime): 기능 유형 수정 시간 (Elasticsearch 증분 동기화 기준).
         category (relationship): Category 모델과의 관계 객체.
     """
 
     __tablename__ = "feature"
 
     feature_id = Column(Integer, primary_key=True, autoincrement=True)
-    feature_type = Column(String(30))  # 뉴스, 채용 정보 등
+    feature_type = Column(String(30), index=True)  # 뉴스, 채용 정보 등
+    updated_at = Column(DateTime, default=func.now(), onupdate=func.now())
 
     category = relationship("Category", back_populates="feature")  # Category 모델과 관계 설정
@@ -4,7 +4,7 @@
 카테고리와의 관계를 설정하여 뉴스의 분류를 관리합니다.
 """
 
-from sqlalchemy import BigInteger, Column, DateTime, ForeignKey, Integer, String, Text, func
+from sqlalchemy import BigInteger, Column, DateTime, ForeignKey, Index, Integer, String, Text, func
 from sqlalchemy.orm import relationship
 
 from app.models.base import Base
@@ -14,6 +14,7 @@ class News(Base):
     """뉴스 정보를 저장하는 데이터베이스 모델 클래스.
 
     이 클래스는 뉴스의 기본 정보를 저장하며, Category 모델과 N:1 관계를 가집니다.
+    PostgreSQL에서는 publish_date 기준 월별 파티션으로 나뉘며, 보존 기간이 지난 파티션은 통째로 삭제됩니다.
 
     Attributes:
         news_id (int): 뉴스의 고유 식별자.
@@ -31,15 +32,22 @@ class News(Base):
 
     __tablename__ = "news"
 
-    news_id = Column(BigInteger, primary_key=True, autoincrement=True)
+    news_id = Column(BigInteger, primary_key=True, autoincrement=False)  # 기사 링크의 해시
     category_id = Column(Integer, ForeignKey("category.category_id"))
     title = Column(String(255), nullable=False)
     contents = Column(Text, nullable=False)
     source = Column(String(100), nullable=False)
-    publish_date = Column(DateTime, nullable=False)
+    publish_date = Column(DateTime, primary_key=True)  # PostgreSQL 파티션 키는 기본 키에 포함되어야 함
     category = Column(String(50), nullable=False)
     url = Column(String(255), nullable=False)
     original_url = Column(String(255), nullable=False)
     created_at = Column(DateTime, default=func.now())
 
+    __table_args__ = (
+        # 카테고리별 최신 뉴스 조회와 페이지 커서 (WHERE category_id = ? ORDER BY publish_date DESC, news_id DESC)
+        Index("ix_news_category_id_publish_date_news_id", category_id, publish_date.desc(), news_id.desc()),
+        # PostgreSQL에서는 publish_date 월 단위 RANGE 파티션 테이블로 생성 (app.utils.news_partitions)
+        {"postgresql_partition_by": "RANGE (publish_date)"},
+    )
+
     category_rel = relationship("Category", back_populates="news")
@@ -0,0 +1,38 @@
+"""뉴스 수집 진행 상태를 관리하는 데이터베이스 모델 모듈.
+
+이 모듈은 카테고리별로 마지막으로 수집한 뉴스 위치(워터마크)를 저장하는
+데이터베이스 모델을 포함합니다. 다음 수집 시 워터마크에 도달하면 페이지 조회를 멈추며,
+페이지 한도로 워터마크에 도달하지 못한 경우 남은 구간을 이어서 조회할 위치를 함께 저장합니다.
+"""
+
+from sqlalchemy import Column, DateTime, ForeignKey, Integer, String, func
+
+from app.models.base import Base
+
+
+class NewsCrawlState(Base):
+    """카테고리별 뉴스 수집 워터마크를 저장하는 데이터베이스 모델 클래스.
+
+    Attributes:
+        category_id (int): 카테고리 ID (Category 테이블 참조).
+        last_publish_date (datetime): 빠짐없이 수집한 뉴스 중 가장 최신 뉴스의 작성일 (네이버 기준 현지 시각).
+        last_link (str): 빠짐없이 수집한 뉴스 중 가장 최신 뉴스의 링크.
+        pending_publish_date (datetime): 워터마크와의 사이에 빠진 구간이 있는 가장 최신 뉴스의 작성일.
+            남은 구간을 모두 채우면 워터마크가 됩니다.
+        pending_link (str): pending_publish_date 뉴스의 링크. 빠진 구간이 없으면 None.
+        resume_start (int): 남은 구간을 이어서 조회할 네이버 start 값.
+        resume_publish_date (datetime): 지금까지 수집한 가장 오래된 뉴스의 작성일. 이어서 조회할 때 이보다 최신인
+            뉴스는 이미 수집했으므로 건너뜁니다.
+        updated_at (datetime): 워터마크 갱신 시간.
+    """
+
+    __tablename__ = "news_crawl_state"
+
+    category_id = Column(Integer, ForeignKey("category.category_id"), primary_key=True)
+    last_publish_date = Column(DateTime, nullable=False)
+    last_link = Column(String(255), nullable=False)
+    pending_publish_date = Column(DateTime, nullable=True)
+    pending_link = Column(String(255), nullable=True)
+    resume_start = Column(Integer, nullable=True)
+    resume_publish_date = Column(DateTime, nullable=True)
+    updated_at = Column(DateTime, default=func.now(), onupdate=func.now())
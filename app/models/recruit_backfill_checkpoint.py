@@ -0,0 +1,25 @@
+"""채용 공고 백필 진행 상태를 관리하는 데이터베이스 모델 모듈.
+
+이 모듈은 채용 공고 백필 명령이 완료한 날짜(shard)를 기록하는 데이터베이스 모델을 포함합니다.
+백필을 다시 실행하면 이미 완료된 날짜는 건너뜁니다.
+"""
+
+from sqlalchemy import Column, Date, DateTime, Integer, func
+
+from app.models.base import Base
+
+
+class RecruitBackfillCheckpoint(Base):
+    """완료된 채용 공고 백필 날짜를 저장하는 데이터베이스 모델 클래스.
+
+    Attributes:
+        shard_date (date): 백필을 완료한 공고 시작일.
+        fetched (int): 해당 날짜에 조회된 채용 공고 수.
+        completed_at (datetime): 완료 시각.
+    """
+
+    __tablename__ = "recruit_backfill_checkpoint"
+
+    shard_date = Column(Date, primary_key=True)
+    fetched = Column(Integer, nullable=False, default=0)
+    completed_at = Column(DateTime, default=func.now())
@@ -4,7 +4,7 @@
 사용자의 카테고리 구독 상태와 관련된 정보를 저장합니다.
 """
 
-from sqlalchemy import Boolean, Column, DateTime, ForeignKey, Integer, String, func
+from sqlalchemy import Boolean, Column, DateTime, ForeignKey, Index, Integer, String, func
 from sqlalchemy.orm import relationship
 
 from app.models.base import Base
@@ -27,6 +27,10 @@ class UserCategory(Base):
     """
 
     __tablename__ = "user_category"
+    __table_args__ = (
+        Index("ix_user_category_user_id_is_active", "user_id", "is_active"),  # 활성 구독 조회
+        Index("ix_user_category_user_id_category_id", "user_id", "category_id"),  # 구독 중복/해제 확인
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     user_id = Column(String, ForeignKey("users.user_id"))
@@ -0,0 +1,41 @@
+"""사용자별 추천 피드를 관리하는 데이터베이스 모델 모듈.
+
+이 모듈은 수집 작업이 끝날 때마다 미리 계산해 두는 사용자별 채용 공고/뉴스 추천 목록(피드)을
+저장하는 데이터베이스 모델을 포함합니다. 추천 API는 피드가 있으면 사용자 ID로 바로 조회하고,
+없으면 실시간 추천 쿼리로 대체합니다.
+"""
+
+from sqlalchemy import BigInteger, Column, DateTime, Integer, String, func
+
+from app.models.base import Base
+
+
+class UserFeed(Base):
+    """사용자별 추천 피드의 항목 하나를 저장하는 데이터베이스 모델 클래스.
+
+    채용 공고 피드는 추천 순서대로 한 행씩, 뉴스 피드는 구독 순서의 카테고리마다 최신 뉴스를
+    한 행씩 저장합니다. 뉴스가 없는 구독 카테고리는 item_id가 없는 행 하나로 표시하여
+    부족 메시지를 만들 수 있게 합니다.
+
+    Attributes:
+        user_id (str): 사용자 ID.
+        feature_type (str): 피드 종류 ("employee" 또는 "news").
+        position (int): 피드 안에서의 순서 (0부터).
+        group_id (int): 뉴스 피드의 카테고리 ID (채용 공고 피드는 None).
+        item_rank (int): 그룹 안에서의 순위 (0부터, 요청 limit보다 작은 항목만 조회).
+        item_id (int): 채용 공고 recruit_id 또는 뉴스 news_id (뉴스가 없는 카테고리는 None).
+        item_date (datetime): 뉴스의 publish_date (채용 공고 피드는 None). news 테이블의 기본 키가
+            (news_id, publish_date)이므로 두 컬럼으로 조인하여 파티션 하나만 읽습니다.
+        generated_at (datetime): 피드 생성 시간.
+    """
+
+    __tablename__ = "user_feed"
+
+    user_id = Column(String(30), primary_key=True)
+    feature_type = Column(String(30), primary_key=True)
+    position = Column(Integer, primary_key=True)
+    group_id = Column(Integer, nullable=True)
+    item_rank = Column(Integer, nullable=False)
+    item_id = Column(BigInteger, nullable=True)
+    item_date = Column(DateTime, nullable=True)
+    generated_at = Column(DateTime, default=func.now())
@@ -4,21 +4,38 @@
 사용자의 구독 정보를 바탕으로 관련된 채용 공고를 필터링하여 반환합니다.
 """
 
+from datetime import date
+from typing import Optional
+
 from elasticsearch import Elasticsearch
 from fastapi import APIRouter, Depends, HTTPException, Query
-from sqlalchemy.orm import Session
+from fastapi.concurrency import run_in_threadpool
+from sqlalchemy import Select, exists, func, literal, select, true, tuple_, union_all
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session, aliased
 
 from app.models import Employee, EmployeeCategory, UserCategory, Users
+from app.utils.catalog_cache import CatalogSnapshot, catalog_cache
+from app.utils.category_matcher import create_category_matcher
 from app.utils.db_manager import db_manager
+from app.utils.feed_materializer import employee_feed_query
+from app.utils.pagination import decode_cursor, encode_cursor
+from app.utils.response_cache import cached_recommendations, cached_recommendations_async
+from app.utils.user_cache import user_cache
 
 router = APIRouter()
+async_router = APIRouter()  # DB_ASYNC_MODE에서 등록되는 비동기 라우터
 db_dependency = Depends(db_manager.get_db)  # 전역 변수로 설정
+async_db_dependency = Depends(db_manager.get_async_db)
 es = Elasticsearch("http://elasticsearch:9200")
+category_matcher = create_category_matcher(es_client=es)  # CATEGORY_MATCHER 설정에 따른 키워드 매처
+EMPLOYEE_ORDER = (Employee.start_date.desc(), Employee.recruit_id.desc())  # 추천·검색 정렬 순서 (커서 키)
 
 @router.get("/recommend")
 def get_recruit_recommendations(
     user_id: str = Query(..., description="추천을 받을 사용자 ID"),
     limit: int = Query(10, ge=1, le=100, description="추천 받을 채용 공고 수 (최대 100개, 기본값: 10)"),
+    cursor: Optional[str] = Query(None, description="이전 응답의 next_cursor (다음 페이지 조회)"),
     db: Session = db_dependency
 ):
     """
@@ -27,47 +44,84 @@ def get_recruit_recommendations(
     Args:
         user_id (str): 채용 공고를 추천받을 사용자 ID.
         limit (int): 추천할 채용 공고 수.
+        cursor (str): 이전 응답의 next_cursor. 없으면 첫 페이지를 조회합니다.
         db (Session): 데이터베이스 세션 객체.
 
     Returns:
-        List[Employee]: 사용자의 관심 카테고리에 해당하는 채용 공고 목록.
+        dict: 사용자의 관심 카테고리에 해당하는 채용 공고 목록(results), 안내 메시지(message),
+            다음 페이지 커서(next_cursor, 마지막 페이지이면 None).
 
     Raises:
+        HTTPException 400: 커서 형식이 올바르지 않을 경우.
         HTTPException 404: 사용자가 존재하지 않을 경우.
         HTTPException 404: 사용자의 관심 카테고리가 없을 경우.
         HTTPException 404: 추천 가능한 채용 공고가 없을 경우.
     """
-    # ✅ 1. 사용자 존재 확인
-    user = db.query(Users).filter(Users.user_id == user_id).first()
-    if not user:
-        raise HTTPException(status_code=404, detail="User not found")
+    return cached_recommendations(db, "employee", user_id, limit, fetch_recruit_recommendations, cursor=cursor)
 
-    # ✅ 2. 사용자 관심 카테고리 조회 (활성화된 것만)
-    user_categories = (
-        db.query(UserCategory.category_id)
-        .filter(UserCategory.user_id == user_id, UserCategory.is_active.is_(True))
-        .all()
+@async_router.get("/recommend")
+async def get_recruit_recommendations_async(
+    user_id: str = Query(..., description="추천을 받을 사용자 ID"),
+    limit: int = Query(10, ge=1, le=100, description="추천 받을 채용 공고 수 (최대 100개, 기본값: 10)"),
+    cursor: Optional[str] = Query(None, description="이전 응답의 next_cursor (다음 페이지 조회)"),
+    db: AsyncSession = async_db_dependency
+):
+    """get_recruit_recommendations의 비동기 버전입니다.
+
+    조회 로직은 동일하며, DB 조회는 AsyncSession.run_sync로, 블로킹 응답 캐시(redis) 호출은 스레드풀에서 실행하여
+    이벤트 루프를 막지 않습니다.
+    """
+    return await cached_recommendations_async(
+        db, "employee", user_id, limit, fetch_recruit_recommendations, cursor=cursor
     )
-    if not user_categories: # 만약 활성화된 카테고리가 없다면
-        raise HTTPException(status_code=404, detail="No active category subscriptions")
 
-    category_ids = [uc.category_id for uc in user_categories]
+def fetch_recruit_recommendations(db: Session, user_id: str, limit: int, cursor: Optional[str] = None):
+    """사용자의 관심 카테고리에 해당하는 채용 공고를 조회합니다.
 
-    # ✅ 3. 해당 카테고리의 채용 공고 조회
-    jobs = (
-        db.query(Employee)
-        .join(EmployeeCategory, Employee.recruit_id == EmployeeCategory.recruit_id)
-        .filter(EmployeeCategory.category_id.in_(category_ids))
-        .order_by(
-            Employee.start_date.desc(),
-            Employee.end_date.asc()
-        )
-        .limit(limit)
-        .all()
-    )
-    if not jobs:
+    동기/비동기 라우터가 공통으로 사용하는 조회 로직입니다. 다음 페이지가 있는지 알기 위해
+    limit보다 하나 더 조회하며, 커서가 있으면 커서 위치 다음부터 실시간으로 조회합니다.
+
+    Args:
+        db (Session): 데이터베이스 세션 객체.
+        user_id (str): 채용 공고를 추천받을 사용자 ID.
+        limit (int): 추천할 채용 공고 수.
+        cursor (str): 이전 응답의 next_cursor ((start_date, recruit_id) 커서).
+
+    Returns:
+        dict: 채용 공고 목록(results), 안내 메시지(message), 다음 페이지 커서(next_cursor).
+
+    Raises:
+        HTTPException 400: 커서 형식이 올바르지 않을 경우.
+        HTTPException 404: 사용자, 관심 카테고리 또는 (첫 페이지의) 채용 공고가 없을 경우.
+    """
+    after = decode_cursor(cursor, date.fromisoformat, int)
+
+    # ✅ 0. 존재하지 않는 것으로 캐시된 사용자는 DB 조회 없이 거절
+    if user_cache.peek(user_id) is False:
+        raise HTTPException(status_code=404, detail="User not found")
+
+    # ✅ 1. 사용자 존재 여부, 활성 구독 여부, 채용 공고를 한 번의 쿼리로 조회
+    #       (첫 페이지는 수집 작업이 미리 계산해 둔 피드가 있으면 피드에서 읽음)
+    feed = employee_feed_query(user_id, limit + 1) if after is None else None
+    rows = db.execute(build_recruit_recommendation_query(user_id, limit + 1, after, feed)).all()
+    user_exists, has_subscription = rows[0].user_exists, rows[0].has_subscription
+    user_cache.remember(user_id, bool(user_exists))
+    jobs = [row.Employee for row in rows if row.Employee is not None]
+
+    # ✅ 2. 조회 결과로 실패 원인 구분
+    if not user_exists:
+        raise HTTPException(status_code=404, detail="User not found")
+    if not has_subscription: # 만약 활성화된 카테고리가 없다면
+        raise HTTPException(status_code=404, detail="No active category subscriptions")
+    if not jobs and after is None:
         raise HTTPException(status_code=404, detail="No recruitment posts found for user's interests")
 
+    # ✅ 3. limit보다 많이 조회되면 다음 페이지 커서 생성
+    next_cursor = None
+    if len(jobs) > limit:
+        jobs = jobs[:limit]
+        next_cursor = encode_cursor(jobs[-1].start_date, jobs[-1].recruit_id)
+
     # ✅ 4. limit보다 적게 조회된 경우 메시지 추가
     message = None
     if len(jobs) < limit:
@@ -78,14 +132,77 @@ def get_recruit_recommendations(
 
     return {
         "results": jobs,
-        "message": message
+        "message": message,
+        "next_cursor": next_cursor
     }
 
+def build_recruit_recommendation_query(user_id: str, limit: int, after: Optional[tuple] = None,
+                                       feed: Optional[Select] = None):
+    """사용자 확인, 구독 조회, 채용 공고 조회를 하나로 합친 SELECT 문을 생성합니다.
+
+    사용자 존재 여부와 활성 구독 여부는 EXISTS 스칼라 서브쿼리로, 채용 공고는
+    (start_date DESC, recruit_id DESC) 순 LIMIT 서브쿼리로 구하고, 이를 1행짜리 기준 테이블에 LEFT JOIN 합니다.
+    따라서 채용 공고가 없어도 항상 한 행 이상이 반환되어 실패 원인을 구분할 수 있습니다.
+    feed가 주어지면 피드에 지원 가능한 공고가 limit개 이상 남아 있을 때는 피드 공고를, 피드가 없거나
+    마감된 공고가 빠져 limit개보다 적게 남았을 때는 실시간 공고를 반환하도록 둘을 UNION ALL로 합칩니다.
+
+    Args:
+        user_id (str): 채용 공고를 추천받을 사용자 ID.
+        limit (int): 추천할 채용 공고 수.
+        after (tuple): (start_date, recruit_id) 커서. 주어지면 정렬 순서상 그 다음 공고부터 조회합니다.
+        feed (Select): 미리 계산된 피드 조회 SELECT 문 (employee_feed_query).
+
+    Returns:
+        Select: (user_exists, has_subscription, Employee | None) 행을 반환하는 SELECT 문.
+    """
+    active_category_ids = select(UserCategory.category_id).where(
+        UserCategory.user_id == user_id, UserCategory.is_active.is_(True)
+    )
+    matched_job = (
+        select(Employee)
+        .where(
+            Employee.is_open(),
+            exists().where(
+                EmployeeCategory.recruit_id == Employee.recruit_id,
+                EmployeeCategory.category_id.in_(active_category_ids),
+            ),
+            *after_employee_cursor(after),
+        )
+        .order_by(*EMPLOYEE_ORDER)
+        .limit(limit)
+    )
+    if feed is not None:
+        # 상관 없는 스칼라 서브쿼리는 문장마다 한 번만 평가되므로, 피드가 충분하면 실시간 추천을 계산하지 않음
+        feed_count = select(func.count()).select_from(feed.correlate(None).subquery()).scalar_subquery()
+        live_job = matched_job.where(feed_count < limit).subquery("live_job")
+        matched_job = union_all(feed.where(feed_count >= limit), select(live_job))
+    matched_job = matched_job.subquery("matched_job")
+    job = aliased(Employee, matched_job, name="Employee")
+    anchor = select(literal(1).label("anchor")).subquery("anchor")
+
+    return (
+        select(
+            exists().where(Users.user_id == user_id).label("user_exists"),
+            active_category_ids.exists().label("has_subscription"),
+            job,
+        )
+        .select_from(anchor)
+        .outerjoin(matched_job, true())
+        .order_by(job.start_date.desc(), job.recruit_id.desc())
+    )
+
+def after_employee_cursor(after: Optional[tuple]) -> list:
+    """(start_date, recruit_id) 커서 다음 공고만 고르는 조건 목록을 반환합니다 (커서가 없으면 빈 목록)."""
+    if after is None:
+        return []
+    return [tuple_(Employee.start_date, Employee.recruit_id) < tuple_(*after)]
+
 @router.get("/DB_search")
 def search_employees(
     user_id: str = Query(..., description="사용자 ID"),
     keyword: str = Query(..., description="검색할 카테고리 키워드 (예: '정보통신', '디자인')"),
     limit: int = Query(10, ge=1, le=100, description="검색 결과 최대 개수 (기본값: 10, 최대: 100)"),
+    cursor: Optional[str] = Query(None, description="이전 응답의 next_cursor (다음 페이지 조회)"),
     db: Session = db_dependency
 ):
     """
@@ -95,103 +212,100 @@ def search_employees(
         user_id (str): 검색을 수행할 사용자 ID.
         keyword (str): 검색 키워드 (카테고리명).
         limit (int): 반환할 채용 공고 수 (기본값: 10, 최대 100).
+        cursor (str): 이전 응답의 next_cursor. 없으면 첫 페이지를 조회합니다.
         db (Session): 데이터베이스 세션 객체.
 
     Returns:
         dict: 매칭된 카테고리명과 해당 카테고리에 속한 채용 공고 목록.
             - matched_category (str): 검색 키워드와 가장 유사한 카테고리명.
             - results (List[dict]): 채용공고 목록 (제목, 기관, 시작일, 종료일, 상세 URL 포함).
+            - next_cursor (str): 다음 페이지 커서 (마지막 페이지이면 None).
 
     Raises:
+        HTTPException 400: 커서 형식이 올바르지 않은 경우.
         HTTPException 404: 사용자가 존재하지 않는 경우.
         HTTPException 500: Elasticsearch 연결 실패 또는 기타 오류 발생 시.
     """
 
     # ✅ 1. 사용자 존재 여부 확인
-    user = db.query(Users).filter(Users.user_id == user_id).first()
-    if not user:
+    verify_user_for_search(db, user_id)
+
+    # ✅ 2. 키워드와 가장 유사한 카테고리 검색
+    matched_category, category_id = match_category(keyword, catalog_cache.get(db))
+
+    return fetch_jobs_by_category(db, matched_category, category_id, limit, cursor)
+
+@async_router.get("/DB_search")
+async def search_employees_async(
+    user_id: str = Query(..., description="사용자 ID"),
+    keyword: str = Query(..., description="검색할 카테고리 키워드 (예: '정보통신', '디자인')"),
+    limit: int = Query(10, ge=1, le=100, description="검색 결과 최대 개수 (기본값: 10, 최대: 100)"),
+    cursor: Optional[str] = Query(None, description="이전 응답의 next_cursor (다음 페이지 조회)"),
+    db: AsyncSession = async_db_dependency
+):
+    """search_employees의 비동기 버전입니다.
+
+    DB 조회는 AsyncSession.run_sync로, 블로킹 Elasticsearch 호출은 스레드풀에서 실행합니다.
+    """
+    await db.run_sync(verify_user_for_search, user_id)
+    catalog = await db.run_sync(catalog_cache.get)
+    matched_category, category_id = await run_in_threadpool(match_category, keyword, catalog)
+    return await db.run_sync(fetch_jobs_by_category, matched_category, category_id, limit, cursor)
+
+def verify_user_for_search(db: Session, user_id: str):
+    """검색을 요청한 사용자가 존재하는지 확인합니다.
+
+    Raises:
+        HTTPException 404: 사용자가 존재하지 않는 경우.
+    """
+    if not user_cache.exists(db, user_id):
         raise HTTPException(status_code=404, detail="User not found")
 
-    try:
-        # ✅ 2-1. match_phrase_prefix로 후보군 검색 (자동완성 역할)
-        prefix_result = es.search(
-            index="categories",
-            body={
-                "size": 10,
-                "query": {
-                    "bool": {
-                        "must": {
-                            "match_phrase_prefix": {
-                                "category_name": {
-                                    "query": keyword
-                                }
-                            }
-                        },
-                        "filter": {
-                            "term": {
-                                "feature": "employee"
-                            }
-                        }
-                    }
-                }
-            }
-        )
-        prefix_hits = prefix_result.get("hits", {}).get("hits", [])
-        if not prefix_hits:
-            # 후보군 없으면 바로 기타 처리
-            matched_category = "기타"
-            category_id = 0
-        else:
-            candidate_names = [hit["_source"]["category_name"] for hit in prefix_hits]
-
-            # ✅ 2-2. BM25 기반 match 쿼리로 후보군 중 가장 유사한 카테고리 검색
-            bm25_result = es.search(
-                index="categories",
-                body={
-                    "size": 1,
-                    "query": {
-                        "bool": {
-                            "must": {
-                                "match": {
-                                    "category_name": {
-                                        "query": keyword,
-                                        "operator": "and"
-                                    }
-                                }
-                            },
-                            "filter": {
-                                "terms": {
-                                    "category_name.keyword": candidate_names  # 후보군 필터링
-                                }
-                            }
-                        }
-                    }
-                }
-            )
-            bm25_hits = bm25_result.get("hits", {}).get("hits", [])
-            if bm25_hits:
-                matched_source = bm25_hits[0]["_source"]
-                matched_category = matched_source["category_name"]
-                category_id = matched_source["category_id"]
-            else:
-                # BM25가 후보군 중 적합한 것을 못 찾으면 prefix 후보 중 1순위 반환
-                matched_category = prefix_hits[0]["_source"]["category_name"]
-                category_id = prefix_hits[0]["_source"]["category_id"]
+def match_category(keyword: str, catalog: CatalogSnapshot):
+    """설정된 카테고리 매처(Elasticsearch 또는 로컬 역색인)로 키워드와 가장 유사한 채용 카테고리를 찾습니다.
+
+    Args:
+        keyword (str): 검색 키워드 (카테고리명).
+        catalog (CatalogSnapshot): 현재 카탈로그 스냅샷 (로컬 매처가 색인에 사용).
+
+    Returns:
+        tuple: (매칭된 카테고리명, 카테고리 ID). 후보가 없으면 ("기타", 0).
 
+    Raises:
+        HTTPException 500: Elasticsearch 연결 실패 또는 기타 오류 발생 시.
+    """
+    try:
+        # ✅ 2. prefix 후보 검색 + BM25 재정렬로 카테고리 매칭
+        return category_matcher.match(keyword, catalog)
     except ConnectionError as e:
         raise HTTPException(status_code=500, detail="Elasticsearch 연결 실패") from e
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e)) from e
 
-    # ✅ 3. 해당 카테고리에 속한 채용 공고 최신순 조회
+def fetch_jobs_by_category(db: Session, matched_category: str, category_id: int, limit: int,
+                           cursor: Optional[str] = None):
+    """매칭된 카테고리에 속한 지원 가능한 채용 공고를 최신순으로 조회해 응답 형태로 반환합니다.
+
+    커서가 있으면 커서 위치 다음부터 조회하며, 다음 페이지가 있는지 알기 위해 limit보다 하나 더 조회합니다.
+
+    Raises:
+        HTTPException 400: 커서 형식이 올바르지 않은 경우.
+    """
+    after = decode_cursor(cursor, date.fromisoformat, int)
+
+    # ✅ 3. 해당 카테고리에 속한 마감되지 않은 채용 공고 최신순 조회
     jobs = (
         db.query(Employee)
         .join(EmployeeCategory, Employee.recruit_id == EmployeeCategory.recruit_id)
-        .filter(EmployeeCategory.category_id == category_id)
-        .order_by(Employee.start_date.desc())
-        .limit(limit)
+        .filter(EmployeeCategory.category_id == category_id, Employee.is_open(), *after_employee_cursor(after))
+        .order_by(*EMPLOYEE_ORDER)
+        .limit(limit + 1)
         .all()
     )
+    next_cursor = None
+    if len(jobs) > limit:
+        jobs = jobs[:limit]
+        next_cursor = encode_cursor(jobs[-1].start_date, jobs[-1].recruit_id)
 
     # ✅ 4. 결과를 JSON 형태로 정리
     results = [
@@ -208,5 +322,6 @@ def search_employees(
     # ✅ 5. 최종 응답 반환
     return {
         "matched_category": matched_category,
-        "results": results
+        "results": results,
+        "next_cursor": next_cursor
     }
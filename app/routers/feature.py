@@ -4,14 +4,16 @@
 """
 
 from fastapi import APIRouter, Depends, HTTPException, Path
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 
-from app.models.category import Category
-from app.models.feature import Feature
+from app.utils.catalog_cache import catalog_cache
 from app.utils.db_manager import db_manager
 
 router = APIRouter()
+async_router = APIRouter()  # DB_ASYNC_MODE에서 등록되는 비동기 라우터
 db_dependency = Depends(db_manager.get_db)  # 전역 변수로 설정
+async_db_dependency = Depends(db_manager.get_async_db)
 
 @router.get("/{feature_id}")
 def get_categories_by_feature(
@@ -30,11 +32,27 @@ def get_categories_by_feature(
     Raises:
         HTTPException 404: 요청한 기능이 존재하지 않는 경우.
     """
-    existing_feature = db.query(Feature).filter(Feature.feature_type == feature_id).first()
-    if not existing_feature:
+    return fetch_categories_by_feature(db, feature_id)
+
+@async_router.get("/{feature_id}")
+async def get_categories_by_feature_async(
+    feature_id: str = Path(...),
+    db: AsyncSession = async_db_dependency
+):
+    """get_categories_by_feature의 비동기 버전입니다."""
+    return await db.run_sync(fetch_categories_by_feature, feature_id)
+
+def fetch_categories_by_feature(db: Session, feature_id: str):
+    """기능 유형에 해당하는 카테고리 목록 메시지를 생성합니다.
+
+    Raises:
+        HTTPException 404: 요청한 기능이 존재하지 않는 경우.
+    """
+    catalog = catalog_cache.get(db)
+    if feature_id not in catalog.features:
         raise HTTPException(status_code=404, detail=f"Feature not found. ({feature_id})")
 
-    categories = db.query(Category).filter(Category.feature_id == existing_feature.feature_id).all()
+    categories = catalog.categories_of(feature_id)
 
     message = f"**{feature_id}**에서 사용 가능한 카테고리 목록\n\n"
     if categories:
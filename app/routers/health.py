@@ -0,0 +1,54 @@
+"""서버 상태 확인 API 라우터 모듈.
+
+이 모듈은 운영 환경에서 서버와 데이터베이스 커넥션 풀 상태를 확인하기 위한
+API 엔드포인트를 제공합니다. 오케스트레이터는 /live로 프로세스 생존 여부를,
+/ready로 PostgreSQL과 Elasticsearch에 접근 가능한지를 확인합니다.
+"""
+
+from fastapi import APIRouter
+from fastapi.responses import JSONResponse
+
+from app.utils.category_matcher import load_category_matcher_backend
+from app.utils.db_manager import db_manager
+from app.utils.init_elasticsearch_index import es
+from app.utils.readiness import check_database, check_elasticsearch
+
+router = APIRouter()
+
+@router.get("/live")
+def get_liveness():
+    """프로세스가 요청을 처리할 수 있는지 확인하는 liveness 엔드포인트입니다.
+
+    외부 의존성을 확인하지 않으므로 DB 장애 시에도 재시작을 유발하지 않습니다.
+
+    Returns:
+        dict: {"status": "ok"}
+    """
+    return {"status": "ok"}
+
+@router.get("/ready")
+def get_readiness():
+    """PostgreSQL과 Elasticsearch 상태를 점검하는 readiness 엔드포인트입니다.
+
+    CATEGORY_MATCHER=local이면 Elasticsearch를 사용하지 않으므로 점검하지 않습니다.
+
+    Returns:
+        JSONResponse: 모든 의존성이 정상이면 200, 하나라도 실패하면 503과 점검 결과.
+    """
+    checks = {"database": check_database(db_manager.engine)}
+    if load_category_matcher_backend() == "elasticsearch":
+        checks["elasticsearch"] = check_elasticsearch(es)
+    ready = all(check["status"] == "ok" for check in checks.values())
+    return JSONResponse(
+        status_code=200 if ready else 503,
+        content={"status": "ok" if ready else "unavailable", "checks": checks},
+    )
+
+@router.get("/pool")
+def get_pool_status():
+    """데이터베이스 커넥션 풀의 실시간 통계를 조회하는 엔드포인트입니다.
+
+    Returns:
+        dict: 동기/비동기 엔진별 풀 크기, checked-out, overflow, 대기 시간 통계.
+    """
+    return db_manager.pool_status()
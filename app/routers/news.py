@@ -5,23 +5,34 @@
 """
 
 import logging
+from datetime import datetime
+from typing import Optional
 
 from fastapi import APIRouter, Depends, HTTPException, Query
-from sqlalchemy.orm import Session
+from sqlalchemy import Select, and_, exists, func, literal, select, true, tuple_, union_all
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session, aliased
 
-from app.models import Category, News, UserCategory, Users
+from app.models import Category, News, UserCategory, UserFeed, Users
 from app.utils.db_manager import db_manager
+from app.utils.feed_materializer import news_feed_query
+from app.utils.pagination import decode_cursor, encode_cursor
+from app.utils.response_cache import cached_recommendations, cached_recommendations_async
+from app.utils.user_cache import user_cache
 
 logger = logging.getLogger(__name__)
 
 router = APIRouter()
+async_router = APIRouter()  # DB_ASYNC_MODE에서 등록되는 비동기 라우터
 db_dependency = Depends(db_manager.get_db)  # 전역 변수로 설정
+async_db_dependency = Depends(db_manager.get_async_db)
 
 
 @router.get("/recommend")
 def get_news_recommendations(
     user_id: str = Query(..., description="추천을 받을 사용자 ID"),
     limit: int = Query(10, ge=1, le=100, description="추천 받을 뉴스 수 (최대 100개, 기본값: 10)"),
+    cursor: Optional[str] = Query(None, description="카테고리 결과의 next_cursor (해당 카테고리의 다음 페이지 조회)"),
     db: Session = db_dependency
 ):
     """
@@ -30,64 +41,210 @@ def get_news_recommendations(
     Args:
         user_id (str): 뉴스를 추천받을 사용자 ID.
         limit (int): 추천할 뉴스 수.
+        cursor (str): 카테고리 결과의 next_cursor. 주어지면 해당 카테고리의 다음 페이지만 조회합니다.
         db (Session): 데이터베이스 세션 객체.
 
     Returns:
-        List[News]: 사용자의 관심 카테고리에 해당하는 뉴스 목록.
+        dict: 카테고리별 뉴스 목록(results). 각 카테고리 결과에는 다음 페이지 커서(next_cursor)가 포함됩니다.
 
     Raises:
+        HTTPException 400: 커서 형식이 올바르지 않을 경우.
         HTTPException 404: 사용자가 존재하지 않을 경우.
         HTTPException 404: 사용자의 관심 카테고리가 없을 경우.
         HTTPException 404: 추천 가능한 뉴스가 없을 경우.
     """
-    # ✅ 1. 사용자 존재 확인
-    user = db.query(Users).filter(Users.user_id == user_id).first()
-    if not user:
+    return cached_recommendations(db, "news", user_id, limit, fetch_news_recommendations, ordered=True, cursor=cursor)
+
+
+@async_router.get("/recommend")
+async def get_news_recommendations_async(
+    user_id: str = Query(..., description="추천을 받을 사용자 ID"),
+    limit: int = Query(10, ge=1, le=100, description="추천 받을 뉴스 수 (최대 100개, 기본값: 10)"),
+    cursor: Optional[str] = Query(None, description="카테고리 결과의 next_cursor (해당 카테고리의 다음 페이지 조회)"),
+    db: AsyncSession = async_db_dependency
+):
+    """get_news_recommendations의 비동기 버전입니다.
+
+    조회 로직은 동일하며, DB 조회는 AsyncSession.run_sync로, 블로킹 응답 캐시(redis) 호출은 스레드풀에서 실행하여
+    이벤트 루프를 막지 않습니다.
+    """
+    return await cached_recommendations_async(
+        db, "news", user_id, limit, fetch_news_recommendations, ordered=True, cursor=cursor
+    )
+
+
+def fetch_news_recommendations(db: Session, user_id: str, limit: int, cursor: Optional[str] = None):
+    """사용자의 관심 카테고리별 최신 뉴스를 조회합니다.
+
+    동기/비동기 라우터가 공통으로 사용하는 조회 로직입니다. 다음 페이지가 있는지 알기 위해 카테고리마다
+    limit보다 하나 더 조회합니다. 커서는 (category_id, publish_date, news_id)를 담고 있으며, 커서가 있으면
+    해당 카테고리만 커서 위치 다음부터 실시간으로 조회합니다.
+
+    Args:
+        db (Session): 데이터베이스 세션 객체.
+        user_id (str): 뉴스를 추천받을 사용자 ID.
+        limit (int): 카테고리별 추천할 뉴스 수.
+        cursor (str): 카테고리 결과의 next_cursor.
+
+    Returns:
+        dict: 카테고리별 뉴스 목록(results).
+
+    Raises:
+        HTTPException 400: 커서 형식이 올바르지 않을 경우.
+        HTTPException 404: 사용자, 관심 카테고리 또는 (첫 페이지의) 뉴스가 없을 경우.
+    """
+    after = decode_cursor(cursor, int, datetime.fromisoformat, int)
+
+    # ✅ 0. 존재하지 않는 것으로 캐시된 사용자는 DB 조회 없이 거절
+    if user_cache.peek(user_id) is False:
         logger.error(f"사용자가 존재하지 않습니다. ({user_id})")
         raise HTTPException(status_code=404, detail="User not found")
 
-    logger.info(f"사용자 존재 확인: {user}")
+    # ✅ 1. 사용자, 구독, 카테고리별 뉴스를 한 번의 쿼리로 조회
+    #       (첫 페이지는 수집 작업이 미리 계산해 둔 피드가 있으면 피드에서 읽음)
+    feed = news_feed_query(user_id, limit + 1) if after is None else None
+    use_lateral = db.get_bind().dialect.name == "postgresql"
+    rows = db.execute(build_news_recommendation_query(user_id, limit + 1, use_lateral, after, feed)).all()
+    user_cache.remember(user_id, bool(rows[0].user_exists))
 
-    # ✅ 2. 사용자 관심 카테고리 조회 (활성화된 것만)
-    user_categories = (
-        db.query(Category)
-        .join(UserCategory, Category.category_id == UserCategory.category_id)
-        .filter(UserCategory.user_id == user_id, UserCategory.is_active.is_(True))
-        .all()
-    )
+    # ✅ 2. 사용자 존재 확인
+    if not rows[0].user_exists:
+        logger.error(f"사용자가 존재하지 않습니다. ({user_id})")
+        raise HTTPException(status_code=404, detail="User not found")
 
-    category_names = [uc.category_name for uc in user_categories]
+    logger.info(f"사용자 존재 확인: {user_id}")
 
-    if not user_categories:  # 만약 활성화된 카테고리가 없다면
+    # ✅ 3. 사용자 관심 카테고리 확인 (활성화된 것만)
+    if rows[0].subscription_id is None:  # 만약 활성화된 카테고리가 없다면
         logger.error(f"활성화된 카테고리가 없습니다. ({user_id})")
         raise HTTPException(status_code=404, detail="No active category subscriptions")
 
-    logger.info(f"사용자 관심 카테고리 조회: {category_names}")
+    # ✅ 4. 구독별로 뉴스 묶기 (행은 구독 순서, 최신순으로 정렬되어 있음)
+    groups = {}
+    for row in rows:
+        group = groups.setdefault(row.subscription_id, {"category": row.category_name, "news_list": []})
+        if row.News is not None:
+            group["news_list"].append(row.News)
+
+    logger.info(f"사용자 관심 카테고리 조회: {[group['category'] for group in groups.values()]}")
 
-    # ✅ 3. 해당 카테고리의 뉴스 조회
+    results = build_news_results(groups.values(), limit)
+    if not any(group["news_list"] for group in results) and after is None:
+        logger.error(f"사용자 관심 카테고리에 해당하는 뉴스가 없습니다. ({user_id})")
+        raise HTTPException(status_code=404, detail="No news found for user's interests")
+
+    return {
+        "results": results
+    }
+
+
+def build_news_results(groups, limit: int) -> list:
+    """카테고리별 뉴스 묶음을 응답 형식으로 변환합니다.
+
+    뉴스가 limit개보다 많이 조회된 카테고리는 limit개로 자르고 다음 페이지 커서를 붙이며,
+    limit개보다 적은 카테고리에는 안내 메시지를 붙입니다.
+    """
     results = []
-    for category in user_categories:
-        news_list = (
-            db.query(News)
-            .filter(News.category_id == category.category_id)
-            .order_by(News.publish_date.desc())
-            .limit(limit)
-            .all()
-        )
+    for group in groups:
+        news_list = group["news_list"]
+        next_cursor = None
+        if len(news_list) > limit:
+            news_list = news_list[:limit]
+            last = news_list[-1]
+            next_cursor = encode_cursor(last.category_id, last.publish_date, last.news_id)
         message = None
         if len(news_list) < limit:
-            message = f"{category.category_name} 카테고리의 뉴스가 부족하여 {len(news_list)}개만 조회되었습니다."
+            message = f"{group['category']} 카테고리의 뉴스가 부족하여 {len(news_list)}개만 조회되었습니다."
 
         results.append({
-            "category": category.category_name,
+            "category": group["category"],
             "message": message,
-            "news_list": news_list
+            "news_list": news_list,
+            "next_cursor": next_cursor
         })
+    return results
 
-    if not any(group["news_list"] for group in results):
-        logger.error(f"사용자 관심 카테고리에 해당하는 뉴스가 없습니다. ({user_id})")
-        raise HTTPException(status_code=404, detail="No news found for user's interests")
 
-    return {
-        "results": results
-    }
+def build_news_recommendation_query(user_id: str, limit: int, use_lateral: bool = False,
+                                    after: Optional[tuple] = None, feed: Optional[Select] = None):
+    """사용자 확인, 구독 조회, 카테고리별 최신 뉴스 조회를 하나로 합친 SELECT 문을 생성합니다.
+
+    1행짜리 기준 테이블에 활성 구독 카테고리를 LEFT JOIN 하고, 각 카테고리의 최신 뉴스
+    limit개를 (publish_date DESC, news_id DESC) 순으로 다시 LEFT JOIN 합니다. 카테고리별 상위 N개는
+    PostgreSQL에서는 LATERAL 서브쿼리(카테고리마다 인덱스를 limit개만 읽음)로, 그 외 DB에서는
+    ROW_NUMBER() 윈도 함수로 구합니다. 뉴스가 없는 카테고리도 한 행이 반환되므로 부족 메시지를 만들 수 있습니다.
+    feed가 주어지면 피드 뉴스와 "피드가 없을 때만" 조회하는 실시간 뉴스를 UNION ALL로 합칩니다.
+
+    Args:
+        user_id (str): 뉴스를 추천받을 사용자 ID.
+        limit (int): 카테고리별 추천할 뉴스 수.
+        use_lateral (bool): LATERAL JOIN 사용 여부 (PostgreSQL 전용).
+        after (tuple): (category_id, publish_date, news_id) 커서. 주어지면 해당 카테고리만,
+            정렬 순서상 커서 다음 뉴스부터 조회합니다.
+        feed (Select): 미리 계산된 피드 조회 SELECT 문 (news_feed_query).
+
+    Returns:
+        Select: (user_exists, subscription_id, category_name, News | None) 행을 반환하는 SELECT 문.
+    """
+    news_order = (News.publish_date.desc(), News.news_id.desc())
+    subscription_filter = [UserCategory.user_id == user_id, UserCategory.is_active.is_(True)]
+    news_filter = []
+    if after is not None:
+        subscription_filter.append(UserCategory.category_id == after[0])
+        news_filter.append(tuple_(News.publish_date, News.news_id) < tuple_(*after[1:]))
+
+    if feed is not None:
+        # 상관 없는 NOT EXISTS는 문장마다 한 번만 평가되므로, 피드가 있으면 실시간 추천을 계산하지 않음
+        news_filter.append(~feed.correlate(None).exists())
+
+    subscribed = (
+        select(UserCategory.id.label("subscription_id"), Category.category_id, Category.category_name)
+        .join(Category, Category.category_id == UserCategory.category_id)
+        .where(*subscription_filter)
+        .subquery("subscribed")
+    )
+
+    if use_lateral:
+        top_news = (
+            select(News)
+            .where(News.category_id == subscribed.c.category_id, *news_filter)
+            .order_by(*news_order)
+            .limit(limit)
+        )
+        if feed is not None:
+            top_news = union_all(feed.where(News.category_id == subscribed.c.category_id), top_news)
+        top_news = top_news.lateral("top_news")
+        news_condition = true()
+    else:
+        active_category_ids = select(UserCategory.category_id).where(*subscription_filter)
+        top_news = (
+            select(
+                News,
+                func.row_number()
+                .over(partition_by=News.category_id, order_by=news_order)
+                .label("news_rank"),
+            )
+            .where(News.category_id.in_(active_category_ids), *news_filter)
+        )
+        if feed is not None:
+            top_news = union_all(feed.add_columns((UserFeed.item_rank + 1).label("news_rank")), top_news)
+        top_news = top_news.subquery("top_news")
+        news_condition = and_(
+            top_news.c.category_id == subscribed.c.category_id, top_news.c.news_rank <= limit
+        )
+
+    news = aliased(News, top_news, name="News")
+    anchor = select(literal(1).label("anchor")).subquery("anchor")
+
+    return (
+        select(
+            exists().where(Users.user_id == user_id).label("user_exists"),
+            subscribed.c.subscription_id,
+            subscribed.c.category_name,
+            news,
+        )
+        .select_from(anchor)
+        .outerjoin(subscribed, true())
+        .outerjoin(top_news, news_condition)
+        .order_by(subscribed.c.subscription_id, news.publish_date.desc(), news.news_id.desc())
+    )
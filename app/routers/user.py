@@ -7,15 +7,20 @@ from typing import List
 
 from fastapi import APIRouter, Depends, HTTPException, Path, Query
 from pydantic import BaseModel, Field
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 
 from app.models.category import Category
+from app.models.feature import Feature
 from app.models.user_category import UserCategory
+from app.utils.catalog_cache import catalog_cache
 from app.utils.db_manager import db_manager
 from app.utils.verifier import verify_exists_user
 
 router = APIRouter()
+async_router = APIRouter()  # DB_ASYNC_MODE에서 등록되는 비동기 라우터
 db_dependency = Depends(db_manager.get_db)  # 전역 변수로 설정
+async_db_dependency = Depends(db_manager.get_async_db)
 
 class SubscriptionRequest(BaseModel):
     """카테고리 구독 요청을 위한 데이터 모델.
@@ -40,23 +45,36 @@ def add_category(request: SubscriptionRequest, db: Session = db_dependency):
     Raises:
         HTTPException 400: 이미 해당 카테고리를 구독 중인 경우.
     """
-    verify_exists_user(request.user_id, db)
+    return subscribe_category(db, request.user_id, request.category_id)
 
-    category = db.query(Category).filter_by(category_id=request.category_id).first()
-    if not category:
-        raise HTTPException(status_code=404, detail=f"Category {request.category_id} not found.")
+@async_router.post("/subscribe")
+async def add_category_async(request: SubscriptionRequest, db: AsyncSession = async_db_dependency):
+    """add_category의 비동기 버전입니다."""
+    return await db.run_sync(subscribe_category, request.user_id, request.category_id)
+
+def subscribe_category(db: Session, user_id: str, category_id: int):
+    """사용자의 카테고리 구독 정보를 추가합니다.
+
+    Raises:
+        HTTPException 404: 사용자 또는 카테고리가 존재하지 않는 경우.
+        HTTPException 400: 이미 해당 카테고리를 구독 중인 경우.
+    """
+    verify_exists_user(user_id, db)
+
+    if not catalog_cache.get(db).get_category(category_id):
+        raise HTTPException(status_code=404, detail=f"Category {category_id} not found.")
 
     # 중복 체크
     existing_subscription = db.query(UserCategory).filter(
-        UserCategory.user_id == request.user_id,
-        UserCategory.category_id == request.category_id
+        UserCategory.user_id == user_id,
+        UserCategory.category_id == category_id
     ).first()
 
     if existing_subscription:
-        raise HTTPException(status_code=400, detail=f"Category {request.category_id} is already subscribed.")
+        raise HTTPException(status_code=400, detail=f"Category {category_id} is already subscribed.")
 
     # 구독 정보 추가
-    new_subscription = UserCategory(user_id=request.user_id, category_id=request.category_id)
+    new_subscription = UserCategory(user_id=user_id, category_id=category_id)
     db.add(new_subscription)
     db.commit()
     db.refresh(new_subscription)
@@ -86,18 +104,30 @@ def delete_category(
         HTTPException 404: 해당 사용자의 구독 정보가 없는 경우.
         HTTPException 400: 이미 구독이 비활성화된 경우.
     """
+    return unsubscribe_category(db, user_id, category_id)
+
+@async_router.delete("/subscribe")
+async def delete_category_async(
+    user_id: str = Query(..., description="User ID"),
+    category_id: int = Query(..., description="Category ID"),
+    db: AsyncSession = async_db_dependency
+):
+    """delete_category의 비동기 버전입니다."""
+    return await db.run_sync(unsubscribe_category, user_id, category_id)
+
+def unsubscribe_category(db: Session, user_id: str, category_id: int):
+    """사용자의 카테고리 구독을 비활성화(Soft Delete)합니다.
 
+    Raises:
+        HTTPException 404: 사용자, 카테고리 또는 구독 정보가 없는 경우.
+        HTTPException 400: 이미 구독이 비활성화된 경우.
+    """
     # 1️⃣ 사용자가 실제 존재하는지 확인
     verify_exists_user(user_id, db)
 
-    category = db.query(Category).filter_by(category_id=category_id).first()
-    if not category:
-        raise HTTPException(status_code=404, detail=f"Category ID {category_id} not found.")
-
     # 2️⃣ 요청한 카테고리가 실제 존재하는지 확인
-    category_exists = db.query(Category).filter(Category.category_id == category_id).first()
-    if not category_exists:
-        raise HTTPException(status_code=404, detail="Category not found.")
+    if not catalog_cache.get(db).get_category(category_id):
+        raise HTTPException(status_code=404, detail=f"Category ID {category_id} not found.")
 
     # 3️⃣ 기존 구독이 있는지 확인
     existing_subscription = db.query(UserCategory).filter(
@@ -143,21 +173,38 @@ def get_user_categories(
     Returns:
         List[CategoryResponse]: 구독 중인 카테고리 목록
     """
+    return fetch_user_categories(db, user_id)
+
+@async_router.get("/{user_id}", response_model=List[CategoryResponse])
+async def get_user_categories_async(
+    user_id: str = Path(...),
+    db: AsyncSession = async_db_dependency
+):
+    """get_user_categories의 비동기 버전입니다."""
+    return await db.run_sync(fetch_user_categories, user_id)
+
+def fetch_user_categories(db: Session, user_id: str):
+    """사용자가 구독 중인 카테고리 목록을 조회합니다.
+
+    Raises:
+        HTTPException 404: 사용자가 존재하지 않는 경우.
+    """
     # 사용자 존재 여부 확인
     verify_exists_user(user_id, db)
 
-    # 해당 사용자의 활성화된 구독 목록 조회
-    subscriptions = (
-        db.query(UserCategory)
+    # 해당 사용자의 활성화된 구독의 기능 유형과 카테고리명을 한 번의 조인 쿼리로 조회
+    # (구독마다 category/feature를 지연 로딩하던 N+1 쿼리 방지)
+    rows = (
+        db.query(Feature.feature_type, Category.category_name)
+        .select_from(UserCategory)
+        .join(Category, UserCategory.category_id == Category.category_id)
+        .join(Feature, Category.feature_id == Feature.feature_id)
         .filter(UserCategory.user_id == user_id, UserCategory.is_active)
+        .order_by(UserCategory.id)
         .all()
     )
 
-    # UserCategory 인스턴스의 category 필드를 통해 카테고리 정보 접근
     return [
-        CategoryResponse(
-            feature_name=sub.category.feature.feature_type,
-            category_name=sub.category.category_name
-        )
-        for sub in subscriptions if sub.category is not None and sub.category.feature is not None
+        CategoryResponse(feature_name=row.feature_type, category_name=row.category_name)
+        for row in rows
     ]
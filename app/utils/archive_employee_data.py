@@ -0,0 +1,122 @@
+"""마감된 채용 공고 보관(archive) 명령 모듈.
+
+추천·검색 쿼리는 지원 가능한 공고(Employee.is_open(), 마감일 >= 오늘)만 조회합니다.
+이 명령은 마감일이 지난 공고를 employee / employee_category / employee_hire_type 테이블에서
+employee_archive / employee_category_archive / employee_hire_type_archive 테이블로 옮겨,
+employee 테이블에는 지원 가능한 공고만 남깁니다. 따라서 추천 쿼리 비용은 누적된 전체 이력이 아니라
+현재 지원 가능한 공고 수에 비례합니다.
+
+공고는 ARCHIVE_BATCH_SIZE건씩 복사 → 삭제 → 커밋하므로 중간에 실패해도 다시 실행하면 이어서 진행되며,
+공고가 하나라도 옮겨지면 해당 카테고리를 구독 중인 사용자의 추천 피드를 다시 계산합니다.
+매일 자정 이후 한 번 실행합니다.
+
+실행 예시:
+    python -m app.utils.archive_employee_data
+    python -m app.utils.archive_employee_data --today 2025-06-01
+"""
+
+import argparse
+from datetime import date
+from typing import Optional
+
+from sqlalchemy import delete, insert, select
+from sqlalchemy.orm import Session
+
+from app.models import (
+    Employee,
+    EmployeeArchive,
+    EmployeeCategory,
+    EmployeeCategoryArchive,
+    EmployeeHireType,
+    EmployeeHireTypeArchive,
+)
+from app.utils.db_manager import db_manager
+from app.utils.feed_materializer import EMPLOYEE_FEED, refresh_feeds
+
+ARCHIVE_BATCH_SIZE = 1000  # 한 트랜잭션에서 옮기는 공고 수
+
+# (원본 모델, 보관 모델, 옮길 컬럼) — 자식 테이블을 먼저 복사하고 삭제
+_ARCHIVE_TABLES = (
+    (EmployeeCategory, EmployeeCategoryArchive, ("recruit_id", "category_id")),
+    (EmployeeHireType, EmployeeHireTypeArchive, ("recruit_id", "hire_type_id")),
+    (Employee, EmployeeArchive, ("recruit_id", "title", "institution", "start_date", "end_date", "recrut_se",
+                                 "detail_url", "recrut_pblnt_sn", "created_at")),
+)
+
+
+def archive_expired_postings(db: Session, today: Optional[date] = None,
+                             batch_size: int = ARCHIVE_BATCH_SIZE) -> dict:
+    """마감일이 today 이전인 채용 공고와 연결 정보를 보관 테이블로 옮깁니다.
+
+    이미 보관된 공고가 다시 수집되어 마감된 경우에는 보관 테이블의 행을 새 값으로 교체합니다.
+
+    Args:
+        db (Session): 데이터베이스 세션 객체.
+        today (date): 기준일. 마감일이 이 날짜보다 이전인 공고를 옮깁니다 (기본값: 오늘).
+        batch_size (int): 한 트랜잭션에서 옮길 공고 수.
+
+    Returns:
+        dict: archived(옮긴 공고 수), batches(커밋 횟수), feeds(피드를 다시 계산한 사용자 수).
+
+    Raises:
+        SQLAlchemyError: 저장 중 DB 오류 발생 시 (진행 중인 배치는 롤백됨).
+    """
+    today = today or date.today()
+    totals = {"archived": 0, "batches": 0, "feeds": 0}
+    category_ids = set()
+
+    while True:
+        recruit_ids = db.scalars(
+            select(Employee.recruit_id)
+            .where(~Employee.is_open(today))
+            .order_by(Employee.recruit_id)
+            .limit(batch_size)
+        ).all()
+        if not recruit_ids:
+            break
+
+        try:
+            category_ids.update(db.scalars(
+                select(EmployeeCategory.category_id).where(EmployeeCategory.recruit_id.in_(recruit_ids)).distinct()
+            ))
+            for source, archive, columns in _ARCHIVE_TABLES:
+                db.execute(delete(archive).where(archive.recruit_id.in_(recruit_ids)))
+                db.execute(
+                    insert(archive).from_select(
+                        columns,
+                        select(*(getattr(source, column) for column in columns))
+                        .where(source.recruit_id.in_(recruit_ids)),
+                    )
+                )
+                db.execute(delete(source).where(source.recruit_id.in_(recruit_ids)))
+            db.commit()
+        except Exception:
+            db.rollback()
+            raise
+
+        totals["archived"] += len(recruit_ids)
+        totals["batches"] += 1
+
+    if totals["archived"]:
+        totals["feeds"] = refresh_feeds(db, EMPLOYEE_FEED, category_ids)
+    print(f"✅ {today} 이전 마감 공고 보관: {totals['archived']}건 ({totals['batches']}회 커밋), "
+          f"피드 갱신 {totals['feeds']}명")
+    return totals
+
+
+def main():
+    parser = argparse.ArgumentParser(description="마감된 채용 공고를 보관 테이블로 이동")
+    parser.add_argument("--today", type=date.fromisoformat, default=None,
+                        help="기준일 (YYYY-MM-DD, 이 날짜 이전에 마감된 공고를 이동, 기본값: 오늘)")
+    parser.add_argument("--batch-size", type=int, default=ARCHIVE_BATCH_SIZE, help="한 트랜잭션에서 옮길 공고 수")
+    args = parser.parse_args()
+
+    db = next(db_manager.get_db())
+    try:
+        archive_expired_postings(db, args.today, args.batch_size)
+    finally:
+        db.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,164 @@
+"""채용 공고 백필 명령 모듈.
+
+지정한 기간을 공고 시작일 하루 단위(shard)로 나누어 채용 공고 API를 페이지 단위로 조회하고,
+조회가 끝난 날짜부터 순서대로 배치 upsert(upsert_recruit_jobs)로 저장합니다.
+날짜별 조회는 스레드풀에서 제한된 동시성으로 실행되며, 실패한 요청은 지수 백오프로 재시도합니다.
+API의 pbancBgngYmd 조건은 해당 날짜 "이후" 공고까지 돌려주므로, 각 날짜는 공고 시작일이 그 날짜를
+넘는 공고가 나온 페이지에서 조회를 멈추고(응답이 공고 시작일 오름차순일 때) 공고 시작일이 그 날짜인
+공고만 저장합니다. 따라서 긴 기간을 백필해도 날짜마다 이후 기간 전체를 다시 조회하지 않고,
+날짜끼리 같은 공고를 중복 저장하지 않습니다.
+
+저장이 끝난 날짜는 recruit_backfill_checkpoint 테이블에 같은 트랜잭션으로 기록되므로,
+중단된 백필을 다시 실행하면 완료된 날짜를 건너뛰고 이어서 진행합니다.
+
+실행 예시:
+    python -m app.utils.backfill_employee_data --start 2023-01-01 --end 2023-12-31 --workers 4
+"""
+
+import argparse
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from datetime import date, datetime, timedelta
+
+import requests
+from requests.adapters import HTTPAdapter
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+
+from app.models.recruit_backfill_checkpoint import RecruitBackfillCheckpoint
+from app.utils.db_manager import db_manager
+from app.utils.feed_materializer import EMPLOYEE_FEED, refresh_feeds
+from app.utils.insert_employee_data import NUM_OF_ROWS, fetch_recruit_jobs, job_start_ymd, upsert_recruit_jobs
+from app.utils.readiness import retry_with_backoff
+
+SHARD_DEADLINE = 120.0  # 날짜 하나를 조회하는 데 재시도를 포함해 허용하는 시간(초)
+
+
+def date_shards(start: date, end: date) -> list:
+    """start부터 end까지(포함) 하루 단위 날짜 목록을 반환합니다."""
+    return [start + timedelta(days=offset) for offset in range((end - start).days + 1)]
+
+
+def pending_shards(db: Session, start: date, end: date) -> list:
+    """기간 중 체크포인트가 없는(아직 완료되지 않은) 날짜 목록을 반환합니다."""
+    completed = set(db.scalars(
+        select(RecruitBackfillCheckpoint.shard_date).where(RecruitBackfillCheckpoint.shard_date.between(start, end))
+    ))
+    return [shard for shard in date_shards(start, end) if shard not in completed]
+
+
+def fetch_shard(session: requests.Session, shard: date, num_of_rows: int = NUM_OF_ROWS,
+                deadline: float = SHARD_DEADLINE) -> list:
+    """하루치 채용 공고를 페이지 단위로 조회하고, 실패 시 deadline 안에서 재시도합니다.
+
+    API가 shard 이후 날짜의 공고를 함께 돌려주므로 shard보다 늦은 공고가 나오면 페이지 조회를 멈추고,
+    공고 시작일(pbancBgngYmd)이 shard인 공고만 반환하여 날짜 구간끼리 겹치지 않습니다.
+
+    Raises:
+        TimeoutError: deadline 안에 조회하지 못한 경우.
+        RuntimeError: MAX_PAGES 페이지를 조회해도 끝나지 않은 경우 (재시도하지 않음).
+    """
+    def on_retry(attempt, error, delay):
+        print(f"⚠️ {shard} 조회 실패 ({attempt}회): {error} → {delay:.1f}초 후 재시도")
+
+    day = shard.strftime('%Y%m%d')
+    jobs = retry_with_backoff(
+        lambda: fetch_recruit_jobs(shard.strftime('%Y-%m-%d'), num_of_rows, session.get, until=day),
+        retry_on=(requests.RequestException, ValueError),
+        deadline=deadline,
+        on_retry=on_retry,
+    )
+    return [job for job in jobs if job_start_ymd(job) == day]
+
+
+def backfill_recruit_jobs(db: Session, start: date, end: date, workers: int = 4, num_of_rows: int = NUM_OF_ROWS,
+                          deadline: float = SHARD_DEADLINE, session: requests.Session = None) -> dict:
+    """기간 내 완료되지 않은 날짜의 채용 공고를 병렬로 조회하여 저장합니다.
+
+    동시에 조회 중이거나 저장을 기다리는 날짜는 workers * 2개로 제한하여 메모리 사용량을 일정하게
+    유지합니다. 재시도 후에도 조회에 실패했거나 페이지 상한(MAX_PAGES)에 걸려 일부만 조회된 날짜는
+    체크포인트를 남기지 않으므로 다음 실행에서 다시 시도합니다.
+
+    Args:
+        db (Session): 데이터베이스 세션 객체.
+        start (date): 백필 시작일 (공고 시작일 기준, 포함).
+        end (date): 백필 종료일 (포함).
+        workers (int): 동시에 조회할 최대 날짜 수.
+        num_of_rows (int): 페이지당 조회 건수.
+        deadline (float): 날짜 하나의 조회에 허용하는 시간(초).
+        session (requests.Session): 사용할 HTTP 세션. 없으면 새로 생성합니다.
+
+    Returns:
+        dict: shards(완료한 날짜 수), fetched, inserted, updated, skipped, failed(실패한 날짜 목록).
+    """
+    shards = iter(pending_shards(db, start, end))
+    totals = {"shards": 0, "fetched": 0, "inserted": 0, "updated": 0, "skipped": 0, "failed": []}
+    owns_session = session is None
+    if owns_session:
+        session = requests.Session()
+        session.mount("http://", HTTPAdapter(pool_connections=1, pool_maxsize=workers))
+        session.mount("https://", HTTPAdapter(pool_connections=1, pool_maxsize=workers))
+
+    try:
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            in_flight = {}
+
+            def submit_next():
+                shard = next(shards, None)
+                if shard is not None:
+                    in_flight[executor.submit(fetch_shard, session, shard, num_of_rows, deadline)] = shard
+
+            for _ in range(workers * 2):
+                submit_next()
+
+            while in_flight:
+                done, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+                for future in done:
+                    shard = in_flight.pop(future)
+                    submit_next()
+                    try:
+                        jobs = future.result()
+                    except (TimeoutError, RuntimeError) as e:
+                        print(f"❗ {shard} 백필 실패: {e.__cause__ or e}")
+                        totals["failed"].append(shard)
+                        continue
+
+                    # 체크포인트는 upsert_recruit_jobs의 커밋에 함께 포함되어 데이터와 원자적으로 기록됨
+                    db.add(RecruitBackfillCheckpoint(shard_date=shard, fetched=len(jobs)))
+                    stats = upsert_recruit_jobs(db, jobs)
+                    totals["shards"] += 1
+                    totals["fetched"] += len(jobs)
+                    for key in ("inserted", "updated", "skipped"):
+                        totals[key] += stats[key]
+    finally:
+        if owns_session:
+            session.close()
+
+    totals["failed"].sort()
+    if totals["inserted"] + totals["updated"]:
+        refresh_feeds(db, EMPLOYEE_FEED)
+    print(f"✅ {start}~{end} 백필: {totals['shards']}일 완료, 조회 {totals['fetched']}건 "
+          f"(신규 {totals['inserted']}건, 갱신 {totals['updated']}건, 건너뜀 {totals['skipped']}건), "
+          f"실패 {len(totals['failed'])}일")
+    return totals
+
+
+def main():
+    parser = argparse.ArgumentParser(description="채용 공고 기간 백필 (중단 시 이어서 실행 가능)")
+    parser.add_argument("--start", required=True, type=date.fromisoformat, help="시작일 (YYYY-MM-DD)")
+    parser.add_argument("--end", type=date.fromisoformat, default=datetime.today().date(),
+                        help="종료일 (YYYY-MM-DD, 기본값: 오늘)")
+    parser.add_argument("--workers", type=int, default=4, help="동시에 조회할 최대 날짜 수")
+    parser.add_argument("--rows", type=int, default=NUM_OF_ROWS, help="페이지당 조회 건수 (numOfRows)")
+    args = parser.parse_args()
+
+    db = next(db_manager.get_db())
+    try:
+        result = backfill_recruit_jobs(db, args.start, args.end, workers=args.workers, num_of_rows=args.rows)
+    finally:
+        db.close()
+    if result["failed"]:
+        raise SystemExit(1)
+
+
+if __name__ == "__main__":
+    main()
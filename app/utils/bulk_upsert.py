@@ -0,0 +1,30 @@
+"""배치 INSERT ... ON CONFLICT 공통 모듈.
+
+뉴스, 채용 공고 등 외부 데이터를 일괄 저장하는 작업에서 사용하는 도우미 함수를 제공합니다.
+PostgreSQL과 SQLite(테스트)는 모두 INSERT ... ON CONFLICT를 지원하므로, 세션이 연결된
+DB 종류에 맞는 insert 구문을 선택합니다.
+"""
+
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.orm import Session
+
+
+def dialect_insert(db: Session, model):
+    """db가 연결된 DB 종류에 맞는, on_conflict_* 를 지원하는 insert 구문을 생성합니다.
+
+    Args:
+        db (Session): 데이터베이스 세션 객체.
+        model: INSERT 대상 모델 클래스.
+
+    Returns:
+        Insert: postgresql.insert(model) 또는 sqlite.insert(model).
+    """
+    if db.get_bind().dialect.name == "postgresql":
+        return postgresql.insert(model)
+    return sqlite.insert(model)
+
+
+def batched(rows: list, size: int):
+    """rows를 size개씩 잘라 순서대로 반환합니다."""
+    for offset in range(0, len(rows), size):
+        yield rows[offset:offset + size]
@@ -0,0 +1,166 @@
+"""카테고리/기능 카탈로그 캐시 모듈.
+
+Category와 Feature 테이블은 크기가 작고 기본 데이터 삽입 이후 거의 바뀌지 않으므로,
+요청마다 조회하지 않고 프로세스 메모리에 불변 스냅샷으로 보관합니다.
+
+스냅샷은 처음 사용할 때 읽어 오며(read-through), TTL이 지나거나 invalidate()가 호출되면
+다음 조회 시 다시 읽어 옵니다. ORM 세션에서 Category/Feature를 추가·수정·삭제하고
+커밋하면 자동으로 무효화되며, ORM을 거치지 않고 테이블을 변경했다면 invalidate()를
+직접 호출해야 합니다.
+"""
+
+import os
+import threading
+import time
+from dataclasses import dataclass, field
+from types import MappingProxyType
+from typing import Mapping, Optional, Tuple
+
+from sqlalchemy.orm import Session
+
+from app.models.category import Category
+from app.models.feature import Feature
+from app.utils.change_tracker import flushed_objects, track_changes
+
+_CATALOG_MODELS = (Category, Feature)
+
+
+@dataclass(frozen=True)
+class CatalogCategory:
+    """스냅샷에 보관되는 카테고리 정보."""
+
+    category_id: int
+    feature_id: int
+    feature_type: Optional[str]
+    category_name: str
+
+
+@dataclass(frozen=True)
+class CatalogSnapshot:
+    """특정 시점의 Category/Feature 테이블 전체를 담은 불변 스냅샷.
+
+    Attributes:
+        version (int): 스냅샷을 읽어 올 때마다 1씩 증가하는 버전.
+        loaded_at (float): 스냅샷을 읽어 온 시각 (time.monotonic 기준).
+        features (Mapping[str, int]): 기능 유형 → feature_id.
+        categories (Mapping[int, CatalogCategory]): category_id → 카테고리 정보 (category_id 순).
+    """
+
+    version: int
+    loaded_at: float
+    features: Mapping[str, int] = field(default_factory=dict)
+    categories: Mapping[int, CatalogCategory] = field(default_factory=dict)
+
+    def get_category(self, category_id: int) -> Optional[CatalogCategory]:
+        """category_id에 해당하는 카테고리를 반환합니다. 없으면 None을 반환합니다."""
+        return self.categories.get(category_id)
+
+    def categories_of(self, feature_type: str) -> Tuple[CatalogCategory, ...]:
+        """기능 유형에 속한 카테고리를 category_id 순으로 반환합니다."""
+        return tuple(
+            category for category in self.categories.values() if category.feature_type == feature_type
+        )
+
+
+def load_catalog_ttl() -> float:
+    """환경 변수에서 카탈로그 캐시 TTL(초)을 읽어옵니다.
+
+    환경 변수:
+        CATALOG_CACHE_TTL (float): 스냅샷 유지 시간(초), 0이면 매 요청마다 다시 읽음 (기본값: 300).
+    """
+    return float(os.getenv("CATALOG_CACHE_TTL") or 300)
+
+
+class CatalogCache:
+    """Category/Feature 스냅샷을 읽어 오고 TTL과 무효화에 따라 갱신하는 캐시 클래스.
+
+    Attributes:
+        ttl (float): 스냅샷 유지 시간(초).
+    """
+
+    def __init__(self, ttl: Optional[float] = None, clock=time.monotonic):
+        self.ttl = load_catalog_ttl() if ttl is None else ttl
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._snapshot: Optional[CatalogSnapshot] = None
+        self._version = 0
+
+    def _is_fresh(self, snapshot: Optional[CatalogSnapshot]) -> bool:
+        return snapshot is not None and self._clock() - snapshot.loaded_at < self.ttl
+
+    def get(self, db: Session) -> CatalogSnapshot:
+        """유효한 스냅샷을 반환하고, 없거나 만료되었으면 db에서 다시 읽어 옵니다.
+
+        Args:
+            db (Session): 스냅샷을 새로 읽어 올 때 사용할 데이터베이스 세션.
+
+        Returns:
+            CatalogSnapshot: 현재 카탈로그 스냅샷.
+        """
+        snapshot = self._snapshot
+        if self._is_fresh(snapshot):
+            return snapshot
+
+        with self._lock:
+            snapshot = self._snapshot
+            if self._is_fresh(snapshot):
+                return snapshot
+            snapshot = self._load(db)
+            self._snapshot = snapshot
+            return snapshot
+
+    def _load(self, db: Session) -> CatalogSnapshot:
+        feature_rows = db.query(Feature.feature_id, Feature.feature_type).all()
+        feature_types = {row.feature_id: row.feature_type for row in feature_rows}
+        category_rows = (
+            db.query(Category.category_id, Category.feature_id, Category.category_name)
+            .order_by(Category.category_id)
+            .all()
+        )
+
+        self._version += 1
+        return CatalogSnapshot(
+            version=self._version,
+            loaded_at=self._clock(),
+            features=MappingProxyType({row.feature_type: row.feature_id for row in feature_rows}),
+            categories=MappingProxyType({
+                row.category_id: CatalogCategory(
+                    category_id=row.category_id,
+                    feature_id=row.feature_id,
+                    feature_type=feature_types.get(row.feature_id),
+                    category_name=row.category_name,
+                )
+                for row in category_rows
+            }),
+        )
+
+    def invalidate(self):
+        """현재 스냅샷을 버려 다음 조회 시 DB에서 다시 읽어 오도록 합니다."""
+        with self._lock:
+            self._snapshot = None
+
+    @property
+    def version(self) -> int:
+        """마지막으로 읽어 온 스냅샷의 버전을 반환합니다. 아직 읽지 않았으면 0입니다."""
+        return self._version
+
+
+catalog_cache = CatalogCache()
+
+
+def _catalog_flushed(session):
+    """flush 대상의 Category/Feature 변경을 모델 클래스로 기록합니다."""
+    return {type(obj) for obj in flushed_objects(session) if isinstance(obj, _CATALOG_MODELS)}
+
+
+def _catalog_bulk_written(model):
+    """query().update()/delete() 등 Category/Feature에 대한 일괄 변경을 모델 클래스로 기록합니다."""
+    return {model} if model in _CATALOG_MODELS else ()
+
+
+def _invalidate_catalog(changes):
+    """Category/Feature 변경이 커밋되면 카탈로그 캐시를 무효화합니다."""
+    catalog_cache.invalidate()
+
+
+track_changes("catalog_changed", _catalog_flushed, _catalog_bulk_written, _invalidate_catalog)
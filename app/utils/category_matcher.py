@@ -0,0 +1,275 @@
+"""검색 키워드와 가장 유사한 채용 카테고리를 찾는 매처 모듈.
+
+/employee/DB_search는 키워드를 채용 카테고리 하나로 매칭한 뒤 해당 카테고리의 공고를 조회합니다.
+매칭 방식은 CATEGORY_MATCHER 환경 변수로 선택합니다.
+
+- elasticsearch: Elasticsearch 'categories' 별칭에 prefix 후보 검색 + BM25 재정렬 요청을 보냅니다.
+- local: 카탈로그 캐시(Category 테이블 스냅샷)로 프로세스 안에 edge n-gram 역색인을 만들고,
+  Elasticsearch와 같은 분석기·질의 규칙(match_phrase_prefix 후보 → BM25 match(and) 재정렬)을
+  흉내 내어 매칭합니다. 네트워크 왕복 없이 수 마이크로초 안에 끝나며 Elasticsearch가 필요 없습니다.
+"""
+
+import math
+import os
+import re
+import threading
+from abc import ABC, abstractmethod
+from collections import Counter, defaultdict
+from typing import Optional, Tuple
+
+from app.utils.catalog_cache import CatalogSnapshot
+
+CATEGORY_CANDIDATES = 10  # prefix 검색 후보 중 BM25로 다시 정렬할 상위 후보 수
+BM25_RESCORE_WEIGHT = 1000  # BM25에 매칭된 후보가 prefix 점수와 관계없이 앞서도록 하는 가중치
+NO_MATCH = ("기타", 0)
+
+# Elasticsearch 'categories' 인덱스의 autocomplete 분석기(edge_ngram 2~10, letter/digit)와
+# 검색 시 사용하는 standard 분석기를 흉내 내기 위한 설정
+MIN_GRAM = 2
+MAX_GRAM = 10
+_INDEX_TOKEN = re.compile(r"[^\W_]+")
+_SEARCH_TOKEN = re.compile(r"\w+")
+BM25_K1 = 1.2
+BM25_B = 0.75
+
+
+def load_category_matcher_backend() -> str:
+    """환경 변수에서 카테고리 매처 종류를 읽어옵니다.
+
+    환경 변수:
+        CATEGORY_MATCHER (str): elasticsearch 또는 local (기본값: elasticsearch).
+    """
+    return (os.getenv("CATEGORY_MATCHER") or "elasticsearch").lower()
+
+
+def build_category_search_body(keyword: str) -> dict:
+    """키워드와 가장 유사한 채용 카테고리 하나를 찾는 Elasticsearch 검색 요청 본문을 생성합니다.
+
+    한 번의 요청으로 두 단계 검색을 수행합니다.
+    1. match_phrase_prefix로 채용 카테고리 후보를 점수순으로 찾습니다 (자동완성 역할).
+    2. 상위 CATEGORY_CANDIDATES개 후보를 BM25 match(operator=and) 점수로 다시 정렬합니다 (rescore).
+       BM25에 매칭된 후보는 BM25_RESCORE_WEIGHT배 가중치로 항상 매칭되지 않은 후보보다 앞서고,
+       매칭된 후보가 없으면 prefix 점수 1순위가 그대로 남습니다.
+
+    Args:
+        keyword (str): 검색 키워드 (카테고리명).
+
+    Returns:
+        dict: es.search에 전달할 요청 본문.
+    """
+    return {
+        "size": 1,
+        "query": {
+            "bool": {
+                "must": {
+                    "match_phrase_prefix": {
+                        "category_name": {
+                            "query": keyword
+                        }
+                    }
+                },
+                "filter": {
+                    "term": {
+                        "feature": "employee"
+                    }
+                }
+            }
+        },
+        "rescore": {
+            "window_size": CATEGORY_CANDIDATES,
+            "query": {
+                "rescore_query": {
+                    "match": {
+                        "category_name": {
+                            "query": keyword,
+                            "operator": "and"
+                        }
+                    }
+                },
+                "query_weight": 1,
+                "rescore_query_weight": BM25_RESCORE_WEIGHT,
+                "score_mode": "total"
+            }
+        }
+    }
+
+
+class CategoryMatcher(ABC):
+    """키워드를 채용 카테고리 하나로 매칭하는 매처의 추상 기본 클래스."""
+
+    @abstractmethod
+    def match(self, keyword: str, catalog: CatalogSnapshot) -> Tuple[str, int]:
+        """키워드와 가장 유사한 채용 카테고리를 찾습니다.
+
+        Args:
+            keyword (str): 검색 키워드 (카테고리명).
+            catalog (CatalogSnapshot): 현재 카탈로그 스냅샷 (local 매처가 색인에 사용).
+
+        Returns:
+            tuple: (매칭된 카테고리명, 카테고리 ID). 후보가 없으면 ("기타", 0).
+        """
+
+
+class ElasticsearchCategoryMatcher(CategoryMatcher):
+    """Elasticsearch 'categories' 별칭에 검색 요청을 보내는 매처.
+
+    Attributes:
+        client (Elasticsearch): 검색에 사용할 클라이언트.
+    """
+
+    def __init__(self, client, index: str = "categories"):
+        self.client = client
+        self.index = index
+
+    def match(self, keyword: str, catalog: CatalogSnapshot = None) -> Tuple[str, int]:
+        result = self.client.search(index=self.index, body=build_category_search_body(keyword))
+        hits = result.get("hits", {}).get("hits", [])
+        if not hits:
+            return NO_MATCH
+        return hits[0]["_source"]["category_name"], hits[0]["_source"]["category_id"]
+
+
+class _LocalIndex:
+    """채용 카테고리 이름의 edge n-gram 역색인과 BM25 통계."""
+
+    def __init__(self, categories):
+        self.names = {}
+        self.positions = {}  # category_id -> 위치 순서의 n-gram 목록
+        self.term_counts = {}  # category_id -> n-gram별 빈도
+        self.prefix_docs = defaultdict(set)  # n-gram의 접두어(1~MAX_GRAM자) -> category_id
+        self.term_docs = defaultdict(set)  # n-gram -> category_id
+
+        for category in categories:
+            grams = [
+                word[:size]
+                for word in _INDEX_TOKEN.findall(category.category_name.lower())
+                for size in range(MIN_GRAM, min(len(word), MAX_GRAM) + 1)
+            ]
+            self.names[category.category_id] = category.category_name
+            self.positions[category.category_id] = grams
+            self.term_counts[category.category_id] = Counter(grams)
+            for gram in grams:
+                self.term_docs[gram].add(category.category_id)
+                for size in range(1, len(gram) + 1):
+                    self.prefix_docs[gram[:size]].add(category.category_id)
+
+        lengths = [len(grams) for grams in self.positions.values()]
+        self.avg_length = sum(lengths) / len(lengths) if lengths else 0.0
+        self.doc_count = len(lengths)
+
+    def idf(self, term: str) -> float:
+        matched = len(self.term_docs.get(term, ()))
+        return math.log(1 + (self.doc_count - matched + 0.5) / (matched + 0.5))
+
+    def bm25(self, category_id: int, term: str, freq: int = None) -> float:
+        """category_id 문서에서 term의 BM25 점수를 계산합니다. freq가 없으면 term의 빈도를 사용합니다."""
+        freq = self.term_counts[category_id][term] if freq is None else freq
+        if not freq:
+            return 0.0
+        length = len(self.positions[category_id])
+        norm = BM25_K1 * (1 - BM25_B + BM25_B * length / self.avg_length)
+        return self.idf(term) * freq * (BM25_K1 + 1) / (freq + norm)
+
+    def phrase_prefix_score(self, category_id: int, tokens: list) -> float:
+        """match_phrase_prefix처럼 tokens가 연속된 위치에 있고 마지막 토큰이 접두어로 일치하면 점수를 반환합니다.
+
+        일치하는 위치가 없으면 0을 반환합니다.
+        """
+        grams = self.positions[category_id]
+        *exact, prefix = tokens
+        matches = []
+        for start in range(len(grams) - len(tokens) + 1):
+            window = grams[start:start + len(tokens)]
+            if window[:-1] == exact and window[-1].startswith(prefix):
+                matches.append(window[-1])
+        if not matches:
+            return 0.0
+        idf = sum(self.idf(term) for term in exact) + max(self.idf(term) for term in matches)
+        length = len(grams)
+        norm = BM25_K1 * (1 - BM25_B + BM25_B * length / self.avg_length)
+        return idf * len(matches) * (BM25_K1 + 1) / (len(matches) + norm)
+
+    def match_and_score(self, category_id: int, tokens: list) -> float:
+        """match(operator=and)처럼 모든 토큰이 n-gram으로 있으면 BM25 점수 합을, 아니면 0을 반환합니다."""
+        if any(token not in self.term_counts[category_id] for token in tokens):
+            return 0.0
+        return sum(self.bm25(category_id, token) for token in tokens)
+
+
+class LocalCategoryMatcher(CategoryMatcher):
+    """카탈로그 스냅샷으로 만든 프로세스 내 역색인에서 채용 카테고리를 찾는 매처.
+
+    Elasticsearch 검색(build_category_search_body)과 같은 순서로 동작합니다.
+    1. 마지막 토큰을 접두어로 하는 n-gram 역색인에서 후보를 찾고, 토큰이 연속된 위치에 있는지
+       확인하여 prefix 점수순 상위 CATEGORY_CANDIDATES개를 고릅니다.
+    2. 모든 토큰이 n-gram으로 존재하는 후보에 BM25 점수 × BM25_RESCORE_WEIGHT를 더해 다시 정렬합니다.
+    점수가 같으면 category_id가 작은 카테고리를 선택합니다.
+
+    카탈로그 스냅샷 버전이 바뀌면 다음 매칭 시 역색인을 다시 만듭니다.
+
+    Attributes:
+        feature_type (str): 매칭 대상 카테고리의 기능 유형.
+    """
+
+    def __init__(self, feature_type: str = "employee"):
+        self.feature_type = feature_type
+        self._lock = threading.Lock()
+        self._index: Optional[_LocalIndex] = None
+        self._version: Optional[int] = None
+
+    def _get_index(self, catalog: CatalogSnapshot) -> _LocalIndex:
+        index = self._index
+        if index is not None and self._version == catalog.version:
+            return index
+        with self._lock:
+            if self._index is None or self._version != catalog.version:
+                self._index = _LocalIndex(catalog.categories_of(self.feature_type))
+                self._version = catalog.version
+            return self._index
+
+    def match(self, keyword: str, catalog: CatalogSnapshot) -> Tuple[str, int]:
+        index = self._get_index(catalog)
+        tokens = _SEARCH_TOKEN.findall(keyword.lower())
+        if not tokens:
+            return NO_MATCH
+
+        candidate_ids = index.prefix_docs.get(tokens[-1][:MAX_GRAM], set())
+        for token in tokens[:-1]:
+            candidate_ids = candidate_ids & index.term_docs.get(token, set())
+
+        scored = []
+        for category_id in candidate_ids:
+            score = index.phrase_prefix_score(category_id, tokens)
+            if score > 0:
+                scored.append((score, category_id))
+        if not scored:
+            return NO_MATCH
+
+        scored.sort(key=lambda item: (-item[0], item[1]))
+        rescored = [
+            (score + BM25_RESCORE_WEIGHT * index.match_and_score(category_id, tokens), category_id)
+            for score, category_id in scored[:CATEGORY_CANDIDATES]
+        ]
+        _, category_id = min(rescored, key=lambda item: (-item[0], item[1]))
+        return index.names[category_id], category_id
+
+
+def create_category_matcher(backend: str = None, es_client=None) -> CategoryMatcher:
+    """설정에 맞는 카테고리 매처를 생성합니다.
+
+    Args:
+        backend (str): elasticsearch 또는 local (기본값: CATEGORY_MATCHER 환경 변수).
+        es_client (Elasticsearch): elasticsearch 매처가 사용할 클라이언트.
+
+    Returns:
+        CategoryMatcher: 생성한 매처.
+
+    Raises:
+        ValueError: 알 수 없는 매처 종류인 경우.
+    """
+    backend = backend or load_category_matcher_backend()
+    if backend == "local":
+        return LocalCategoryMatcher()
+    if backend == "elasticsearch":
+        return ElasticsearchCategoryMatcher(es_client)
+    raise ValueError(f"알 수 없는 CATEGORY_MATCHER 값입니다: {backend}")
@@ -0,0 +1,57 @@
+"""커밋된 ORM 변경에 맞춰 캐시를 무효화하는 공통 변경 추적 모듈.
+
+프로세스 내 캐시(catalog_cache, user_cache, response_cache)는 모두 같은 방식으로 무효화됩니다.
+flush 대상 객체(before_flush)와 일괄 INSERT/UPDATE/DELETE(do_orm_execute)에서 변경을 세션(session.info)에
+기록하고, 커밋되면(after_commit) 기록한 변경을 적용하며, 롤백되면(after_rollback) 기록을 버립니다.
+track_changes()는 이 네 리스너를 한 번에 등록하므로, 각 캐시는 무엇을 기록하고 어떻게 적용할지만 정의합니다.
+"""
+
+from typing import Callable, Iterable
+
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+
+
+def track_changes(key: str, flushed: Callable[[Session], Iterable], bulk_written: Callable[[type], Iterable],
+                  apply: Callable[[set], None]):
+    """세션 변경을 session.info[key]에 기록하고 커밋 시 apply로 적용하는 세션 이벤트 리스너를 등록합니다.
+
+    Args:
+        key (str): 변경을 기록할 session.info 키 (캐시마다 달라야 함).
+        flushed (Callable): flush 직전의 세션을 받아 기록할 변경 목록을 반환하는 함수.
+        bulk_written (Callable): 일괄 쓰기 대상 모델 클래스를 받아 기록할 변경 목록을 반환하는 함수.
+        apply (Callable): 커밋된 트랜잭션에서 기록된 변경 집합을 받아 캐시를 무효화하는 함수.
+    """
+    def record(session: Session, changes: Iterable):
+        changes = set(changes)
+        if changes:
+            session.info.setdefault(key, set()).update(changes)
+
+    @event.listens_for(Session, "before_flush")
+    def _track_flush(session, flush_context, instances):
+        record(session, flushed(session))
+
+    @event.listens_for(Session, "do_orm_execute")
+    def _track_bulk_write(orm_execute_state):
+        if not (orm_execute_state.is_update or orm_execute_state.is_delete or orm_execute_state.is_insert):
+            return
+        mapper = orm_execute_state.bind_mapper
+        if mapper is not None:
+            record(orm_execute_state.session, bulk_written(mapper.class_))
+
+    @event.listens_for(Session, "after_commit")
+    def _apply_on_commit(session):
+        changes = session.info.pop(key, None)
+        if changes:
+            apply(changes)
+
+    @event.listens_for(Session, "after_rollback")
+    def _discard_changes(session):
+        session.info.pop(key, None)
+
+
+def flushed_objects(session: Session, dirty: bool = True) -> tuple:
+    """flush 대상인 추가·삭제(dirty=True이면 수정 포함) 객체를 반환합니다."""
+    if dirty:
+        return (*session.new, *session.dirty, *session.deleted)
+    return (*session.new, *session.deleted)
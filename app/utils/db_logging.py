@@ -0,0 +1,142 @@
+"""데이터베이스 쿼리 로깅 설정 모듈.
+
+이 모듈은 환경 변수에 따라 SQLAlchemy 엔진의 로그 모드를 결정합니다.
+운영 환경에서는 echo를 끄고, 임계값을 넘는 느린 쿼리만 샘플링하여
+logging 모듈을 통해 파라미터와 요청 경로 템플릿(route, 예: /user/{user_id})과 함께 기록합니다.
+"""
+
+import logging
+import os
+import random
+import time
+from contextvars import ContextVar
+from typing import Optional
+
+from sqlalchemy import event
+
+logger = logging.getLogger("app.db.slow_query")
+
+# HTTP 요청 밖(CLI 작업 등)에서 느린 쿼리 로그에 남길 작업 이름
+current_route: ContextVar[str] = ContextVar("current_route", default="-")
+# 현재 HTTP 요청의 ASGI scope. 라우팅 후 scope["route"]에 매칭된 라우트가 기록됩니다.
+current_scope: ContextVar[Optional[dict]] = ContextVar("current_scope", default=None)
+
+LOG_MODES = ("off", "slow", "echo")
+
+
+def load_log_options() -> dict:
+    """환경 변수에서 쿼리 로그 설정을 읽어옵니다.
+
+    환경 변수:
+        DB_LOG_MODE (str): off(기본값) / slow(느린 쿼리만 기록) / echo(모든 SQL 출력).
+        DB_SLOW_QUERY_MS (int): 느린 쿼리로 판단할 임계값(ms) (기본값: 200).
+        DB_SLOW_QUERY_SAMPLE_RATE (float): 느린 쿼리 중 기록할 비율 0.0~1.0 (기본값: 1.0).
+
+    Returns:
+        dict: mode, slow_query_ms, sample_rate 값.
+
+    Raises:
+        ValueError: 지원하지 않는 DB_LOG_MODE 값인 경우.
+    """
+    mode = os.getenv("DB_LOG_MODE", "off").strip().lower() or "off"
+    if mode not in LOG_MODES:
+        raise ValueError(f"지원하지 않는 DB_LOG_MODE 입니다: {mode} (사용 가능: {', '.join(LOG_MODES)})")
+
+    return {
+        "mode": mode,
+        "slow_query_ms": int(os.getenv("DB_SLOW_QUERY_MS") or 200),
+        "sample_rate": float(os.getenv("DB_SLOW_QUERY_SAMPLE_RATE") or 1.0),
+    }
+
+
+def resolve_route() -> str:
+    """느린 쿼리 로그에 남길 경로를 반환합니다.
+
+    HTTP 요청 중이면 실제 URL 경로 대신 매칭된 라우트 템플릿(예: /user/{user_id})을 반환하므로
+    사용자 ID 같은 경로 파라미터가 로그에 남지 않고, 로그의 route 값 종류도 라우트 수로 제한됩니다.
+    매칭된 라우트가 없으면 "-"를 반환합니다.
+    """
+    scope = current_scope.get()
+    if scope is None:
+        return current_route.get()
+    return getattr(scope.get("route"), "path", None) or "-"
+
+
+def install_slow_query_logging(engine, slow_query_ms: int, sample_rate: float = 1.0):
+    """엔진에 느린 쿼리 로깅 이벤트 리스너를 등록합니다.
+
+    쿼리 실행 시간만 측정하고, 임계값을 넘은 쿼리 중 sample_rate 비율만
+    문자열로 포맷하여 기록하므로 일반 쿼리의 핫 패스 비용은 거의 없습니다.
+
+    Args:
+        engine: 리스너를 등록할 동기 Engine (비동기 엔진은 sync_engine을 전달).
+        slow_query_ms (int): 느린 쿼리 임계값(ms).
+        sample_rate (float): 느린 쿼리 중 기록할 비율.
+    """
+    threshold = slow_query_ms / 1000
+
+    @event.listens_for(engine, "before_cursor_execute")
+    def _start_timer(conn, cursor, statement, parameters, context, executemany):
+        conn.info.setdefault("query_start_time", []).append(time.perf_counter())
+
+    @event.listens_for(engine, "after_cursor_execute")
+    def _log_slow_query(conn, cursor, statement, parameters, context, executemany):
+        elapsed = time.perf_counter() - conn.info["query_start_time"].pop()
+        if elapsed < threshold or random.random() >= sample_rate:
+            return
+        route = resolve_route()
+        duration_ms = round(elapsed * 1000, 2)
+        logger.warning(
+            "slow query (%.2f ms) route=%s statement=%s parameters=%r",
+            duration_ms, route, statement, parameters,
+            extra={
+                "route": route,
+                "duration_ms": duration_ms,
+                "statement": statement,
+                "parameters": parameters,
+            },
+        )
+
+    @event.listens_for(engine, "handle_error")
+    def _discard_timer(context):
+        # 실패한 쿼리는 after_cursor_execute가 호출되지 않으므로, 시작 시각을 꺼내 다음 쿼리와 섞이지 않게 함
+        if context.connection is None or context.execution_context is None:
+            return
+        timers = context.connection.info.get("query_start_time")
+        if timers:
+            timers.pop()
+
+
+class RouteContextMiddleware:
+    """요청의 ASGI scope를 current_scope 컨텍스트 변수에 저장하는 ASGI 미들웨어.
+
+    라우팅은 이 미들웨어 안쪽에서 같은 scope 객체에 매칭된 라우트를 기록하므로, 쿼리 로그를 남기는 시점에는
+    resolve_route()가 라우트 템플릿을 읽을 수 있습니다.
+    BaseHTTPMiddleware를 거치지 않는 순수 ASGI 미들웨어로, 요청당 오버헤드가 거의 없습니다.
+    """
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        token = current_scope.set(scope)
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            current_scope.reset(token)
+
+
+def configure_engine_logging(engine, options: dict):
+    """로그 설정에 따라 엔진에 느린 쿼리 로깅을 적용합니다.
+
+    echo 모드는 create_engine(echo=True)로 처리되므로 여기서는 slow 모드만 다룹니다.
+
+    Args:
+        engine: 설정을 적용할 동기 Engine.
+        options (dict): load_log_options()의 반환값.
+    """
+    if options["mode"] == "slow":
+        install_slow_query_logging(engine, options["slow_query_ms"], options["sample_rate"])
@@ -1,17 +1,24 @@
 """데이터베이스 연결 및 관리를 위한 유틸리티 모듈.
 이 모듈은 PostgreSQL 데이터베이스 연결을 설정하고, 테이블 생성을 관리하며,
 기본 데이터를 초기화하는 기능을 제공합니다.
+
+엔진과 세션 팩토리는 처음 사용될 때 생성되므로 모듈 import 시점에는 DB에 접속하지 않습니다.
+테이블 생성과 기본 데이터 삽입은 app.utils.setup_database 명령으로 한 번만 실행합니다.
 """
 
 import os
-import time
+import threading
 
 from dotenv import load_dotenv
 from sqlalchemy import create_engine
 from sqlalchemy.exc import IntegrityError, OperationalError
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
 from sqlalchemy.orm import scoped_session, sessionmaker
 
 from app.models.base import Base
+from app.models.feature import Feature
+from app.utils.db_logging import configure_engine_logging, load_log_options
+from app.utils.db_pool import InstrumentedAsyncQueuePool, InstrumentedQueuePool, load_pool_options, pool_stats
 from app.utils.init_default_data import (
     add_default_categories,
     add_default_employees,
@@ -19,6 +26,7 @@ from app.utils.init_default_data import (
     add_default_news,
     add_default_user,
 )
+from app.utils.readiness import load_connect_options, retry_with_backoff
 
 load_dotenv()
 
@@ -26,30 +34,120 @@ class DBManager:
     """PostgreSQL 데이터베이스 연결 및 관리를 위한 클래스.
     이 클래스는 데이터베이스 연결을 설정하고, 세션을 관리하며,
     테이블 생성 및 기본 데이터 초기화 기능을 제공합니다.
+    엔진은 최초 사용 시점에 지연 생성됩니다.
     """
 
     def __init__(self):
         """DBManager 클래스의 초기화 메서드.
-        환경 변수에서 데이터베이스 연결 정보를 가져와 PostgreSQL에 연결을 시도합니다.
-        연결이 실패할 경우 최대 1000번까지 재시도합니다.
+        환경 변수에서 데이터베이스 연결 정보와 설정만 읽어오며, 실제 연결은 하지 않습니다.
+        커넥션 풀 설정은 load_pool_options(), 쿼리 로그 설정은 load_log_options()를 통해
+        환경 변수에서 읽어옵니다. SQL echo는 DB_LOG_MODE=echo 일 때만 켜집니다.
+        """
+        self.db_url = f"postgresql+psycopg://{os.getenv('DB_USER')}:{os.getenv('DB_PASSWORD')}@{os.getenv('DB_HOST')}:{os.getenv('DB_PORT')}/{os.getenv('DB_NAME')}"
+        self._lock = threading.Lock()
+        self._engine = None
+        self._session_local = None
+        self._async_engine = None
+        self._async_session_local = None
+
+    def _engine_options(self):
+        """엔진 생성에 사용할 (echo 여부, 풀 설정, 로그 설정)을 반환합니다."""
+        log_options = load_log_options()
+        return log_options["mode"] == "echo", load_pool_options(), log_options
+
+    @property
+    def engine(self):
+        """동기 엔진. 처음 접근할 때 생성됩니다."""
+        if self._engine is None:
+            with self._lock:
+                if self._engine is None:
+                    echo, pool_options, log_options = self._engine_options()
+                    engine = create_engine(self.db_url, echo=echo, poolclass=InstrumentedQueuePool, **pool_options)
+                    configure_engine_logging(engine, log_options)
+                    self._engine = engine
+        return self._engine
+
+    @property
+    def SessionLocal(self):
+        """동기 세션 팩토리(scoped_session). 처음 접근할 때 생성됩니다."""
+        if self._session_local is None:
+            with self._lock:
+                if self._session_local is None:
+                    self._session_local = scoped_session(
+                        sessionmaker(autocommit=False, autoflush=False, bind=self.engine)
+                    )
+        return self._session_local
+
+    @property
+    def async_engine(self):
+        """비동기 모드용 엔진 (psycopg 드라이버는 동일한 URL로 async 연결을 지원). 처음 접근할 때 생성됩니다."""
+        if self._async_engine is None:
+            with self._lock:
+                if self._async_engine is None:
+                    echo, pool_options, log_options = self._engine_options()
+                    async_engine = create_async_engine(
+                        self.db_url, echo=echo, poolclass=InstrumentedAsyncQueuePool, **pool_options
+                    )
+                    configure_engine_logging(async_engine.sync_engine, log_options)
+                    self._async_engine = async_engine
+        return self._async_engine
+
+    @property
+    def AsyncSessionLocal(self):
+        """비동기 세션 팩토리. 처음 접근할 때 생성됩니다."""
+        if self._async_session_local is None:
+            with self._lock:
+                if self._async_session_local is None:
+                    self._async_session_local = async_sessionmaker(
+                        bind=self.async_engine, autoflush=False, expire_on_commit=False
+                    )
+        return self._async_session_local
+
+    def wait_for_connection(self, deadline: float = None, base_delay: float = None, max_delay: float = None):
+        """데이터베이스에 연결될 때까지 지수 백오프(jitter 포함)로 재시도합니다.
+
+        인자를 생략하면 DB_CONNECT_DEADLINE / DB_CONNECT_BASE_DELAY / DB_CONNECT_MAX_DELAY
+        환경 변수 값을 사용합니다.
+
+        Args:
+            deadline (float): 연결을 기다릴 최대 시간(초).
+            base_delay (float): 첫 재시도 대기 시간 상한(초).
+            max_delay (float): 재시도 대기 시간 상한(초).
+
         Raises:
-            RuntimeError: 모든 재시도 후에도 데이터베이스 연결에 실패한 경우.
+            RuntimeError: deadline 안에 데이터베이스 연결에 실패한 경우.
         """
-        db_url = f"postgresql+psycopg://{os.getenv('DB_USER')}:{os.getenv('DB_PASSWORD')}@{os.getenv('DB_HOST')}:{os.getenv('DB_PORT')}/{os.getenv('DB_NAME')}"
-        self.engine = None
-        for _ in range(1000):
-            try:
-                self.engine = create_engine(db_url, echo=True)
-                # 연결 테스트
-                with self.engine.connect():
-                    break
-            except OperationalError:
-                print("❗ PostgreSQL 연결 실패... 재시도 중")
-                time.sleep(2)
-
-        if self.engine is None:
-            raise RuntimeError("🚨 DB 연결 실패: 재시도 후에도 연결되지 않음")
-        self.SessionLocal = scoped_session(sessionmaker(autocommit=False, autoflush=False, bind=self.engine))
+        options = load_connect_options()
+        if deadline is not None:
+            options["deadline"] = deadline
+        if base_delay is not None:
+            options["base_delay"] = base_delay
+        if max_delay is not None:
+            options["max_delay"] = max_delay
+
+        def connect():
+            with self.engine.connect():
+                return
+
+        def on_retry(attempt, error, delay):
+            print(f"❗ PostgreSQL 연결 실패 ({attempt}회)... {delay:.1f}초 후 재시도")
+
+        try:
+            retry_with_backoff(connect, OperationalError, on_retry=on_retry, **options)
+        except TimeoutError as e:
+            raise RuntimeError(f"🚨 DB 연결 실패: {options['deadline']}초 안에 연결되지 않음") from e
+
+    def pool_status(self):
+        """동기/비동기 엔진의 커넥션 풀 통계를 반환합니다.
+
+        Returns:
+            dict: 엔진별 checked-out, overflow, 대기 시간 등의 통계.
+            아직 생성되지 않은 엔진은 None으로 표시됩니다.
+        """
+        return {
+            "sync": pool_stats(self._engine.pool) if self._engine is not None else None,
+            "async": pool_stats(self._async_engine.sync_engine.pool) if self._async_engine is not None else None,
+        }
 
     def init_db(self):
         """데이터베이스 테이블을 초기화합니다.
@@ -70,13 +168,27 @@ class DBManager:
         finally:
             db.close()
 
+    async def get_async_db(self):
+        """비동기 데이터베이스 세션을 생성하고 반환하는 비동기 제너레이터 함수.
+        Yields:
+            AsyncSession: SQLAlchemy 비동기 세션 객체.
+        Note:
+            async 라우터(DB_ASYNC_MODE)에서 의존성으로 사용되며, 요청이 끝나면 세션이 닫힙니다.
+        """
+        async with self.AsyncSessionLocal() as db:
+            yield db
+
     def init_default_data(self):
         """기본 데이터를 데이터베이스에 초기화합니다.
         Feature와 Category 모델에 대한 기본 데이터를 생성합니다.
-        이미 데이터가 존재하는 경우 IntegrityError가 발생하며, 이 경우 롤백됩니다.
+        Feature 데이터가 이미 있으면 삽입을 건너뛰며, 동시에 실행되어
+        IntegrityError가 발생하는 경우에는 롤백됩니다.
         """
         db = next(self.get_db())
         try:
+            if db.query(Feature.feature_id).first() is not None:
+                print("ℹ️ 기본 데이터가 이미 존재합니다.")
+                return
             add_default_user(db)
             db.commit()
             add_default_features(db)
@@ -94,7 +206,5 @@ class DBManager:
         finally:
             db.close()
 
-# 전역 DBManager 인스턴스 생성 및 초기화
+# 전역 DBManager 인스턴스 (연결은 최초 사용 시 생성)
 db_manager = DBManager()
-db_manager.init_db()
-db_manager.init_default_data()
@@ -0,0 +1,127 @@
+"""데이터베이스 커넥션 풀 설정 및 통계 수집 모듈.
+
+이 모듈은 환경 변수로부터 커넥션 풀 설정(크기, overflow, recycle, pre-ping,
+statement timeout)을 읽어 엔진 생성 옵션을 만들고, 커넥션을 얻기까지 대기한 시간을
+기록하는 풀 클래스를 제공합니다. 수집된 통계는 uvicorn 워커 수에 맞춰 풀 크기를
+조정할 때 사용합니다.
+"""
+
+import os
+import threading
+import time
+
+from sqlalchemy.pool import AsyncAdaptedQueuePool, QueuePool
+
+
+def _env_int(name: str, default: int) -> int:
+    """정수형 환경 변수를 읽습니다. 값이 없으면 기본값을 반환합니다."""
+    value = os.getenv(name)
+    return int(value) if value not in (None, "") else default
+
+
+def _env_bool(name: str, default: bool) -> bool:
+    """불리언 환경 변수를 읽습니다. true/1/yes/on 을 참으로 간주합니다."""
+    value = os.getenv(name)
+    if value in (None, ""):
+        return default
+    return value.strip().lower() in ("true", "1", "yes", "on")
+
+
+def load_pool_options() -> dict:
+    """환경 변수에서 커넥션 풀 설정을 읽어 create_engine 옵션으로 반환합니다.
+
+    환경 변수:
+        DB_POOL_SIZE (int): 유지할 커넥션 수 (기본값: 5).
+        DB_MAX_OVERFLOW (int): pool_size를 초과해 임시로 열 수 있는 커넥션 수 (기본값: 10).
+        DB_POOL_TIMEOUT (int): 커넥션을 얻기 위해 대기할 최대 초 (기본값: 30).
+        DB_POOL_RECYCLE (int): 커넥션 재활용 주기(초), -1이면 비활성화 (기본값: 1800).
+        DB_POOL_PRE_PING (bool): 체크아웃 시 커넥션 유효성 검사 여부 (기본값: true).
+        DB_STATEMENT_TIMEOUT_MS (int): PostgreSQL statement_timeout(ms), 0이면 미설정 (기본값: 0).
+        DB_CONNECT_TIMEOUT (int): 새 커넥션 연결 제한 시간(초), 0이면 미설정 (기본값: 5).
+
+    Returns:
+        dict: create_engine / create_async_engine에 전달할 키워드 인자.
+    """
+    options = {
+        "pool_size": _env_int("DB_POOL_SIZE", 5),
+        "max_overflow": _env_int("DB_MAX_OVERFLOW", 10),
+        "pool_timeout": _env_int("DB_POOL_TIMEOUT", 30),
+        "pool_recycle": _env_int("DB_POOL_RECYCLE", 1800),
+        "pool_pre_ping": _env_bool("DB_POOL_PRE_PING", True),
+    }
+
+    connect_args = {}
+    connect_timeout = _env_int("DB_CONNECT_TIMEOUT", 5)
+    if connect_timeout > 0:
+        connect_args["connect_timeout"] = connect_timeout
+    statement_timeout = _env_int("DB_STATEMENT_TIMEOUT_MS", 0)
+    if statement_timeout > 0:
+        connect_args["options"] = f"-c statement_timeout={statement_timeout}"
+    if connect_args:
+        options["connect_args"] = connect_args
+
+    return options
+
+
+class PoolWaitStatsMixin:
+    """커넥션 체크아웃 대기 시간을 누적하는 풀 믹스인 클래스.
+
+    QueuePool._do_get을 감싸 커넥션을 얻기까지 걸린 시간을 기록합니다.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._stats_lock = threading.Lock()
+        self._checkout_count = 0
+        self._wait_total = 0.0
+        self._wait_max = 0.0
+
+    def _do_get(self):
+        started = time.perf_counter()
+        try:
+            return super()._do_get()
+        finally:
+            waited = time.perf_counter() - started
+            with self._stats_lock:
+                self._checkout_count += 1
+                self._wait_total += waited
+                self._wait_max = max(self._wait_max, waited)
+
+    def wait_stats(self) -> dict:
+        """누적된 체크아웃 횟수와 대기 시간(ms)을 반환합니다."""
+        with self._stats_lock:
+            count = self._checkout_count
+            return {
+                "checkouts": count,
+                "wait_total_ms": round(self._wait_total * 1000, 3),
+                "wait_avg_ms": round(self._wait_total * 1000 / count, 3) if count else 0.0,
+                "wait_max_ms": round(self._wait_max * 1000, 3),
+            }
+
+
+class InstrumentedQueuePool(PoolWaitStatsMixin, QueuePool):
+    """대기 시간 통계를 수집하는 동기 엔진용 QueuePool."""
+
+
+class InstrumentedAsyncQueuePool(PoolWaitStatsMixin, AsyncAdaptedQueuePool):
+    """대기 시간 통계를 수집하는 비동기 엔진용 QueuePool."""
+
+
+def pool_stats(pool) -> dict:
+    """커넥션 풀의 현재 상태와 대기 시간 통계를 반환합니다.
+
+    Args:
+        pool: SQLAlchemy 엔진의 커넥션 풀 객체.
+
+    Returns:
+        dict: size, checked_out, checked_in, overflow 및 대기 시간 통계.
+    """
+    stats = {
+        "size": pool.size(),
+        "checked_out": pool.checkedout(),
+        "checked_in": pool.checkedin(),
+        "overflow": pool.overflow(),
+    }
+    if isinstance(pool, PoolWaitStatsMixin):
+        stats.update(pool.wait_stats())
+    return stats
@@ -0,0 +1,238 @@
+"""사용자별 추천 피드 미리 계산(materialization) 모듈.
+
+채용 공고와 뉴스는 수집 작업(insert_employee_data, news_client)이 실행될 때만 바뀌므로,
+수집이 끝날 때마다 새 데이터가 들어온 카테고리를 구독 중인 사용자의 상위 FEED_SIZE개 추천 목록을
+user_feed 테이블에 다시 계산해 둡니다. 추천 쿼리는 피드 조회와 실시간 추천을 UNION ALL로 합친
+SELECT 문 하나이며, 피드가 있으면 피드 항목을, 없으면(미계산, 구독 변경 직후) 실시간 추천 결과를 반환합니다.
+FEED_SIZE보다 큰 limit은 피드 없이 실시간 추천 쿼리만 실행합니다.
+
+ORM 세션에서 사용자의 구독(UserCategory)이나 사용자(Users)를 변경하면 같은 트랜잭션에서 해당
+사용자의 피드를 삭제하므로, 구독 변경이 이전 피드에 가려지지 않습니다.
+"""
+
+import os
+from collections import defaultdict
+from itertools import groupby
+from typing import Iterable, Optional
+
+from sqlalchemy import Select, and_, delete, event, func, insert, select
+from sqlalchemy.orm import Session
+
+from app.models import Employee, EmployeeCategory, News, UserCategory, UserFeed, Users
+from app.utils.bulk_upsert import batched
+
+EMPLOYEE_FEED = "employee"
+NEWS_FEED = "news"
+REFRESH_BATCH_SIZE = 500  # 한 번에 피드를 다시 계산하는 사용자 수
+
+
+def load_feed_size() -> int:
+    """환경 변수에서 피드에 미리 계산해 둘 추천 항목 수를 읽어옵니다.
+
+    환경 변수:
+        FEED_SIZE (int): 채용 공고 수, 또는 뉴스 피드의 카테고리별 뉴스 수. 0이면 피드를 사용하지 않음 (기본값: 20).
+    """
+    return int(os.getenv("FEED_SIZE") or 20)
+
+
+def refresh_feeds(db: Session, feature_type: str, category_ids: Optional[Iterable[int]] = None,
+                  feed_size: Optional[int] = None) -> int:
+    """category_ids를 구독 중인 사용자의 피드를 다시 계산하여 저장하고 커밋합니다.
+
+    Args:
+        db (Session): 데이터베이스 세션 객체.
+        feature_type (str): 다시 계산할 피드 종류 ("employee" 또는 "news").
+        category_ids (Iterable[int]): 새 데이터가 들어온 카테고리 ID. None이면 활성 구독이 있는 모든 사용자.
+        feed_size (int): 저장할 추천 항목 수 (기본값: FEED_SIZE 환경 변수).
+
+    Returns:
+        int: 피드를 다시 계산한 사용자 수.
+
+    Raises:
+        SQLAlchemyError: 저장 중 DB 오류 발생 시 (트랜잭션은 롤백됨).
+    """
+    feed_size = load_feed_size() if feed_size is None else feed_size
+    if feed_size <= 0:
+        return 0
+
+    users = select(UserCategory.user_id).where(UserCategory.is_active.is_(True)).distinct()
+    if category_ids is not None:
+        category_ids = list(category_ids)
+        if not category_ids:
+            return 0
+        users = users.where(UserCategory.category_id.in_(category_ids))
+    user_ids = sorted(db.scalars(users))
+
+    build_rows = _employee_feed_rows if feature_type == EMPLOYEE_FEED else _news_feed_rows
+    try:
+        for chunk in batched(user_ids, REFRESH_BATCH_SIZE):
+            rows = build_rows(db, chunk, feed_size + 1)  # 다음 페이지가 있는지 판단할 항목 1개를 함께 저장
+            db.execute(delete(UserFeed).where(UserFeed.user_id.in_(chunk), UserFeed.feature_type == feature_type))
+            if rows:
+                db.execute(insert(UserFeed), rows)
+        db.commit()
+    except Exception:
+        db.rollback()
+        raise
+
+    print(f"🧾 {feature_type} 피드 갱신: 사용자 {len(user_ids)}명")
+    return len(user_ids)
+
+
+def _employee_feed_rows(db: Session, user_ids: list, feed_size: int) -> list:
+    """사용자마다 활성 구독 카테고리에 속한 지원 가능한 채용 공고를 feed_size개 구합니다.
+
+    추천 순서(시작일 최신순, recruit_id 역순)는 실시간 추천 쿼리와 같습니다.
+    """
+    matched = (
+        select(UserCategory.user_id, EmployeeCategory.recruit_id)
+        .join(EmployeeCategory, EmployeeCategory.category_id == UserCategory.category_id)
+        .where(UserCategory.user_id.in_(user_ids), UserCategory.is_active.is_(True))
+        .distinct()
+        .subquery("matched")
+    )
+    ranked = (
+        select(
+            matched.c.user_id,
+            matched.c.recruit_id,
+            func.row_number().over(
+                partition_by=matched.c.user_id,
+                order_by=(Employee.start_date.desc(), Employee.recruit_id.desc()),
+            ).label("item_rank"),
+        )
+        .join(Employee, Employee.recruit_id == matched.c.recruit_id)
+        .where(Employee.is_open())
+        .subquery("ranked")
+    )
+    rows = db.execute(
+        select(ranked).where(ranked.c.item_rank <= feed_size).order_by(ranked.c.user_id, ranked.c.item_rank)
+    )
+    return [
+        {
+            "user_id": row.user_id,
+            "feature_type": EMPLOYEE_FEED,
+            "position": row.item_rank - 1,
+            "group_id": None,
+            "item_rank": row.item_rank - 1,
+            "item_id": row.recruit_id,
+            "item_date": None,
+        }
+        for row in rows
+    ]
+
+
+def _news_feed_rows(db: Session, user_ids: list, feed_size: int) -> list:
+    """사용자마다 활성 구독 순서대로 카테고리별 최신 뉴스 feed_size개를 구합니다.
+
+    뉴스가 없는 카테고리는 item_id가 없는 행 하나로 남겨 부족 메시지를 만들 수 있게 합니다.
+    """
+    subscriptions = db.execute(
+        select(UserCategory.user_id, UserCategory.category_id)
+        .where(UserCategory.user_id.in_(user_ids), UserCategory.is_active.is_(True))
+        .order_by(UserCategory.user_id, UserCategory.id)
+    ).all()
+
+    ranked = (
+        select(
+            News.category_id,
+            News.news_id,
+            News.publish_date,
+            func.row_number().over(
+                partition_by=News.category_id, order_by=(News.publish_date.desc(), News.news_id.desc())
+            ).label("item_rank"),
+        )
+        .where(News.category_id.in_({row.category_id for row in subscriptions}))
+        .subquery("ranked")
+    )
+    top_news = defaultdict(list)
+    for row in db.execute(
+        select(ranked).where(ranked.c.item_rank <= feed_size).order_by(ranked.c.category_id, ranked.c.item_rank)
+    ):
+        top_news[row.category_id].append((row.news_id, row.publish_date))
+
+    rows = []
+    for user_id, user_subscriptions in groupby(subscriptions, key=lambda row: row.user_id):
+        position = 0
+        for subscription in user_subscriptions:
+            items = top_news.get(subscription.category_id) or [(None, None)]
+            for item_rank, (news_id, publish_date) in enumerate(items):
+                rows.append({
+                    "user_id": user_id,
+                    "feature_type": NEWS_FEED,
+                    "position": position,
+                    "group_id": subscription.category_id,
+                    "item_rank": item_rank,
+                    "item_id": news_id,
+                    "item_date": publish_date,
+                })
+                position += 1
+    return rows
+
+
+def employee_feed_query(user_id: str, limit: int) -> Optional[Select]:
+    """미리 계산된 채용 공고 피드에서 지원 가능한 상위 limit개 공고를 조회하는 SELECT 문을 반환합니다.
+
+    추천 쿼리(build_recruit_recommendation_query)에 합쳐지므로 피드 조회에 별도의 DB 왕복이 없습니다.
+    피드를 계산한 뒤 마감된 공고는 빠지므로 limit개보다 적게 반환될 수 있으며,
+    이때 추천 쿼리는 실시간 조회를 사용합니다.
+
+    Returns:
+        Optional[Select]: Employee 행을 반환하는 SELECT 문.
+            피드를 사용하지 않거나 limit이 피드에 저장된 항목 수(FEED_SIZE + 1)보다 크면 None.
+    """
+    feed_size = load_feed_size()
+    if feed_size <= 0 or limit > feed_size + 1:
+        return None
+    return (
+        select(Employee)
+        .join(UserFeed, UserFeed.item_id == Employee.recruit_id)
+        .where(
+            UserFeed.user_id == user_id,
+            UserFeed.feature_type == EMPLOYEE_FEED,
+            UserFeed.item_rank < limit,
+            Employee.is_open(),
+        )
+    )
+
+
+def news_feed_query(user_id: str, limit: int) -> Optional[Select]:
+    """미리 계산된 뉴스 피드에서 구독 카테고리별 최신 뉴스 limit개를 조회하는 SELECT 문을 반환합니다.
+
+    추천 쿼리(build_news_recommendation_query)에 합쳐지므로 피드 조회에 별도의 DB 왕복이 없습니다.
+
+    Returns:
+        Optional[Select]: News 행을 반환하는 SELECT 문.
+            피드를 사용하지 않거나 limit이 피드에 저장된 항목 수(FEED_SIZE + 1)보다 크면 None.
+    """
+    feed_size = load_feed_size()
+    if feed_size <= 0 or limit > feed_size + 1:
+        return None
+    return (
+        select(News)
+        .join(UserFeed, and_(UserFeed.item_id == News.news_id, UserFeed.item_date == News.publish_date))
+        .where(UserFeed.user_id == user_id, UserFeed.feature_type == NEWS_FEED, UserFeed.item_rank < limit)
+    )
+
+
+@event.listens_for(Session, "after_flush")
+def _invalidate_changed_feeds(session, flush_context):
+    """구독이나 사용자가 변경되면 같은 트랜잭션에서 해당 사용자의 피드를 삭제합니다."""
+    changed = {
+        obj.user_id for obj in (*session.new, *session.dirty, *session.deleted)
+        if isinstance(obj, (UserCategory, Users))
+    }
+    if changed:
+        session.connection().execute(delete(UserFeed.__table__).where(UserFeed.user_id.in_(changed)))
+
+
+@event.listens_for(Session, "do_orm_execute")
+def _invalidate_feeds_on_bulk_write(orm_execute_state):
+    """query().update()/delete() 등 구독·사용자 일괄 변경은 모든 피드를 삭제합니다.
+
+    어떤 사용자가 바뀌었는지 알 수 없기 때문입니다.
+    """
+    if not (orm_execute_state.is_update or orm_execute_state.is_delete):
+        return
+    mapper = orm_execute_state.bind_mapper
+    if mapper is not None and mapper.class_ in (UserCategory, Users):
+        orm_execute_state.session.connection().execute(delete(UserFeed.__table__))
@@ -13,6 +13,7 @@ from app.models.users import Users
 from app.models.hire_type import HireType
 from app.models.employee_category import EmployeeCategory
 from app.models.employee_hire_type import EmployeeHireType
+from app.utils.news_partitions import ensure_partitions_for
 
 
 
@@ -259,9 +260,13 @@ def add_default_employee_category(db):
 
 
 def add_default_news(db):
-    """기본 News 데이터를 추가합니다. Category가 선행되어 있어야 함."""
+    """기본 News 데이터를 추가합니다. Category가 선행되어 있어야 함.
+
+    PostgreSQL 파티션 테이블이면 기본 뉴스의 publish_date에 해당하는 월 파티션을 먼저 생성합니다.
+    """
     news_items = [
         News(
+            news_id=1,
             category_id=1,  # IT/개발
             title="로보락, 로봇청소기 'S7 맥스 울트라' 출시…154만원",
             contents="청소가전 전문기업 로보락은 신제품 올인원 로봇청소기 '로보락 S7 맥스 울트라'를 출시한다고 7일 밝혔다. 로보락 S7 맥스 울트라는 지난해 출시한 '로보락 S7 맥스V 울트라'보다 흡입력을 높였다. 제품은 5천500Pa 흡입력과 분당 최대 3천 번 진동하는 음파진동 물걸레 시스템을 갖췄다. 신제품은 라이다 내비게이션을 탑재해 집을 빠르게 스캔하고 '리액티브 테크' 장애물 회피 시스템으로 사물 충돌을 방지한다. 절벽 감지 센서로 위험 지역을 파악하고 AI가 로봇청소기가 갇히기 쉬운 장소를 자동으로 탐지해 진입 금지 구역을 제안한다. 제품은 본체 유지관리 기기인 엠티 워시 필 도크 내 듀얼 열풍건조 기능을 추가했다. 패드 세척이 진행되는 바닥 면도 자동 건조한다. 도크는 세척 브러시가 좌우 양방향으로 움직이며 물걸레 패드와 바닥 면을 자동 세척해준다. 제품은 로봇청소기 자동 물 채움 기능을 지원해 최대 300m2 면적을 물걸레질할 수 있다. 또한 자동 먼지비움 기능으로 최대 7주까지 먼지통을 비우지 않아도 된다. 신제품은 화이트 컬러로 출시했다. 가격은 154만원이다. 기존 'S7 맥스V 울트라'보다 5만원 저렴해졌다.",
@@ -272,6 +277,7 @@ def add_default_news(db):
             original_url="https://n.news.naver.com/article/138/0002160000",
         ),
         News(
+            news_id=2,
             category_id=2,  # 마케팅
             title="옥천군 '옥천읍 맛집·멋집' 책자 배부",
             contents="충북 옥천군은 골목 상권 홍보와 지역상권 활성화를 위한 책자 '옥천읍 맛집·멋집'을 2000부 제작해 배부한다. 군은 다양한 먹거리가 밀집한 옥천읍의 음식점과 카페 정보를 방문객에게 안내하기 위해 옥천사랑상품권(향수OK카드) 가맹점 등록자료를 기초로 지난 8월 책자 제작을 시작했다. 두 달여간 자료 수집과 보완 작업을 거쳐 '옥천읍 맛집‧멋집' 책자를 완성했다. 책자는 옥천읍 소재 음식점 410곳, 카페 114곳을 한식‧중식‧양식‧커피음료 전문점 등 업종별로 분류해 업소의 전경 사진과 주소, 연락처, 영업시간 등의 정보를 담았다. 관광객이 많이 찾는 육영수생가, 전통문화체험관, 정지용문학관, 장계관광지 등 옥천읍 주요 관광지에 배부됐다.",
@@ -282,6 +288,7 @@ def add_default_news(db):
             original_url="https://n.news.naver.com/article/138/0002160000",
         ),
         News(
+            news_id=3,
             category_id=3,  # 디자인
             title="'아이폰'으로 버틴 애플…팀 쿡 '생성형 AI 당장 없지만 투자 꽤 많다'",
             contents="애플은 2일(현지시간) 3분기 실적발표를 통해 당장 생성형AI를 도입하지 않았으나 꽤 많은 투자를 하고 있다고 확신하며 조만간 그에 따른 기술 실현을 목격할 수 있을 것이라 자신했다. 애플의 3분기 매출은 전년동기대비 1% 감소한 895억달러를 기록했다. 서비스 수익은 223억 달러로 전년동기대비 16% 증가하면서 사상 최고 매출을 기록했다. 앱스토어와 광고, 아이클라우드, 애플케어, 결제 서비스 및 영상 관련 서비스는 높은 매출을 기록했고 애플뮤직 역시 최대 기록을 바꿨다. 다만, 하드웨어 측면에서는 부진했다. 그나마 아이폰이 선방했다. 3분기 아이폰 매출은 438억달러로 전년동기대비 소폭 올랐다. 하지만 올해 아이폰 총 매출은 2006억달러로 전년 2055억 대비 소폭 줄었다. 이에 대해 팀 쿡 애플 CEO는 아이폰14 대비 아이폰15 모델 판매량이 더 높기는 하나 상급 기종인 아이폰15 프로 시리즈의 공급이 제한된 것이 이유라고 분석했다. 정상적인 공급을 위해 노력하고 있으며 연말께 수요와 공급이 균형을 이룰 것으로 내다봤다. 맥의 내리막은 가파르다. 맥 매출은 76억달러로 전년동기대비 34%나 줄었다. 애플은 최근 M3 기반 맥북 프로와 아이맥을 내놓으면서 반전을 꾀하고 있다. 팀 쿡 역시 다음 분기에 맥 매출이 개선될 것이라 예견했다. 맥과 마찬가지로 아이패드의 수익 역시 감소했다. 전년동기 71억달러보다 낮은 64억달러를 기록했다. 웨어러블 매출 역시도 전년동기 96억5000만달러에서 감소한 93억2000만달러를 나타냈다. 애플은 올해 연구개발에 총 300억달러를 지출했다. 비전 프로와 AI, 머신러닝, 자체 실리콘 투자에 따라 R&D 비용은 전년대비 더 증가했다.",
@@ -292,6 +299,7 @@ def add_default_news(db):
             original_url="https://n.news.naver.com/article/138/0002160000",
         ),
     ]
+    ensure_partitions_for(db, (news.publish_date for news in news_items))
     for news in news_items:
         db.add(news)
 
@@ -1,121 +1,242 @@
 """
 Elasticsearch에 카테고리 정보를 색인하는 모듈입니다.
-이 모듈은 사전에 정의된 카테고리 리스트(CATEGORIES)를 기반으로
+이 모듈은 데이터베이스의 Category/Feature 테이블을 기준으로
 Elasticsearch 'categories' 인덱스를 생성하고, 자동완성 기능을 지원하기 위해
 edge_ngram 분석기를 적용한 매핑을 설정합니다.
-주요 기능은 인덱스 삭제 후 재생성 및 초기 데이터 삽입입니다.
+
+'categories'는 실제 인덱스가 아닌 별칭(alias)이며, 데이터는 매핑 해시가 붙은 버전 인덱스
+(예: categories-3f2a...)에 helpers.bulk로 색인합니다. 매핑이 바뀌면 새 버전 인덱스에 전체 데이터를
+색인한 뒤 별칭을 원자적으로 옮기므로 검색 중에 인덱스가 사라지는 순간이 없습니다.
+
+매핑이 같으면 재색인하지 않고 증분 동기화만 수행합니다. 인덱스 _meta에 저장된 updated_at
+워터마크 이후 변경된 카테고리만 다시 색인하고, 데이터베이스에서 삭제된 카테고리는 인덱스에서도 삭제합니다.
+updated_at은 커밋 시각이 아닌 트랜잭션 시작 시각(now())이므로, 긴 트랜잭션이 워터마크보다 이른 값으로
+늦게 커밋되어도 놓치지 않도록 워터마크에서 WATERMARK_SAFETY_MARGIN만큼 앞선 시각부터 조회합니다.
+
+실행 예시:
+    python -m app.utils.init_elasticsearch_index          # 증분 동기화 (매핑이 바뀌었으면 재색인)
+    python -m app.utils.init_elasticsearch_index --full   # 전체 카테고리 다시 색인
 """
-from elasticsearch import Elasticsearch
+import argparse
+import hashlib
+import json
+from datetime import datetime, timedelta
+
+from elasticsearch import Elasticsearch, helpers
+from sqlalchemy import func, or_, select
+
+from app.models.category import Category
+from app.models.feature import Feature
+from app.utils.db_manager import db_manager
 
 es = Elasticsearch("http://elasticsearch:9200")
 
-CATEGORIES = [
-    {"category_id": 1, "category_name": "IT/과학", "feature": "news"},
-    {"category_id": 2, "category_name": "마케팅", "feature": "news"},
-    {"category_id": 3, "category_name": "디자인", "feature": "news"},
-    {"category_id": 4, "category_name": "경영/기획", "feature": "news"},
-    {"category_id": 5, "category_name": "영업/제휴", "feature": "news"},
-    {"category_id": 6, "category_name": "정치", "feature": "news"},
-    {"category_id": 7, "category_name": "경제", "feature": "news"},
-    {"category_id": 8, "category_name": "사회", "feature": "news"},
-    {"category_id": 9, "category_name": "생활/문화", "feature": "news"},
-    {"category_id": 10, "category_name": "세계", "feature": "news"},
-    {"category_id": 11, "category_name": "사업관리", "feature": "employee"},
-    {"category_id": 12, "category_name": "경영·회계·사무", "feature": "employee"},
-    {"category_id": 13, "category_name": "금융·보험", "feature": "employee"},
-    {"category_id": 14, "category_name": "교육·자연·사회과학", "feature": "employee"},
-    {"category_id": 15, "category_name": "법률·경찰·소방·교도·국방", "feature": "employee"},
-    {"category_id": 16, "category_name": "보건·의료", "feature": "employee"},
-    {"category_id": 17, "category_name": "사회복지·종교", "feature": "employee"},
-    {"category_id": 18, "category_name": "문화·예술·디자인·방송", "feature": "employee"},
-    {"category_id": 19, "category_name": "운전·운송", "feature": "employee"},
-    {"category_id": 20, "category_name": "영업판매", "feature": "employee"},
-    {"category_id": 21, "category_name": "경비·청소", "feature": "employee"},
-    {"category_id": 22, "category_name": "이용·숙박·여행·오락·스포츠", "feature": "employee"},
-    {"category_id": 23, "category_name": "음식서비스", "feature": "employee"},
-    {"category_id": 24, "category_name": "건설", "feature": "employee"},
-    {"category_id": 25, "category_name": "기계", "feature": "employee"},
-    {"category_id": 26, "category_name": "재료", "feature": "employee"},
-    {"category_id": 27, "category_name": "화학", "feature": "employee"},
-    {"category_id": 28, "category_name": "섬유·의복", "feature": "employee"},
-    {"category_id": 29, "category_name": "전기·전자", "feature": "employee"},
-    {"category_id": 30, "category_name": "정보통신", "feature": "employee"},
-    {"category_id": 31, "category_name": "식품가공", "feature": "employee"},
-    {"category_id": 32, "category_name": "인쇄·목재·가구·공예", "feature": "employee"},
-    {"category_id": 33, "category_name": "환경·에너지·안전", "feature": "employee"},
-    {"category_id": 34, "category_name": "농림어업", "feature": "employee"},
-    {"category_id": 35, "category_name": "연구", "feature": "employee"},
-]
-
-def create_category_index():
-    """
-    Elasticsearch에 'categories' 인덱스를 생성하고,
-    사전에 정의된 CATEGORIES 리스트의 데이터를 색인한다.
-    기존에 'categories' 인덱스가 존재하면 삭제 후 새로 생성한다.
-    인덱스 매핑은 다음과 같다:
-    - category_id: 정수형
-    - category_name: 텍스트, edge_ngram 기반 자동완성(analyzer: autocomplete) 적용
-    - feature: 키워드형, 카테고리 구분용 (예: 'news', 'employee')
-    """
-    index_name = "categories"
-
-    if es.indices.exists(index="categories"):
-        es.indices.delete(index="categories")
-        print(f"🗑️ 기존 Elasticsearch 인덱스 '{index_name}' 삭제 완료")
-
-    index_body = {
-        "settings": {
-            "analysis": {
-                "tokenizer": {
-                    "edge_ngram_tokenizer": {
-                        "type": "edge_ngram",
-                        "min_gram": 2,
-                        "max_gram": 10,
-                        "token_chars": ["letter", "digit"]
-                    }
-                },
-                "analyzer": {
-                    "autocomplete": {
-                        "type": "custom",
-                        "tokenizer": "edge_ngram_tokenizer",
-                        "filter": ["lowercase"]
-                    }
+CATEGORY_ALIAS = "categories"
+SYNC_BATCH_SIZE = 500  # DB에서 한 번에 읽어 bulk 요청 하나로 색인하는 카테고리 수
+WATERMARK_KEY = "synced_until"  # 인덱스 _meta에 저장하는 동기화 워터마크 키
+WATERMARK_SAFETY_MARGIN = timedelta(minutes=5)  # 워터마크보다 늦게 커밋된 변경을 다시 읽기 위한 여유 시간
+
+INDEX_BODY = {
+    "settings": {
+        "analysis": {
+            "tokenizer": {
+                "edge_ngram_tokenizer": {
+                    "type": "edge_ngram",
+                    "min_gram": 2,
+                    "max_gram": 10,
+                    "token_chars": ["letter", "digit"]
+                }
+            },
+            "analyzer": {
+                "autocomplete": {
+                    "type": "custom",
+                    "tokenizer": "edge_ngram_tokenizer",
+                    "filter": ["lowercase"]
                 }
-            }
-        },
-        "mappings": {
-            "properties": {
-                "category_id": {"type": "integer"},
-                "category_name": {
-                    "type": "text",
-                    "analyzer": "autocomplete",  # 색인 시 edge_ngram 기반 분석
-                    "search_analyzer": "standard"  # 검색 시 표준 분석기 사용
-                },
-                "feature": {"type": "keyword"}
             }
         }
+    },
+    "mappings": {
+        "properties": {
+            "category_id": {"type": "integer"},
+            "category_name": {
+                "type": "text",
+                "analyzer": "autocomplete",  # 색인 시 edge_ngram 기반 분석
+                "search_analyzer": "standard"  # 검색 시 표준 분석기 사용
+            },
+            "feature": {"type": "keyword"}
+        }
     }
+}
+
+def index_hash(index_body=None):
+    """
+    인덱스 설정(분석기, 매핑)의 내용 해시(sha256 앞 16자리)를 계산한다.
+    설정이 바뀌면 해시가 달라지므로 새 버전 인덱스를 만들어 전체 재색인해야 함을 알 수 있다.
+    """
+    payload = json.dumps(index_body or INDEX_BODY, ensure_ascii=False, sort_keys=True)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()[:16]
+
+def versioned_index_name(digest):
+    """내용 해시로 버전 인덱스 이름을 만든다. (예: categories-3f2a9c...)"""
+    return f"{CATEGORY_ALIAS}-{digest}"
+
+def read_watermark(client, index):
+    """인덱스 _meta에 저장된 동기화 워터마크를 읽는다. 없으면 None을 반환한다."""
+    for mapping in client.indices.get_mapping(index=index).values():
+        synced_until = mapping.get("mappings", {}).get("_meta", {}).get(WATERMARK_KEY)
+        if synced_until:
+            return datetime.fromisoformat(synced_until)
+    return None
+
+def iter_category_rows(db, since=None):
+    """
+    Category와 Feature를 조인하여 category_id 순으로 SYNC_BATCH_SIZE개씩 스트리밍 조회한다.
+    since가 주어지면 카테고리나 기능 유형의 updated_at이 since - WATERMARK_SAFETY_MARGIN 이후인 행과
+    updated_at이 없는(컬럼 추가 전에 만들어진) 카테고리를 조회한다.
+    워터마크와 같은 시각에 변경된 행을 놓치지 않도록 경계값(>=)을 포함한다.
+    """
+    stmt = (
+        select(
+            Category.category_id,
+            Category.category_name,
+            Feature.feature_type,
+            Category.updated_at,
+            Feature.updated_at.label("feature_updated_at"),
+        )
+        .join(Feature, Category.feature_id == Feature.feature_id)
+        .order_by(Category.category_id)
+        .execution_options(yield_per=SYNC_BATCH_SIZE)
+    )
+    if since is not None:
+        since = since - WATERMARK_SAFETY_MARGIN
+        stmt = stmt.where(or_(Category.updated_at >= since, Feature.updated_at >= since,
+                              Category.updated_at.is_(None)))
+    yield from db.execute(stmt)
+
+def sync_categories(db, client=None, index=CATEGORY_ALIAS, full=False):
+    """
+    데이터베이스의 카테고리를 Elasticsearch 인덱스에 증분 동기화한다.
+
+    - 워터마크 이후 변경된 카테고리만 helpers.bulk로 다시 색인한다 (full=True이면 전체).
+    - 인덱스 문서 수가 데이터베이스보다 많으면 데이터베이스에 없는 카테고리 문서를 삭제한다.
+    - 색인한 행 중 가장 늦은 updated_at을 새 워터마크로 인덱스 _meta에 저장한다.
+
+    Args:
+        db (Session): 데이터베이스 세션 객체.
+        client (Elasticsearch): 사용할 클라이언트 (기본값: 모듈 전역 es).
+        index (str): 동기화할 인덱스 또는 별칭 이름.
+        full (bool): True이면 워터마크를 무시하고 전체 카테고리를 색인한다.
+
+    Returns:
+        dict: indexed(색인한 문서 수), deleted(삭제한 문서 수), watermark(새 워터마크).
+    """
+    client = client or es
+    watermark = None if full else read_watermark(client, index)
+    latest = {"watermark": watermark}
+
+    def actions():
+        for row in iter_category_rows(db, since=watermark):
+            for updated_at in (row.updated_at, row.feature_updated_at):
+                if updated_at is not None and (latest["watermark"] is None or updated_at > latest["watermark"]):
+                    latest["watermark"] = updated_at
+            yield {
+                "_index": index,
+                "_id": row.category_id,
+                "_source": {
+                    "category_id": row.category_id,
+                    "category_name": row.category_name,
+                    "feature": row.feature_type,
+                },
+            }
+
+    indexed, _ = helpers.bulk(client, actions(), chunk_size=SYNC_BATCH_SIZE, refresh="wait_for")
+
+    deleted = 0
+    db_count = db.scalar(select(func.count(Category.category_id)))
+    if client.count(index=index)["count"] > db_count:
+        category_ids = list(db.scalars(select(Category.category_id)))
+        result = client.delete_by_query(
+            index=index,
+            body={"query": {"bool": {"must_not": {"terms": {"category_id": category_ids}}}}},
+            refresh=True,
+        )
+        deleted = result.get("deleted", 0)
+
+    if latest["watermark"] is not None and latest["watermark"] != watermark:
+        client.indices.put_mapping(index=index, body={"_meta": {WATERMARK_KEY: latest["watermark"].isoformat()}})
+
+    print(f"🔄 카테고리 동기화 완료: 색인 {indexed}개, 삭제 {deleted}개 ({index})")
+    return {"indexed": indexed, "deleted": deleted, "watermark": latest["watermark"]}
+
+def create_category_index(db=None, client=None, full=False):
+    """
+    'categories' 별칭이 현재 매핑의 버전 인덱스를 가리키도록 하고, 데이터베이스의 카테고리를 동기화한다.
+
+    - 별칭이 이미 같은 해시의 인덱스를 가리키면 증분 동기화(sync_categories)만 수행한다.
+    - 아니면 새 버전 인덱스를 만들어 전체 카테고리를 색인한 뒤 별칭을 원자적으로 옮기고,
+      이전 버전 인덱스를 삭제한다.
+    - 예전 방식으로 만든 'categories' 실제 인덱스가 있으면 별칭 전환과 같은 요청에서 삭제한다.
+    - 문서 ID를 category_id로 지정하므로, 중간에 실패한 뒤 다시 실행해도 문서가 중복되지 않는다.
+
+    Args:
+        db (Session): 데이터베이스 세션 객체 (기본값: db_manager에서 새 세션을 열고 닫음).
+        client (Elasticsearch): 사용할 클라이언트 (기본값: 모듈 전역 es).
+        full (bool): True이면 매핑이 같아도 전체 카테고리를 다시 색인한다.
+
+    Returns:
+        str: 'categories' 별칭이 가리키는 인덱스 이름. 실패 시 None.
+    """
+    client = client or es
+    index_name = versioned_index_name(index_hash())
+    session = db or db_manager.SessionLocal()
 
     try:
-        es.indices.create(index=index_name, body=index_body)
-        print(f"✅ Elasticsearch 인덱스 '{index_name}' 생성 완료")
+        current_indices = []
+        legacy_index = False
+        if client.indices.exists_alias(name=CATEGORY_ALIAS):
+            current_indices = list(client.indices.get_alias(name=CATEGORY_ALIAS))
+        elif client.indices.exists(index=CATEGORY_ALIAS):
+            legacy_index = True  # 별칭이 아닌 실제 인덱스 (이전 버전에서 생성)
+
+        if index_name in current_indices:
+            sync_categories(session, client, index=CATEGORY_ALIAS, full=full)
+            return index_name
+
+        if not client.indices.exists(index=index_name):
+            client.indices.create(index=index_name, body=INDEX_BODY)
+            print(f"✅ Elasticsearch 인덱스 '{index_name}' 생성 완료")
+
+        sync_categories(session, client, index=index_name, full=True)
+
+        alias_actions = [{"remove": {"index": old, "alias": CATEGORY_ALIAS}} for old in current_indices]
+        if legacy_index:
+            alias_actions.append({"remove_index": {"index": CATEGORY_ALIAS}})
+        alias_actions.append({"add": {"index": index_name, "alias": CATEGORY_ALIAS}})
+        client.indices.update_aliases(body={"actions": alias_actions})
     except Exception as e:
-        print(f"❌ 인덱스 생성 실패: {e}")
-        return
+        print(f"❌ 카테고리 인덱스 갱신 실패: {e}")
+        return None
+    finally:
+        if db is None:
+            session.close()
+
+    print(f"📦 '{CATEGORY_ALIAS}' 별칭이 '{index_name}' 인덱스로 전환됨")
 
-    success_count = 0
-    for cat in CATEGORIES:
+    for old in current_indices:
         try:
-            es.index(index=index_name, document=cat)
-            success_count += 1
+            client.indices.delete(index=old)
+            print(f"🗑️ 이전 Elasticsearch 인덱스 '{old}' 삭제 완료")
         except Exception as e:
-            print(f"⚠️ 색인 실패 (카테고리: {cat['category_name']}): {e}")
+            print(f"⚠️ 이전 인덱스 삭제 실패 ({old}): {e}")
 
-    print(f"📦 총 {success_count}개의 카테고리가 '{index_name}' 인덱스에 색인됨")
+    return index_name
+
+def main():
+    parser = argparse.ArgumentParser(description="데이터베이스 카테고리를 Elasticsearch 인덱스에 동기화")
+    parser.add_argument("--full", action="store_true", help="워터마크를 무시하고 전체 카테고리를 다시 색인합니다.")
+    args = parser.parse_args()
+    create_category_index(full=args.full)
 
 if __name__ == "__main__":
-    """
-    메인 실행 시 create_category_index() 함수를 호출하여
-    Elasticsearch에 'categories' 인덱스를 생성하고 초기 데이터를 색인한다.
-    """
-    create_category_index()
+    main()
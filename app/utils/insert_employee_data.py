@@ -3,10 +3,15 @@ from datetime import datetime, timedelta
 
 import requests
 from dotenv import load_dotenv
+from sqlalchemy import Boolean, delete, literal_column, or_, select, tuple_
 
 from app.models.employee import Employee
 from app.models.employee_category import EmployeeCategory
 from app.models.employee_hire_type import EmployeeHireType
+from app.utils.bulk_upsert import batched, dialect_insert
+from app.utils.feed_materializer import EMPLOYEE_FEED, refresh_feeds
+from app.utils.json_stream import iter_batches, iter_json_array
+from app.utils.response_cache import response_cache
 
 load_dotenv()  # .env 파일 로딩
 
@@ -28,6 +33,16 @@ HIRE_TYPE_CODE_TO_ID = {
 
 API_URL = 'http://apis.data.go.kr/1051000/recruitment/list'
 API_KEY = os.getenv('RECRUIT_API_KEY')
+UPSERT_BATCH_SIZE = 500  # INSERT 한 번에 저장할 최대 행 수
+NUM_OF_ROWS = 100  # 채용 공고 API 페이지당 조회 건수
+MAX_PAGES = 1000  # 잘못된 응답으로 페이지 조회가 끝나지 않는 것을 막기 위한 상한
+STREAM_BATCH_SIZE = 1000  # 스트리밍 모드에서 한 번에 저장하는 공고 수
+STREAM_CHUNK_SIZE = 64 * 1024  # 스트리밍 모드에서 응답 본문을 읽는 단위(바이트)
+
+# 재수집 시 변경 여부를 비교하여 갱신할 employee 컬럼
+EMPLOYEE_UPDATE_COLUMNS = (
+    "title", "institution", "start_date", "end_date", "recrut_se", "detail_url", "recrut_pblnt_sn"
+)
 
 def format_date(date_str):
     """yyyymmdd 형식을 yyyy-mm-dd로 변환합니다."""
@@ -36,14 +51,19 @@ def format_date(date_str):
     except (ValueError, TypeError):
         return None
 
-def fetch_and_insert_recent_jobs(days=1, db_session=None):
+def fetch_and_insert_recent_jobs(days=1, db_session=None, stream=False):
     """
     최근 일정 기간 동안의 채용 공고를 공공기관 API에서 조회하고 DB에 저장합니다.
     NCS 코드에 따라 여러 카테고리에 매핑하여 Employee 데이터를 다중 저장합니다.
 
+    stream=True이면 응답의 result 배열을 점진적으로 파싱하여 STREAM_BATCH_SIZE건씩 저장하므로,
+    조회 기간이 길어 응답이 커져도 최대 메모리 사용량이 일정합니다. 이 경우 배치마다 커밋하며,
+    중간에 실패하면 그때까지 저장한 공고는 유지됩니다 (다시 실행해도 중복 저장되지 않음).
+
     Args:
         days (int): 조회할 과거 일 수 (기본값: 1일 // 하루마다 특정 시점에 자동으로 공고 저장).
         db_session (Session): SQLAlchemy 세션 객체.
+        stream (bool): 응답을 스트리밍으로 파싱하여 배치 단위로 저장할지 여부 (기본값: False).
 
     API Parameters Used:
         pbancBgngYmd (str): 공고 시작일 (yyyymmdd).
@@ -54,33 +74,194 @@ def fetch_and_insert_recent_jobs(days=1, db_session=None):
         acbgCondLst (str): 학력 조건 코드 (예: R7000). // 현재 사용하지 않음
 
     Returns:
-        int: 저장된 채용 공고 수.
+        int: 새로 저장되거나 변경되어 갱신된 채용 공고 수.
 
     Raises:
         requests.RequestException: API 요청 실패 시 발생.
-        ValueError: 날짜 포맷 오류 등 데이터 처리 중 오류 발생 시 발생.
+        SQLAlchemyError: 저장 중 DB 오류 발생 시 발생 (트랜잭션은 롤백됨).
     """
     start_date = (datetime.today() - timedelta(days=days)).strftime('%Y-%m-%d')
     end_date = datetime.today().strftime('%Y-%m-%d')
 
-    params = {
-        'serviceKey': API_KEY,
-        'pbancBgngYmd': start_date,
-        '_type': 'json'
-    }
+    if stream:
+        return _stream_and_insert_jobs(start_date, end_date, db_session)
 
-    response = requests.get(API_URL, params=params)
-    if response.status_code != 200:
-        print(f"❗ API 요청 실패: {response.status_code}")
+    try:
+        result_list = fetch_recruit_jobs(start_date)
+    except requests.RequestException as e:
+        print(f"❗ API 요청 실패: {e}")
+        return 0
+    except ValueError as e:
+        print("❗ JSON 파싱 실패:", e)
+        return 0
+    except RuntimeError as e:
+        print(f"❗ 채용 공고 조회 중단: {e}")
         return 0
 
+    stats = upsert_recruit_jobs(db_session, result_list)
+    saved_count = stats["inserted"] + stats["updated"]
+    print(f"✅ {start_date}부터 {end_date} 기간까지의 채용 공고 중 \n {saved_count}건의 채용 공고가 저장되었습니다. "
+          f"(신규 {stats['inserted']}건, 갱신 {stats['updated']}건, 건너뜀 {stats['skipped']}건)")
+    if saved_count:
+        refresh_feeds(db_session, EMPLOYEE_FEED, job_category_ids(result_list))
+        response_cache.invalidate(EMPLOYEE_FEED)
+    return saved_count
+
+def _stream_and_insert_jobs(start_date, end_date, db_session):
+    """채용 공고를 스트리밍으로 조회하며 STREAM_BATCH_SIZE건씩 저장하고 저장된 공고 수를 반환합니다."""
+    totals = {"inserted": 0, "updated": 0, "skipped": 0}
+    category_ids = set()
     try:
-        result_list = response.json().get('result', [])
-    except Exception as e:
+        for batch in iter_batches(iter_recruit_jobs(start_date), STREAM_BATCH_SIZE):
+            stats = upsert_recruit_jobs(db_session, batch)
+            category_ids |= job_category_ids(batch)
+            for key in totals:
+                totals[key] += stats[key]
+    except requests.RequestException as e:
+        print(f"❗ API 요청 실패: {e}")
+    except ValueError as e:
         print("❗ JSON 파싱 실패:", e)
-        return 0
+    except RuntimeError as e:
+        print(f"❗ 채용 공고 조회 중단: {e}")
+
+    saved_count = totals["inserted"] + totals["updated"]
+    print(f"✅ {start_date}부터 {end_date} 기간까지의 채용 공고 중 \n {saved_count}건의 채용 공고가 저장되었습니다. "
+          f"(신규 {totals['inserted']}건, 갱신 {totals['updated']}건, 건너뜀 {totals['skipped']}건)")
+    if saved_count:
+        refresh_feeds(db_session, EMPLOYEE_FEED, category_ids)
+        response_cache.invalidate(EMPLOYEE_FEED)
+    return saved_count
+
+def iter_recruit_jobs(start_date, num_of_rows=NUM_OF_ROWS, get=None):
+    """
+    fetch_recruit_jobs와 같은 방식으로 페이지를 조회하되, 응답 본문을 스트리밍으로 읽어
+    result 배열의 공고를 하나씩 반환합니다. 응답 전체를 메모리에 올리지 않으므로
+    numOfRows가 매우 큰 요청에도 메모리 사용량이 공고 하나 크기 수준으로 유지됩니다.
+
+    result 배열 이후의 totalCount는 읽지 않으므로, 조회 건수가 numOfRows보다 적은 페이지에서 멈춥니다.
+
+    Args:
+        start_date (str): 공고 시작일 (yyyy-mm-dd).
+        num_of_rows (int): 페이지당 조회 건수.
+        get (callable): HTTP GET 함수 (기본값: requests.get).
+
+    Yields:
+        dict: 채용 공고 API 응답의 result 원소.
+
+    Raises:
+        requests.RequestException: API 요청 실패 또는 200이 아닌 응답일 경우.
+        ValueError: 응답 JSON 형식이 올바르지 않을 경우.
+        RuntimeError: MAX_PAGES 페이지를 조회해도 끝나지 않은 경우.
+    """
+    get = get or requests.get
+    for page_no in range(1, MAX_PAGES + 1):
+        params = {
+            'serviceKey': API_KEY,
+            'pbancBgngYmd': start_date,
+            'numOfRows': num_of_rows,
+            'pageNo': page_no,
+            '_type': 'json'
+        }
+        response = get(API_URL, params=params, timeout=30, stream=True)
+        try:
+            if response.status_code != 200:
+                raise requests.HTTPError(f"{response.status_code} ({start_date}, page {page_no})")
+
+            page_size = 0
+            for job in iter_json_array(response.iter_content(STREAM_CHUNK_SIZE), 'result'):
+                page_size += 1
+                yield job
+        finally:
+            response.close()
+
+        if page_size < num_of_rows:
+            break
+    else:
+        raise RuntimeError(f"{MAX_PAGES}페이지를 조회해도 끝나지 않았습니다. ({start_date})")
+
+def job_start_ymd(job):
+    """채용 공고 API 결과의 공고 시작일을 yyyymmdd 문자열로 반환합니다 (없으면 빈 문자열)."""
+    return (job.get('pbancBgngYmd') or '').replace('-', '')
+
+def fetch_recruit_jobs(start_date, num_of_rows=NUM_OF_ROWS, get=None, until=None):
+    """
+    공고 시작일 기준으로 채용 공고 API를 numOfRows/pageNo 페이지 단위로 모두 조회합니다.
+    마지막 페이지(조회 건수가 numOfRows보다 적음)나 totalCount에 도달하면 멈춥니다.
+
+    API의 pbancBgngYmd 조건은 그 날짜 "이후" 공고를 모두 돌려주므로, until을 주면 공고 시작일이 until보다
+    늦은 공고가 나온 페이지에서도 멈춥니다. 지금까지 받은 공고가 공고 시작일 오름차순일 때만 멈추며,
+    순서가 다르면 뒤 페이지에 until 이전 공고가 남아 있을 수 있으므로 끝까지 조회합니다.
+
+    Args:
+        start_date (str): 공고 시작일 (yyyy-mm-dd).
+        num_of_rows (int): 페이지당 조회 건수.
+        get (callable): HTTP GET 함수 (기본값: requests.get, 병렬 조회 시 requests.Session.get).
+        until (str | None): 필요한 마지막 공고 시작일 (yyyymmdd).
+
+    Returns:
+        list: 조회한 모든 페이지의 채용 공고 목록 (until을 주면 until 이후 공고가 일부 포함될 수 있음).
 
-    inserted_count = 0
+    Raises:
+        requests.RequestException: API 요청 실패 또는 200이 아닌 응답일 경우.
+        ValueError: 응답 JSON 파싱 실패 시.
+        RuntimeError: MAX_PAGES 페이지를 조회해도 끝나지 않은 경우 (일부만 조회된 결과를 저장하지 않도록).
+    """
+    get = get or requests.get
+    result_list = []
+    ascending = True
+    for page_no in range(1, MAX_PAGES + 1):
+        params = {
+            'serviceKey': API_KEY,
+            'pbancBgngYmd': start_date,
+            'numOfRows': num_of_rows,
+            'pageNo': page_no,
+            '_type': 'json'
+        }
+        response = get(API_URL, params=params, timeout=30)
+        if response.status_code != 200:
+            raise requests.HTTPError(f"{response.status_code} ({start_date}, page {page_no})")
+
+        body = response.json()
+        page = body.get('result') or []
+        result_list.extend(page)
+
+        total_count = body.get('totalCount')
+        if len(page) < num_of_rows or (total_count is not None and len(result_list) >= int(total_count)):
+            break
+        if until is not None:
+            starts = [job_start_ymd(job) for job in result_list[-len(page) - 1:]]
+            ascending = ascending and starts == sorted(starts)
+            if ascending and starts[-1] > until:
+                break
+    else:
+        raise RuntimeError(f"{MAX_PAGES}페이지를 조회해도 끝나지 않았습니다. ({start_date})")
+    return result_list
+
+def job_category_ids(result_list):
+    """채용 공고 API 결과의 NCS 코드에 매핑되는 카테고리 ID 집합을 반환합니다 (피드 갱신 대상 선정용)."""
+    return {
+        NCS_CATEGORY_MAP[code]
+        for job in result_list
+        for code in (job.get("ncsCdLst") or "").split(",")
+        if code in NCS_CATEGORY_MAP
+    }
+
+def parse_recruit_jobs(result_list):
+    """
+    API 결과를 employee / employee_category / employee_hire_type 테이블 행 배열로 변환합니다.
+    같은 공고가 여러 번 포함되면 마지막 값을 사용하고, 연결 정보는 합칩니다.
+
+    Args:
+        result_list (list): 채용 공고 API 응답의 result 목록.
+
+    Returns:
+        tuple: (employee 행 목록, employee_category 행 목록, employee_hire_type 행 목록,
+            카테고리 매핑이 없거나 필수 값이 잘못되어 건너뛴 공고 수).
+    """
+    employees = {}
+    category_links = set()
+    hire_type_links = set()
+    skipped = 0
 
     for job in result_list:
         try:
@@ -100,49 +281,135 @@ def fetch_and_insert_recent_jobs(days=1, db_session=None):
 
             # 매핑된 category_id가 하나도 없으면 해당 공고는 저장하지 않음
             if not matched_category_ids:
+                skipped += 1
                 continue
 
             # 채용 공고 고유번호 (recruit_id) 추출 및 정수형 변환
             recruit_id = int(job["recrutPblntSn"])
 
-            # employee 테이블에 채용 공고 기본 정보 저장
-            merged_employee = Employee(
-                recruit_id=recruit_id,
-                title=job.get("recrutPbancTtl", ""),            # 공고 제목
-                institution=job.get("instNm", ""),               # 기관명
-                start_date=format_date(job.get("pbancBgngYmd")), # 시작일
-                end_date=format_date(job.get("pbancEndYmd")),    # 마감일
-                recrut_se=job.get("recrutSe", ""),               # 공고 구분
-                detail_url=f"https://opendata.alio.go.kr/recruit?sn={recruit_id}",  # 상세 URL
-                recrut_pblnt_sn=recruit_id                       # 공고번호
-            )
-            db_session.merge(merged_employee)
+            start_date = format_date(job.get("pbancBgngYmd"))  # 시작일
+            end_date = format_date(job.get("pbancEndYmd"))      # 마감일
+            if start_date is None or end_date is None:
+                raise ValueError(f"공고 기간이 올바르지 않습니다. ({recruit_id})")
+
+        except (KeyError, TypeError, ValueError) as e:
+            # 예외 발생 시 해당 공고 저장 건너뛰고 에러 메시지 출력
+            print(f"⚠️ 저장 실패: {e}")
+            skipped += 1
+            continue
+
+        # employee 테이블에 저장할 채용 공고 기본 정보
+        employees[recruit_id] = {
+            "recruit_id": recruit_id,
+            "title": job.get("recrutPbancTtl", ""),            # 공고 제목
+            "institution": job.get("instNm", ""),               # 기관명
+            "start_date": start_date,
+            "end_date": end_date,
+            "recrut_se": job.get("recrutSe", ""),               # 공고 구분
+            "detail_url": f"https://opendata.alio.go.kr/recruit?sn={recruit_id}",  # 상세 URL
+            "recrut_pblnt_sn": recruit_id                       # 공고번호
+        }
+
+        # employee_category 연결 정보 (NCS → category_id)
+        category_links.update((recruit_id, category_id) for category_id in matched_category_ids)
+
+        # employee_hire_type 연결 정보 (고용형태 → hire_type_id)
+        for hire_code in hire_type_list:
+            hire_type_id = HIRE_TYPE_CODE_TO_ID.get(hire_code)
+            if hire_type_id:
+                hire_type_links.add((recruit_id, hire_type_id))
+
+    return (
+        list(employees.values()),
+        [{"recruit_id": recruit_id, "category_id": category_id}
+         for recruit_id, category_id in sorted(category_links)],
+        [{"recruit_id": recruit_id, "hire_type_id": hire_type_id}
+         for recruit_id, hire_type_id in sorted(hire_type_links)],
+        skipped,
+    )
+
+def upsert_recruit_jobs(db_session, result_list, batch_size=UPSERT_BATCH_SIZE):
+    """
+    채용 공고 API 결과를 배치 단위 INSERT ... ON CONFLICT로 한 트랜잭션 안에서 저장합니다.
 
-            # employee_category 테이블에 연결 정보 저장 (NCS → category_id)
-            for category_id in matched_category_ids:
-                db_session.add(EmployeeCategory(
-                    recruit_id=recruit_id,
-                    category_id=category_id
+    employee는 recruit_id 충돌 시 값이 달라진 컬럼이 있을 때만 갱신하고(ON CONFLICT DO UPDATE ... WHERE),
+    employee_category / employee_hire_type은 이미 있는 연결을 무시합니다(ON CONFLICT DO NOTHING).
+    따라서 같은 기간을 다시 수집해도 기본 키 충돌 없이 실행됩니다. 이미 있던 공고의 NCS 코드나 고용형태가
+    바뀌었으면, 이번 응답에 없는 연결은 먼저 삭제합니다.
+
+    신규/갱신 구분은 PostgreSQL에서는 RETURNING (xmax = 0)으로 같은 INSERT 문에서 얻고,
+    xmax가 없는 SQLite에서는 INSERT 전에 기존 공고를 조회합니다.
+
+    Args:
+        db_session (Session): SQLAlchemy 세션 객체.
+        result_list (list): 채용 공고 API 응답의 result 목록.
+        batch_size (int): INSERT 한 번에 저장할 최대 행 수.
+
+    Returns:
+        dict: inserted(신규 저장), updated(변경되어 갱신), skipped(매핑 실패·잘못된 값·변경 없음) 공고 수.
+
+    Raises:
+        SQLAlchemyError: 저장 중 DB 오류 발생 시 (트랜잭션은 롤백됨).
+    """
+    employees, category_links, hire_type_links, skipped = parse_recruit_jobs(result_list)
+    postgresql = db_session.get_bind().dialect.name == "postgresql"
+    inserted_ids = set()
+    updated = 0
+
+    try:
+        for batch in batched(employees, batch_size):
+            stmt = dialect_insert(db_session, Employee).values(batch)
+            stmt = stmt.on_conflict_do_update(
+                index_elements=[Employee.recruit_id],
+                set_={column: stmt.excluded[column] for column in EMPLOYEE_UPDATE_COLUMNS},
+                where=or_(*(
+                    getattr(Employee, column).is_distinct_from(stmt.excluded[column])
+                    for column in EMPLOYEE_UPDATE_COLUMNS
+                )),
+            )
+            if postgresql:
+                # 새로 INSERT된 행은 xmax가 0, ON CONFLICT로 갱신된 행은 갱신한 트랜잭션 ID
+                written = dict(db_session.execute(
+                    stmt.returning(Employee.recruit_id, literal_column("xmax = 0", Boolean))
+                ).all())
+            else:
+                existing_ids = set(db_session.scalars(
+                    select(Employee.recruit_id).where(Employee.recruit_id.in_([row["recruit_id"] for row in batch]))
                 ))
+                written = {
+                    recruit_id: recruit_id not in existing_ids
+                    for recruit_id in db_session.scalars(stmt.returning(Employee.recruit_id))
+                }
 
-            # employee_hire_type 테이블에 연결 정보 저장 (고용형태 → hire_type_id)
-            for hire_code in hire_type_list:
-                hire_type_id = HIRE_TYPE_CODE_TO_ID.get(hire_code)
-                if hire_type_id:
-                    db_session.add(EmployeeHireType(
-                        recruit_id=recruit_id,
-                        hire_type_id=hire_type_id
-                    ))
+            inserted_ids.update(recruit_id for recruit_id, is_new in written.items() if is_new)
+            updated += len(written) - sum(written.values())
+            skipped += len(batch) - len(written)  # 기존 값과 같아 갱신하지 않은 공고
 
-            # 정상적으로 하나의 공고 저장 완료 시 카운트 증가
-            inserted_count += 1
+        existing_ids = [row["recruit_id"] for row in employees if row["recruit_id"] not in inserted_ids]
+        for model, column, links in (
+            (EmployeeCategory, "category_id", category_links),
+            (EmployeeHireType, "hire_type_id", hire_type_links),
+        ):
+            _delete_stale_links(db_session, model, column, existing_ids, links, batch_size)
+            for batch in batched(links, batch_size):
+                db_session.execute(dialect_insert(db_session, model).values(batch).on_conflict_do_nothing())
 
-        except Exception as e:
-            # 예외 발생 시 해당 공고 저장 건너뛰고 에러 메시지 출력
-            print(f"⚠️ 저장 실패: {e}")
-            continue
+        db_session.commit()
+    except Exception:
+        db_session.rollback()
+        raise
+
+    return {"inserted": len(inserted_ids), "updated": updated, "skipped": skipped}
+
+def _delete_stale_links(db_session, model, column, recruit_ids, links, batch_size):
+    """recruit_ids 공고의 연결(model) 중 이번 응답의 links에 없는 연결을 삭제합니다."""
+    fresh = {}
+    for link in links:
+        fresh.setdefault(link["recruit_id"], []).append((link["recruit_id"], link[column]))
 
-    # 전체 커밋 (성공적으로 추가된 공고들 반영)
-    db_session.commit()
-    print(f"✅ {start_date}부터 {end_date} 기간까지의 채용 공고 중 \n {inserted_count}건의 채용 공고가 저장되었습니다.")
-    return inserted_count
+    for batch in batched(recruit_ids, batch_size):
+        stmt = delete(model).where(model.recruit_id.in_(batch))
+        pairs = [pair for recruit_id in batch for pair in fresh.get(recruit_id, ())]
+        if pairs:
+            stmt = stmt.where(tuple_(model.recruit_id, getattr(model, column)).not_in(pairs))
+        db_session.execute(stmt, execution_options={"synchronize_session": False})
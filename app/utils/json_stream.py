@@ -0,0 +1,128 @@
+"""JSON 응답 스트리밍 파싱 모듈.
+
+큰 JSON 응답 전체를 메모리에 올리지 않고, 최상위 객체의 특정 배열(예: "result")에 들어 있는
+원소를 하나씩 파싱하여 반환합니다. 외부 의존성 없이 json.JSONDecoder.raw_decode를 사용하며,
+버퍼에는 아직 처리하지 않은 부분만 유지하므로 메모리 사용량은 원소 하나의 크기에 비례합니다.
+"""
+
+import codecs
+import json
+import re
+from itertools import islice
+from typing import Iterable, Iterator
+
+_WHITESPACE = re.compile(r"[ \t\n\r]*")
+_NUMBER_CHARS = re.compile(r"[0-9.eE+\-]*")
+_DECODER = json.JSONDecoder()
+
+
+class _StreamReader:
+    """바이트 청크를 UTF-8로 디코딩하며 필요한 만큼만 버퍼에 채우는 읽기 도우미."""
+
+    def __init__(self, chunks: Iterable[bytes]):
+        self._chunks = iter(chunks)
+        self._decoder = codecs.getincrementaldecoder("utf-8")()
+        self.buffer = ""
+        self.pos = 0
+        self.eof = False
+
+    def fill(self) -> bool:
+        """다음 청크를 읽어 버퍼에 추가합니다. 더 읽을 데이터가 없으면 False를 반환합니다."""
+        if self.eof:
+            return False
+        chunk = next(self._chunks, None)
+        if chunk is None:
+            self.eof = True
+            text = self._decoder.decode(b"", final=True)
+        else:
+            text = self._decoder.decode(chunk)
+        self.buffer = self.buffer[self.pos:] + text
+        self.pos = 0
+        return chunk is not None or bool(text)
+
+    def peek(self):
+        """공백을 건너뛰고 다음 문자를 반환합니다. 입력이 끝났으면 None을 반환합니다."""
+        while True:
+            self.pos = _WHITESPACE.match(self.buffer, self.pos).end()
+            if self.pos < len(self.buffer):
+                return self.buffer[self.pos]
+            if not self.fill():
+                return None
+
+    def expect(self, char: str):
+        found = self.peek()
+        if found != char:
+            raise ValueError(f"JSON 형식 오류: '{char}' 위치에 {found!r}")
+        self.pos += 1
+
+    def decode_value(self):
+        """현재 위치의 JSON 값 하나를 파싱합니다. 값이 버퍼 끝에 걸쳐 있으면 더 읽어 다시 시도합니다."""
+        self.peek()
+        while True:
+            try:
+                value, end = _DECODER.raw_decode(self.buffer, self.pos)
+            except json.JSONDecodeError:
+                if not self.fill():
+                    raise
+                continue
+            # 숫자는 청크 경계에서 잘렸을 수 있으므로 뒤에 구분자가 보일 때까지 더 읽은 뒤 확정
+            is_number = isinstance(value, (int, float)) and not isinstance(value, bool)
+            if is_number and _NUMBER_CHARS.match(self.buffer, end).end() == len(self.buffer) and self.fill():
+                continue
+            self.pos = end
+            return value
+
+
+def iter_json_array(chunks: Iterable[bytes], key: str) -> Iterator:
+    """최상위 JSON 객체에서 key 배열의 원소를 하나씩 파싱하여 반환합니다.
+
+    key 이전의 값은 파싱 후 버리고, 배열을 모두 읽으면 나머지 입력은 읽지 않습니다.
+    key가 없거나 값이 null이면 아무것도 반환하지 않습니다.
+
+    Args:
+        chunks (Iterable[bytes]): 응답 본문 바이트 청크 (예: response.iter_content()).
+        key (str): 원소를 꺼낼 최상위 배열의 키.
+
+    Yields:
+        Any: 배열 원소.
+
+    Raises:
+        ValueError: JSON 형식이 올바르지 않은 경우 (json.JSONDecodeError 포함).
+    """
+    reader = _StreamReader(chunks)
+    reader.expect("{")
+    if reader.peek() == "}":
+        return
+
+    while True:
+        name = reader.decode_value()
+        reader.expect(":")
+        if name == key:
+            if reader.peek() == "n":
+                reader.decode_value()  # null
+                return
+            reader.expect("[")
+            if reader.peek() == "]":
+                return
+            while True:
+                yield reader.decode_value()
+                separator = reader.peek()
+                reader.pos += 1
+                if separator == "]":
+                    return
+                if separator != ",":
+                    raise ValueError(f"JSON 형식 오류: 배열 구분자 위치에 {separator!r}")
+        reader.decode_value()  # key가 아닌 값은 건너뜀
+        separator = reader.peek()
+        reader.pos += 1
+        if separator == "}":
+            return
+        if separator != ",":
+            raise ValueError(f"JSON 형식 오류: 객체 구분자 위치에 {separator!r}")
+
+
+def iter_batches(items: Iterable, size: int) -> Iterator[list]:
+    """items를 최대 size개씩 묶어 리스트로 반환합니다."""
+    iterator = iter(items)
+    while batch := list(islice(iterator, size)):
+        yield batch
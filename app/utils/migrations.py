@@ -0,0 +1,98 @@
+"""기존 데이터베이스에 스키마 변경을 반영하는 마이그레이션 모듈.
+
+Base.metadata.create_all()은 이미 존재하는 테이블에 새 컬럼이나 인덱스를 추가하지 않으므로,
+모델에 선언된 컬럼과 인덱스 중 데이터베이스에 없는 것을 찾아 생성하고, 새 인덱스로 대체된 인덱스를 삭제합니다.
+app.utils.setup_database 명령에서 테이블 생성 직후 실행됩니다.
+"""
+
+from sqlalchemy import inspect, text
+from sqlalchemy.schema import CreateColumn
+
+from app.models.base import Base
+
+# 모델에서 다른 인덱스로 대체되어 더 이상 쓰지 않는 인덱스 {테이블: [인덱스 이름]}
+OBSOLETE_INDEXES = {
+    "employee": ["ix_employee_start_date_end_date"],  # → ix_employee_start_date_recruit_id
+    "news": ["ix_news_category_id_publish_date"],  # → ix_news_category_id_publish_date_news_id
+}
+
+
+def add_missing_columns(engine):
+    """모델에 선언되었지만 데이터베이스에 없는 컬럼을 ALTER TABLE ... ADD COLUMN으로 추가합니다.
+
+    기존 행에는 값이 채워지지 않으므로, NULL을 허용하는 컬럼에만 사용해야 합니다.
+
+    Args:
+        engine: 마이그레이션을 적용할 SQLAlchemy 엔진.
+
+    Returns:
+        list[str]: 새로 추가한 "테이블.컬럼" 목록.
+    """
+    inspector = inspect(engine)
+    added = []
+    with engine.begin() as conn:
+        for table in Base.metadata.sorted_tables:
+            if not inspector.has_table(table.name):
+                continue
+            existing = {column["name"] for column in inspector.get_columns(table.name)}
+            for column in table.columns:
+                if column.name not in existing:
+                    column_spec = CreateColumn(column).compile(dialect=engine.dialect)
+                    conn.execute(text(f"ALTER TABLE {table.name} ADD COLUMN {column_spec}"))
+                    added.append(f"{table.name}.{column.name}")
+
+    for name in added:
+        print(f"🧱 컬럼 추가: {name}")
+    return added
+
+
+def create_missing_indexes(engine):
+    """모델에 선언되었지만 데이터베이스에 없는 인덱스를 생성합니다.
+
+    Args:
+        engine: 마이그레이션을 적용할 SQLAlchemy 엔진.
+
+    Returns:
+        list[str]: 새로 생성한 인덱스 이름 목록.
+    """
+    inspector = inspect(engine)
+    created = []
+    with engine.begin() as conn:
+        for table in Base.metadata.sorted_tables:
+            if not inspector.has_table(table.name):
+                continue
+            existing = {index["name"] for index in inspector.get_indexes(table.name)}
+            for index in sorted(table.indexes, key=lambda index: index.name):
+                if index.name not in existing:
+                    index.create(bind=conn)
+                    created.append(index.name)
+
+    for name in created:
+        print(f"🧱 인덱스 생성: {name}")
+    return created
+
+
+def drop_obsolete_indexes(engine):
+    """OBSOLETE_INDEXES에 등록된 인덱스 중 데이터베이스에 남아 있는 것을 삭제합니다.
+
+    Args:
+        engine: 마이그레이션을 적용할 SQLAlchemy 엔진.
+
+    Returns:
+        list[str]: 삭제한 인덱스 이름 목록.
+    """
+    inspector = inspect(engine)
+    dropped = []
+    with engine.begin() as conn:
+        for table_name, index_names in OBSOLETE_INDEXES.items():
+            if not inspector.has_table(table_name):
+                continue
+            existing = {index["name"] for index in inspector.get_indexes(table_name)}
+            for name in index_names:
+                if name in existing:
+                    conn.execute(text(f"DROP INDEX IF EXISTS {name}"))
+                    dropped.append(name)
+
+    for name in dropped:
+        print(f"🧹 인덱스 삭제: {name}")
+    return dropped
@@ -1,23 +1,39 @@
 import hashlib
 import logging
 import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime
 from urllib.parse import urlparse
 
 import requests
 import yaml
 from fastapi import Depends
+from requests.adapters import HTTPAdapter
 from sqlalchemy.orm import Session
+from urllib3.util.retry import Retry
 
 from app.models.category import Category
 from app.models.news import News
+from app.models.news_crawl_state import NewsCrawlState
+from app.utils.bulk_upsert import batched, dialect_insert
+from app.utils.catalog_cache import catalog_cache
 from app.utils.db_manager import db_manager
+from app.utils.feed_materializer import NEWS_FEED, refresh_feeds
+from app.utils.news_partitions import ensure_partitions_for
+from app.utils.response_cache import response_cache
 
 logger = logging.getLogger(__name__)
 
-NAVER_API_URL = 'https://openapi.naver.com/v1/search/news.json'
+NAVER_API_URL = os.getenv('NAVER_API_URL', 'https://openapi.naver.com/v1/search/news.json')
 NAVER_CLIENT_ID = os.getenv('NAVER_CLIENT_ID')
 NAVER_CLIENT_SECRET = os.getenv('NAVER_CLIENT_SECRET')
+NAVER_MAX_WORKERS = int(os.getenv('NAVER_MAX_WORKERS') or 8)
+NAVER_RATE_LIMIT = float(os.getenv('NAVER_RATE_LIMIT') or 10)  # 초당 최대 요청 수
+NEWS_INSERT_BATCH_SIZE = int(os.getenv('NEWS_INSERT_BATCH_SIZE') or 500)
+NAVER_MAX_PAGES = int(os.getenv('NAVER_MAX_PAGES') or 10)  # 카테고리별 한 번에 조회할 최대 페이지 수
+NAVER_MAX_START = 1000  # 네이버 검색 API의 start 최대값
 
 yaml_path = os.path.join("/app/utils/news_provider_mapping.yaml")
 db_dependency = Depends(db_manager.get_db)
@@ -29,23 +45,309 @@ def get_subscribed_news_list(
     limit: int = 10,
     db: Session = db_dependency
 ):
-    categories = db.query(Category).all()
-    saved_count = 0
-    for category in categories:
-        news_list = get_news_list_from_naver(category, limit)
+    return ingest_subscribed_news(db, limit)
+
+
+class RateLimiter:
+    """여러 스레드가 공유하는 초당 요청 수 제한기.
+
+    요청 시작 시각을 1 / rate 초 간격으로 배정하여, 동시에 호출되어도
+    전체 요청 속도가 rate를 넘지 않도록 합니다. rate가 0 이하이면 제한하지 않습니다.
+    """
+
+    def __init__(self, rate: float, clock=time.monotonic, sleep=time.sleep):
+        self.interval = 1.0 / rate if rate > 0 else 0.0
+        self._clock = clock
+        self._sleep = sleep
+        self._lock = threading.Lock()
+        self._next_slot = 0.0
+
+    def acquire(self):
+        """다음 요청 가능 시각까지 대기합니다."""
+        if not self.interval:
+            return
+        with self._lock:
+            now = self._clock()
+            slot = max(now, self._next_slot)
+            self._next_slot = slot + self.interval
+        if slot > now:
+            self._sleep(slot - now)
+
+
+def create_naver_session(pool_size: int = NAVER_MAX_WORKERS) -> requests.Session:
+    """커넥션을 재사용하는 네이버 검색 API용 HTTP 세션을 생성합니다.
+
+    워커 수만큼 keep-alive 커넥션을 유지하고, 429/5xx 응답은 지수 백오프로 재시도합니다.
+    """
+    session = requests.Session()
+    retry = Retry(total=3, backoff_factor=0.5, status_forcelist=(429, 500, 502, 503, 504),
+                  allowed_methods=frozenset(["GET"]))
+    adapter = HTTPAdapter(pool_connections=1, pool_maxsize=pool_size, max_retries=retry)
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    session.headers.update({
+        "X-Naver-Client-Id": NAVER_CLIENT_ID or "",
+        "X-Naver-Client-Secret": NAVER_CLIENT_SECRET or "",
+    })
+    return session
+
+
+def ingest_subscribed_news(db: Session, limit: int = 10, max_workers: int = NAVER_MAX_WORKERS,
+                           rate: float = NAVER_RATE_LIMIT, batch_size: int = NEWS_INSERT_BATCH_SIZE,
+                           session: requests.Session = None, max_pages: int = NAVER_MAX_PAGES) -> dict:
+    """모든 카테고리의 새 뉴스를 동시에 수집하여 일괄 저장합니다.
+
+    카테고리별 네이버 API 호출을 스레드풀에서 공유 HTTP 세션과 속도 제한기로 실행합니다.
+    각 카테고리는 저장된 워터마크(news_crawl_state)에 도달할 때까지 페이지를 넘기며
+    새 기사만 수집하며, 페이지 한도로 워터마크에 도달하지 못하면 다음 수집에서 남은 구간부터
+    이어서 조회합니다(crawl_category_news). 수집한 기사를 news_id 기준으로 메모리에서
+    중복 제거(발행일이 없는 기사는 제외)한 뒤 배치 단위 INSERT ... ON CONFLICT DO NOTHING으로
+    저장하고, 같은 트랜잭션에서 워터마크를 갱신합니다. 일부 카테고리 호출이 실패해도
+    나머지 카테고리의 뉴스는 저장하며, 실패한 카테고리의 워터마크는 그대로 둡니다.
+
+    Args:
+        db (Session): 데이터베이스 세션 객체.
+        limit (int): 페이지당 조회할 뉴스 수 (네이버 display, 최대 100).
+        max_workers (int): 동시에 호출할 최대 카테고리 수.
+        rate (float): 초당 최대 API 요청 수.
+        batch_size (int): INSERT 한 번에 저장할 최대 행 수.
+        session (requests.Session): 사용할 HTTP 세션. 없으면 새로 생성합니다.
+        max_pages (int): 카테고리별 한 번에 조회할 최대 페이지 수.
+
+    Returns:
+        dict: fetched(수집), unique(중복 제거 후), saved(신규 저장), pages(API 요청 수),
+            failed(실패 카테고리 이름) 값.
+    """
+    categories = catalog_cache.get(db).categories.values()
+    states = {state.category_id: state for state in db.query(NewsCrawlState).all()}
+    owns_session = session is None
+    session = session or create_naver_session(max_workers)
+    limiter = RateLimiter(rate)
+
+    rows_by_id = {}
+    fetched = 0
+    pages = 0
+    failed = []
+    try:
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = {
+                executor.submit(crawl_category_news, session, limiter, category.category_id,
+                                category.category_name, _position_of(states.get(category.category_id)),
+                                limit, max_pages): category
+                for category in categories
+            }
+            for future in as_completed(futures):
+                category = futures[future]
+                try:
+                    rows, requested, position = future.result()
+                except requests.RequestException as e:
+                    logger.warning(f"뉴스 수집 실패 ({category.category_name}): {e}")
+                    failed.append(category.category_name)
+                    continue
+                fetched += len(rows)
+                pages += requested
+                _save_position(db, states, category.category_id, position)
+                for row in rows:
+                    if row["publish_date"] is None:  # NOT NULL 컬럼이므로 배치 전체가 실패하지 않도록 제외
+                        continue
+                    rows_by_id.setdefault(row["news_id"], row)
+    finally:
+        if owns_session:
+            session.close()
+
+    saved_count = bulk_insert_news(db, list(rows_by_id.values()), batch_size)  # 워터마크 갱신도 함께 커밋
+    logger.info(f"{saved_count}개의 뉴스 저장 완료 (수집 {fetched}개, 중복 제거 후 {len(rows_by_id)}개, "
+                f"API 요청 {pages}회)")
+    if saved_count:
+        refresh_feeds(db, NEWS_FEED, {row["category_id"] for row in rows_by_id.values()})
+        response_cache.invalidate(NEWS_FEED)
+    return {"fetched": fetched, "unique": len(rows_by_id), "saved": saved_count, "pages": pages,
+            "failed": failed}
+
+
+_EMPTY_POSITION = {"watermark": None, "pending": None, "resume_start": None, "resume_publish_date": None}
+
+
+def crawl_category_news(session: requests.Session, limiter: RateLimiter, category_id: int, category_name: str,
+                        position: dict = None, display: int = 10, max_pages: int = NAVER_MAX_PAGES):
+    """한 카테고리의 최신 뉴스를 워터마크에 도달할 때까지 페이지 단위로 수집합니다.
+
+    최신순(sort=date)으로 start를 display씩 늘려 가며 조회하고, 워터마크 링크를 만나거나
+    워터마크보다 오래된 기사가 나오면 즉시 멈춥니다. 워터마크가 없는 첫 수집은 첫 페이지만 조회합니다.
+
+    워터마크에 도달하기 전에 max_pages에 걸리면 워터마크는 그대로 두고, 이번에 수집한 가장 최신 기사(pending)와
+    이어서 조회할 위치(resume_start, 수집한 가장 오래된 기사 작성일 resume_publish_date)를 반환합니다.
+    다음 수집은 그 위치부터 워터마크까지 남은 구간을 먼저 채우고(그 사이 새 기사로 밀려 다시 보이는
+    resume_publish_date 이후 기사는 건너뜀), 구간을 모두 채우면 pending을 워터마크로 삼아 최신 기사를 수집합니다.
+    네이버 start 한도(NAVER_MAX_START)를 넘는 구간은 조회할 수 없으므로 경고를 남기고 채운 것으로 처리합니다.
+
+    Args:
+        session (requests.Session): 네이버 API 호출에 사용할 HTTP 세션.
+        limiter (RateLimiter): 요청 속도 제한기.
+        category_id (int): 카테고리 ID.
+        category_name (str): 검색어로 사용할 카테고리 이름.
+        position (dict): 저장된 수집 위치 (_position_of). 첫 수집이면 None.
+        display (int): 페이지당 조회할 뉴스 수.
+        max_pages (int): 조회할 최대 페이지 수.
+
+    Returns:
+        tuple: (새 기사 행 목록, API 요청 수, 저장할 수집 위치). 수집 위치가 바뀌지 않으면 None.
+    """
+    if position is None:
+        rows, pages, _ = _crawl_pages(session, limiter, category_id, category_name, display, 1, 1)
+        newest = _newest(rows)
+        return rows, pages, newest and {**_EMPTY_POSITION, "watermark": newest}
+
+    rows = []
+    pages = 0
+    if position["resume_start"]:
+        rows, pages, next_start = _crawl_pages(session, limiter, category_id, category_name, display,
+                                               position["resume_start"], max_pages, position["watermark"],
+                                               newer_than=position["resume_publish_date"])
+        if next_start:
+            logger.warning(f"이전 수집 구간을 채우는 중 페이지 한도에 도달했습니다. ({category_name}, {pages}페이지)")
+            oldest = _oldest(rows)
+            return rows, pages, {**position, "resume_start": next_start,
+                                 "resume_publish_date": oldest or position["resume_publish_date"]}
+        position = {**_EMPTY_POSITION, "watermark": position["pending"]}
+        if pages >= max_pages:
+            return rows, pages, position
+
+    head, requested, next_start = _crawl_pages(session, limiter, category_id, category_name, display, 1,
+                                               max_pages - pages, position["watermark"])
+    rows += head
+    pages += requested
+    if next_start and head:
+        logger.warning(f"워터마크에 도달하기 전에 페이지 한도에 도달했습니다. ({category_name}, {pages}페이지)")
+        return rows, pages, {**position, "pending": _newest(head), "resume_start": next_start,
+                             "resume_publish_date": _oldest(head)}
+    newest = _newest(head)
+    return rows, pages, {**position, "watermark": newest} if newest else position
+
+
+def _crawl_pages(session: requests.Session, limiter: RateLimiter, category_id: int, category_name: str,
+                 display: int, start: int, max_pages: int, watermark: tuple = None, newer_than: datetime = None):
+    """start부터 워터마크에 도달하거나 마지막 페이지가 나올 때까지 최대 max_pages 페이지를 조회합니다.
 
-        for news in news_list:
-            exists = db.query(News).filter(News.news_id == news.news_id).first()
-            if not exists:
-                db.add(news)
-                saved_count += 1
+    Returns:
+        tuple: (행 목록, API 요청 수, 페이지 한도에 걸려 멈췄으면 다음에 조회할 start 아니면 None).
+            newer_than보다 최신인 기사는 행 목록에서 제외합니다.
+    """
+    rows = []
+    pages = 0
+    while pages < max_pages:
+        if start > NAVER_MAX_START:
+            if watermark:
+                logger.warning(f"네이버 start 한도를 넘어 워터마크까지 조회하지 못했습니다. ({category_name})")
+            return rows, pages, None
+        page = fetch_naver_news_rows(session, limiter, category_id, category_name, display, start)
+        pages += 1
+        for row in page:
+            if watermark and _reached_watermark(row, watermark):
+                return rows, pages, None
+            if newer_than and row["publish_date"] is not None and _local_time(row["publish_date"]) > newer_than:
+                continue
+            rows.append(row)
+        if len(page) < display:
+            return rows, pages, None
+        start += display
+    return rows, pages, start
 
+
+def _local_time(publish_date: datetime) -> datetime:
+    """네이버 작성일(+0900)을 DateTime 컬럼에 저장되는 현지 시각(naive)으로 변환합니다."""
+    return publish_date.replace(tzinfo=None)
+
+
+def _newest(rows: list):
+    """작성일이 있는 행 중 가장 최신 기사의 (현지 작성일, 링크)를 반환합니다. 없으면 None."""
+    dated = [row for row in rows if row["publish_date"] is not None]
+    if not dated:
+        return None
+    newest = max(dated, key=lambda row: row["publish_date"])
+    return _local_time(newest["publish_date"]), newest["url"]
+
+
+def _oldest(rows: list):
+    """작성일이 있는 행 중 가장 오래된 기사의 현지 작성일을 반환합니다. 없으면 None."""
+    dates = [row["publish_date"] for row in rows if row["publish_date"] is not None]
+    return _local_time(min(dates)) if dates else None
+
+
+def _position_of(state: NewsCrawlState):
+    """저장된 워터마크 행을 crawl_category_news의 수집 위치(dict)로 변환합니다."""
+    if state is None:
+        return None
+    pending = (state.pending_publish_date, state.pending_link) if state.pending_link else None
+    return {"watermark": (state.last_publish_date, state.last_link), "pending": pending,
+            "resume_start": state.resume_start if pending else None,
+            "resume_publish_date": state.resume_publish_date if pending else None}
+
+
+def _reached_watermark(row: dict, watermark: tuple) -> bool:
+    last_publish_date, last_link = watermark
+    if row["url"] == last_link:
+        return True
+    return row["publish_date"] is not None and _local_time(row["publish_date"]) < last_publish_date
+
+
+def _save_position(db: Session, states: dict, category_id: int, position: dict):
+    """crawl_category_news가 반환한 수집 위치를 카테고리 워터마크 행에 반영합니다 (커밋은 호출자가 수행)."""
+    if position is None:
+        return
+    state = states.get(category_id)
+    if state is None:
+        state = states[category_id] = NewsCrawlState(category_id=category_id)
+        db.add(state)
+    state.last_publish_date, state.last_link = position["watermark"]
+    state.pending_publish_date, state.pending_link = position["pending"] or (None, None)
+    state.resume_start = position["resume_start"]
+    state.resume_publish_date = position["resume_publish_date"]
+
+
+def fetch_naver_news_rows(session: requests.Session, limiter: RateLimiter, category_id: int,
+                          category_name: str, display: int = 10, start: int = 1, sort: str = "date"):
+    """한 카테고리의 네이버 뉴스를 조회하여 news 테이블 행(dict) 목록으로 반환합니다."""
+    params = {
+        "query": category_name,
+        "display": display,
+        "start": start,
+        "sort": sort,
+    }
+    limiter.acquire()
+    response = session.get(NAVER_API_URL, params=params, timeout=10)
+    response.raise_for_status()
+    return parse_naver_news_rows(response.json(), category_id, category_name)
+
+
+def bulk_insert_news(db: Session, rows: list, batch_size: int = NEWS_INSERT_BATCH_SIZE) -> int:
+    """뉴스 행을 배치 단위 INSERT ... ON CONFLICT (news_id, publish_date) DO NOTHING으로 저장합니다.
+
+    PostgreSQL 파티션 테이블이면 저장 전에 행의 publish_date에 해당하는 월 파티션이 있는지 확인하고 없으면 생성합니다.
+    네이버 작성일(+0900)은 먼저 현지 시각(naive)으로 바꿔, 파티션 월과 저장되는 값이 같은 시각을 기준으로 하게 합니다.
+
+    Args:
+        db (Session): 데이터베이스 세션 객체.
+        rows (list): news 테이블 컬럼명을 키로 하는 dict 목록.
+        batch_size (int): INSERT 한 번에 저장할 최대 행 수.
+
+    Returns:
+        int: 새로 저장된 행 수 (이미 존재하던 news_id는 제외).
+    """
+    saved_count = 0
+    rows = [{**row, "publish_date": _local_time(row["publish_date"])} if row["publish_date"] else row for row in rows]
+    ensure_partitions_for(db, (row["publish_date"] for row in rows))
+    for batch in batched(rows, batch_size):
+        stmt = dialect_insert(db, News).values(batch)
+        result = db.execute(stmt.on_conflict_do_nothing(index_elements=[News.news_id, News.publish_date]))
+        saved_count += result.rowcount
     db.commit()
-    logger.info(f"{saved_count}개의 뉴스 저장 완료")
+    return saved_count
+
 
 def get_news_list_from_naver(category: Category, display: int = 10, start: int = 1, sort: str = "date"):
     query = category.category_name
-    url = "https://openapi.naver.com/v1/search/news.json"
+    url = NAVER_API_URL
     headers = {
         "X-Naver-Client-Id": NAVER_CLIENT_ID,
         "X-Naver-Client-Secret": NAVER_CLIENT_SECRET,
@@ -63,7 +365,10 @@ def get_news_list_from_naver(category: Category, display: int = 10, start: int =
     return parse_naver_news(news_response, category.category_id, query)
 
 def parse_naver_news(json_data, category_id, category_name):
-    news_list = []
+    return [News(**row) for row in parse_naver_news_rows(json_data, category_id, category_name)]
+
+def parse_naver_news_rows(json_data, category_id, category_name):
+    rows = []
 
     for item in json_data.get("items", []):
         title = item.get("title", "").replace("<b>", "").replace("</b>", "")
@@ -80,22 +385,20 @@ def parse_naver_news(json_data, category_id, category_name):
         # 링크를 해시하여 고유 ID로 사용
         news_id = int(hashlib.sha256(link.encode()).hexdigest(), 16) % (10 ** 10)
 
-        news = News(
-            news_id=news_id,
-            category_id=category_id,
-            title=title,
-            contents=description,
-            source=map_news_source(originallink),
-            publish_date=publish_date,
-            category=category_name,
-            url=link,
-            original_url=originallink,
-            created_at=datetime.now()
-        )
-
-        news_list.append(news)
-
-    return news_list
+        rows.append({
+            "news_id": news_id,
+            "category_id": category_id,
+            "title": title,
+            "contents": description,
+            "source": map_news_source(originallink),
+            "publish_date": publish_date,
+            "category": category_name,
+            "url": link,
+            "original_url": originallink,
+            "created_at": datetime.now()
+        })
+
+    return rows
 
 # 언론사 추출 함수
 def map_news_source(source_url: str) -> str:
@@ -0,0 +1,252 @@
+"""뉴스 테이블 월별 파티션 관리 명령 모듈.
+
+PostgreSQL에서 news 테이블은 publish_date 기준 RANGE 파티션 테이블이며, 파티션은 한 달에 하나씩
+news_pYYYYMM 이름으로 만듭니다. 이 모듈은 다음 작업을 수행합니다.
+
+- 기존의 파티션이 없는 news 테이블을 파티션 테이블로 옮기는 1회성 마이그레이션
+- 보존 기간 시작 월부터 NEWS_PARTITION_MONTHS_AHEAD개월 뒤까지의 파티션 미리 생성
+- 수집한 뉴스의 publish_date에 해당하는 파티션이 없으면 저장 전에 생성 (bulk_insert_news)
+- 보존 기간(NEWS_RETENTION_MONTHS)이 지난 파티션을 DELETE 없이 DROP TABLE로 삭제
+
+파티션 수가 보존 기간만큼으로 유지되므로, 뉴스가 계속 쌓여도 카테고리별 최신 뉴스 조회는
+파티션별 (category_id, publish_date) 인덱스 몇 개만 읽습니다. SQLite(개발·테스트)는 파티션을 지원하지 않으므로
+보존 기간 정리만 DELETE로 수행합니다.
+
+app.utils.setup_database가 파티션 준비를 실행하며, 보존 기간 정리는 매일 한 번 아래 명령으로 실행합니다.
+
+실행 예시:
+    python -m app.utils.news_partitions
+    python -m app.utils.news_partitions --retention-months 6 --months-ahead 2
+"""
+
+import argparse
+import os
+import re
+from datetime import date, datetime
+from typing import Iterable, Optional
+
+from sqlalchemy import delete, text
+from sqlalchemy.orm import Session
+
+from app.models.news import News
+from app.utils.response_cache import response_cache
+
+PARTITION_NAME = re.compile(r"^news_p(\d{4})(\d{2})$")
+_LEGACY_TABLE = "news_unpartitioned"
+
+
+def load_partition_options() -> dict:
+    """환경 변수에서 뉴스 파티션 설정을 읽어옵니다.
+
+    환경 변수:
+        NEWS_RETENTION_MONTHS (int): 뉴스 보존 개월 수, 0이면 삭제하지 않음 (기본값: 12).
+        NEWS_PARTITION_MONTHS_AHEAD (int): 이번 달 이후 미리 만들어 둘 파티션 수 (기본값: 3).
+
+    Returns:
+        dict: retention_months, months_ahead 값.
+    """
+    return {
+        "retention_months": int(os.getenv("NEWS_RETENTION_MONTHS") or 12),
+        "months_ahead": int(os.getenv("NEWS_PARTITION_MONTHS_AHEAD") or 3),
+    }
+
+
+def month_start(value) -> date:
+    """value(date 또는 datetime)가 속한 달의 1일을 반환합니다."""
+    return date(value.year, value.month, 1)
+
+
+def add_months(month: date, months: int) -> date:
+    """month(1일)에서 months개월 뒤(음수면 앞)의 1일을 반환합니다."""
+    index = month.year * 12 + month.month - 1 + months
+    return date(index // 12, index % 12 + 1, 1)
+
+
+def month_range(first: date, last: date) -> list:
+    """first가 속한 달부터 last가 속한 달까지(포함) 각 달의 1일 목록을 반환합니다."""
+    months = []
+    month = month_start(first)
+    while month <= month_start(last):
+        months.append(month)
+        month = add_months(month, 1)
+    return months
+
+
+def partition_name(month: date) -> str:
+    return f"news_p{month:%Y%m}"
+
+
+def retention_cutoff(today: date, retention_months: int) -> Optional[date]:
+    """보존 기간 시작 월의 1일을 반환합니다. 이 날짜 이전의 뉴스가 삭제 대상입니다 (보존 기간 0이면 None)."""
+    if retention_months <= 0:
+        return None
+    return add_months(month_start(today), -retention_months)
+
+
+def news_table_kind(conn) -> Optional[str]:
+    """PostgreSQL news 테이블 종류를 반환합니다 ('p': 파티션 테이블, 'r': 일반 테이블, None: 없음)."""
+    return conn.execute(text("SELECT relkind FROM pg_class WHERE oid = to_regclass('news')")).scalar()
+
+
+def list_partitions(conn) -> dict:
+    """news 테이블의 월별 파티션을 {월 1일: 파티션 이름}으로 반환합니다."""
+    names = conn.execute(text(
+        "SELECT child.relname FROM pg_inherits "
+        "JOIN pg_class parent ON parent.oid = pg_inherits.inhparent "
+        "JOIN pg_class child ON child.oid = pg_inherits.inhrelid "
+        "WHERE parent.oid = to_regclass('news')"
+    )).scalars()
+    partitions = {}
+    for name in names:
+        match = PARTITION_NAME.match(name)
+        if match:
+            partitions[date(int(match.group(1)), int(match.group(2)), 1)] = name
+    return partitions
+
+
+def ensure_partitions(conn, months: Iterable[date]) -> list:
+    """months 중 파티션이 없는 달의 파티션을 생성하고, 생성한 파티션 이름 목록을 반환합니다."""
+    existing = list_partitions(conn)
+    created = []
+    for month in sorted({month_start(month) for month in months} - set(existing)):
+        name = partition_name(month)
+        conn.execute(text(
+            f"CREATE TABLE IF NOT EXISTS {name} PARTITION OF news "
+            f"FOR VALUES FROM ('{month.isoformat()}') TO ('{add_months(month, 1).isoformat()}')"
+        ))
+        created.append(name)
+    return created
+
+
+def ensure_partitions_for(db: Session, publish_dates: Iterable[datetime]) -> list:
+    """저장할 뉴스의 publish_date에 해당하는 파티션이 없으면 같은 트랜잭션에서 생성합니다.
+
+    PostgreSQL 파티션 테이블이 아니면 아무것도 하지 않습니다.
+
+    Returns:
+        list[str]: 새로 생성한 파티션 이름 목록.
+    """
+    if db.get_bind().dialect.name != "postgresql":
+        return []
+    conn = db.connection()
+    if news_table_kind(conn) != "p":
+        return []
+    return ensure_partitions(conn, publish_dates)
+
+
+def migrate_news_to_partitions(engine, cutoff: Optional[date] = None) -> bool:
+    """파티션이 없는 기존 news 테이블을 월별 파티션 테이블로 옮깁니다 (PostgreSQL 전용, 1회성).
+
+    기존 테이블과 인덱스의 이름을 바꾼 뒤 모델 정의대로 파티션 테이블을 만들고, 보존 기간(cutoff) 이후의
+    행만 복사한 다음 기존 테이블을 삭제합니다. 하나의 트랜잭션으로 실행되므로 실패하면 원래대로 돌아갑니다.
+
+    Returns:
+        bool: 마이그레이션을 수행했으면 True.
+    """
+    with engine.begin() as conn:
+        if news_table_kind(conn) != "r":
+            return False
+
+        conn.execute(text(f"ALTER TABLE news RENAME TO {_LEGACY_TABLE}"))
+        index_names = conn.execute(
+            text("SELECT indexname FROM pg_indexes WHERE tablename = :table"), {"table": _LEGACY_TABLE}
+        ).scalars().all()
+        for name in index_names:  # 기본 키 인덱스 이름을 바꾸면 제약 조건 이름도 함께 바뀜
+            conn.execute(text(f'ALTER INDEX "{name}" RENAME TO "{name[:48]}_unpartitioned"'))
+        News.__table__.create(conn)
+
+        condition = "WHERE publish_date >= :cutoff" if cutoff else ""
+        params = {"cutoff": cutoff} if cutoff else {}
+        first, last = conn.execute(
+            text(f"SELECT min(publish_date), max(publish_date) FROM {_LEGACY_TABLE} {condition}"), params
+        ).one()
+        if first is not None:
+            ensure_partitions(conn, month_range(first, last))
+            columns = ", ".join(column.name for column in News.__table__.columns)
+            conn.execute(text(
+                f"INSERT INTO news ({columns}) SELECT {columns} FROM {_LEGACY_TABLE} {condition} "
+                f"ON CONFLICT DO NOTHING"
+            ), params)
+        conn.execute(text(f"DROP TABLE {_LEGACY_TABLE}"))
+
+    print("🧱 news 테이블을 월별 파티션 테이블로 옮겼습니다.")
+    return True
+
+
+def prepare_news_partitions(engine, today: Optional[date] = None, retention_months: Optional[int] = None,
+                            months_ahead: Optional[int] = None) -> list:
+    """파티션 테이블로 마이그레이션하고, 보존 기간 시작 월부터 months_ahead개월 뒤까지 파티션을 만듭니다.
+
+    보존 기간을 두지 않으면(0) 지난달부터 만듭니다. PostgreSQL이 아니면 아무것도 하지 않습니다.
+
+    Returns:
+        list[str]: 새로 생성한 파티션 이름 목록.
+    """
+    if engine.dialect.name != "postgresql":
+        return []
+    options = load_partition_options()
+    retention_months = options["retention_months"] if retention_months is None else retention_months
+    months_ahead = options["months_ahead"] if months_ahead is None else months_ahead
+    this_month = month_start(today or date.today())
+    cutoff = retention_cutoff(this_month, retention_months)
+
+    migrate_news_to_partitions(engine, cutoff)
+    with engine.begin() as conn:
+        if news_table_kind(conn) != "p":
+            return []
+        created = ensure_partitions(conn, month_range(cutoff or add_months(this_month, -1),
+                                                      add_months(this_month, months_ahead)))
+    for name in created:
+        print(f"🧱 파티션 생성: {name}")
+    return created
+
+
+def apply_news_retention(engine, today: Optional[date] = None, retention_months: Optional[int] = None) -> dict:
+    """보존 기간이 지난 뉴스를 삭제합니다.
+
+    PostgreSQL 파티션 테이블은 보존 기간 시작 월 이전의 파티션을 DROP TABLE로 삭제하고,
+    그 외(SQLite 등)에는 DELETE로 삭제합니다. 뉴스가 삭제되면 뉴스 응답 캐시를 무효화합니다.
+
+    Returns:
+        dict: dropped(삭제한 파티션 이름 목록), deleted(DELETE로 삭제한 행 수), cutoff(보존 기간 시작일).
+    """
+    options = load_partition_options()
+    retention_months = options["retention_months"] if retention_months is None else retention_months
+    cutoff = retention_cutoff(today or date.today(), retention_months)
+    result = {"dropped": [], "deleted": 0, "cutoff": cutoff}
+    if cutoff is None:
+        return result
+
+    with engine.begin() as conn:
+        if engine.dialect.name == "postgresql" and news_table_kind(conn) == "p":
+            for month, name in sorted(list_partitions(conn).items()):
+                if add_months(month, 1) <= cutoff:
+                    conn.execute(text(f"DROP TABLE {name}"))
+                    result["dropped"].append(name)
+        else:
+            result["deleted"] = conn.execute(
+                delete(News.__table__).where(News.publish_date < datetime.combine(cutoff, datetime.min.time()))
+            ).rowcount
+
+    if result["dropped"] or result["deleted"]:
+        response_cache.invalidate("news")
+    print(f"🧹 {cutoff} 이전 뉴스 정리: 파티션 {len(result['dropped'])}개 삭제, 행 {result['deleted']}개 삭제")
+    return result
+
+
+def main():
+    parser = argparse.ArgumentParser(description="뉴스 월별 파티션 생성 및 보존 기간 정리")
+    parser.add_argument("--retention-months", type=int, default=None,
+                        help="뉴스 보존 개월 수 (0이면 삭제하지 않음, 기본값: NEWS_RETENTION_MONTHS)")
+    parser.add_argument("--months-ahead", type=int, default=None,
+                        help="미리 만들어 둘 파티션 수 (기본값: NEWS_PARTITION_MONTHS_AHEAD)")
+    args = parser.parse_args()
+
+    from app.utils.db_manager import db_manager  # db_manager → init_default_data → 이 모듈 순환 import 방지
+
+    prepare_news_partitions(db_manager.engine, retention_months=args.retention_months, months_ahead=args.months_ahead)
+    apply_news_retention(db_manager.engine, retention_months=args.retention_months)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,46 @@
+"""커서(keyset) 페이지네이션 공통 모듈.
+
+추천·검색 API는 정렬 키의 마지막 값(예: (start_date, recruit_id), (publish_date, news_id))을
+불투명한 문자열 커서로 돌려주고, 다음 요청에서는 OFFSET 없이 "정렬 키 < 커서" 조건으로 이어서 조회합니다.
+정렬 키와 같은 순서의 인덱스를 커서 위치부터 범위 스캔하므로, 몇 번째 페이지든 첫 페이지와 비용이 같습니다.
+
+커서는 정렬 키 값의 JSON 배열을 URL-safe Base64로 인코딩한 문자열입니다.
+"""
+
+import base64
+import json
+from datetime import date, datetime
+from typing import Callable, Optional
+
+from fastapi import HTTPException
+
+
+def encode_cursor(*values) -> str:
+    """정렬 키 값(date/datetime/int/str)을 불투명한 커서 문자열로 인코딩합니다."""
+    payload = [value.isoformat() if isinstance(value, (date, datetime)) else value for value in values]
+    encoded = base64.urlsafe_b64encode(json.dumps(payload, separators=(",", ":")).encode())
+    return encoded.decode().rstrip("=")
+
+
+def decode_cursor(cursor: Optional[str], *parsers: Callable) -> Optional[tuple]:
+    """커서 문자열을 정렬 키 값 튜플로 디코딩합니다.
+
+    Args:
+        cursor (str): encode_cursor로 만든 커서. 없으면 첫 페이지를 의미합니다.
+        *parsers (Callable): 각 값을 변환할 함수 (예: date.fromisoformat, int).
+
+    Returns:
+        Optional[tuple]: 정렬 키 값 튜플. cursor가 없으면 None.
+
+    Raises:
+        HTTPException 400: 커서 형식이 올바르지 않은 경우.
+    """
+    if not cursor:
+        return None
+    try:
+        values = json.loads(base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4)))
+        if not isinstance(values, list) or len(values) != len(parsers):
+            raise ValueError("cursor length mismatch")
+        return tuple(parse(value) for parse, value in zip(parsers, values, strict=True))
+    except (ValueError, TypeError) as e:
+        raise HTTPException(status_code=400, detail="Invalid cursor") from e
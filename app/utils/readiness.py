@@ -0,0 +1,97 @@
+"""외부 의존성 연결 대기 및 상태 점검 모듈.
+
+이 모듈은 지수 백오프(jitter 포함)와 전체 deadline을 적용한 재시도 함수와,
+readiness 엔드포인트에서 사용하는 PostgreSQL / Elasticsearch 상태 점검 함수를 제공합니다.
+"""
+
+import os
+import random
+import time
+
+from sqlalchemy import text
+
+
+def retry_with_backoff(func, retry_on, deadline: float, base_delay: float = 0.5, max_delay: float = 10.0,
+                       on_retry=None, sleep=time.sleep):
+    """func가 성공할 때까지 지수 백오프로 재시도하고, deadline을 넘기면 중단합니다.
+
+    대기 시간은 min(max_delay, base_delay * 2^(시도 횟수 - 1)) 범위에서 무작위로 정하며(full jitter),
+    남은 deadline을 넘지 않도록 잘라냅니다.
+
+    Args:
+        func (Callable): 재시도할 함수.
+        retry_on (type | tuple): 재시도 대상 예외 타입.
+        deadline (float): 전체 재시도 허용 시간(초).
+        base_delay (float): 첫 재시도 대기 시간 상한(초).
+        max_delay (float): 재시도 대기 시간 상한(초).
+        on_retry (Callable | None): 재시도 직전에 (시도 횟수, 예외, 대기 시간)으로 호출됩니다.
+        sleep (Callable): 대기 함수 (테스트에서 교체 가능).
+
+    Returns:
+        Any: func의 반환값.
+
+    Raises:
+        TimeoutError: deadline 안에 성공하지 못한 경우. 마지막 예외가 원인으로 연결됩니다.
+    """
+    started = time.monotonic()
+    attempt = 0
+    while True:
+        try:
+            return func()
+        except retry_on as e:
+            attempt += 1
+            remaining = deadline - (time.monotonic() - started)
+            if remaining <= 0:
+                raise TimeoutError(f"{attempt}회 시도 후 {deadline}초 deadline 초과") from e
+            delay = min(random.uniform(0, min(max_delay, base_delay * 2 ** (attempt - 1))), remaining)
+            if on_retry is not None:
+                on_retry(attempt, e, delay)
+            sleep(delay)
+
+
+def load_connect_options() -> dict:
+    """환경 변수에서 DB 연결 대기 설정을 읽어옵니다.
+
+    환경 변수:
+        DB_CONNECT_DEADLINE (float): 시작 시 DB 연결을 기다릴 최대 시간(초) (기본값: 60).
+        DB_CONNECT_BASE_DELAY (float): 첫 재시도 대기 시간 상한(초) (기본값: 0.5).
+        DB_CONNECT_MAX_DELAY (float): 재시도 대기 시간 상한(초) (기본값: 10).
+
+    Returns:
+        dict: deadline, base_delay, max_delay 값.
+    """
+    return {
+        "deadline": float(os.getenv("DB_CONNECT_DEADLINE") or 60),
+        "base_delay": float(os.getenv("DB_CONNECT_BASE_DELAY") or 0.5),
+        "max_delay": float(os.getenv("DB_CONNECT_MAX_DELAY") or 10),
+    }
+
+
+def check_database(engine) -> dict:
+    """PostgreSQL에 SELECT 1을 실행하여 상태를 점검합니다.
+
+    Returns:
+        dict: status("ok" 또는 "error"), latency_ms, 실패 시 error 메시지.
+    """
+    started = time.perf_counter()
+    try:
+        with engine.connect() as conn:
+            conn.execute(text("SELECT 1"))
+    except Exception as e:
+        return {"status": "error", "error": str(e)}
+    return {"status": "ok", "latency_ms": round((time.perf_counter() - started) * 1000, 2)}
+
+
+def check_elasticsearch(es) -> dict:
+    """Elasticsearch ping으로 상태를 점검합니다.
+
+    Returns:
+        dict: status("ok" 또는 "error"), latency_ms, 실패 시 error 메시지.
+    """
+    started = time.perf_counter()
+    try:
+        if not es.ping():
+            return {"status": "error", "error": "ping failed"}
+    except Exception as e:
+        return {"status": "error", "error": str(e)}
+    return {"status": "ok", "latency_ms": round((time.perf_counter() - started) * 1000, 2)}
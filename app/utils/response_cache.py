@@ -0,0 +1,485 @@
+"""추천 API 응답 캐시 모듈.
+
+많은 사용자가 같은 몇 가지 카테고리 조합을 구독하므로, /employee/recommend와 /news/recommend의
+응답을 user_id가 아니라 활성 구독 카테고리 조합과 limit으로 캐시합니다. redis 백엔드는 사용자별 구독 조합도
+캐시하므로, 자주 쓰이는 조합의 요청은 DB 쿼리 없이 응답합니다.
+
+- 채용 공고 응답은 추천 결과가 구독 순서와 무관하므로 정렬된 category_id 조합으로,
+  뉴스 응답은 카테고리 묶음이 구독 순서를 따르므로 구독 순서의 category_id 조합으로 키를 만듭니다.
+- 캐시는 네임스페이스(employee, news, subscriptions)별 세대(generation) 번호를 키에 포함합니다.
+  invalidate()는 세대 번호만 올리므로, 이전 세대 항목은 더 이상 조회되지 않고 TTL이 지나면 사라집니다.
+- 백엔드는 RESPONSE_CACHE 환경 변수로 선택합니다.
+  redis: REDIS_URL의 Redis (워커·수집 작업 간 공유, REDIS_URL이 있으면 기본값),
+  memory: 프로세스 내 LRU + TTL (REDIS_URL이 없으면 기본값), none: 사용 안 함.
+- memory 백엔드는 프로세스마다 따로 있으므로, 다른 프로세스(cron·CLI 수집 작업, 다른 API 워커)의
+  무효화는 전달되지 않습니다. 이 경우 해당 프로세스는 TTL(RESPONSE_CACHE_TTL)이 지날 때까지 이전 응답을 반환하므로,
+  수집 작업을 별도 프로세스로 실행하거나 워커가 여러 개이면 redis 백엔드를 사용해야 합니다.
+  구독 변경은 사용자가 바로 확인하므로, memory 백엔드는 사용자별 구독 조합을 캐시하지 않고 매번 DB에서 읽습니다.
+- redis 클라이언트는 블로킹 I/O이므로, async 라우터(cached_recommendations_async)는 캐시 호출을 스레드풀에서,
+  DB 조회만 AsyncSession.run_sync로 실행합니다. async 라우터의 커밋으로 발생한 무효화도 스레드풀로 넘깁니다.
+
+수집 작업(fetch_and_insert_recent_jobs, get_subscribed_news_list)이 데이터를 저장하면 해당 네임스페이스를
+무효화하며, ORM 세션에서 채용 공고·뉴스·카테고리나 구독을 변경하고 커밋해도 자동으로 무효화됩니다.
+"""
+
+import asyncio
+import json
+import logging
+import os
+import threading
+import time
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from typing import Callable, Optional
+
+from fastapi.concurrency import run_in_threadpool
+from fastapi.encoders import jsonable_encoder
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+
+from app.models import Category, Employee, EmployeeCategory, News, UserCategory, Users
+from app.utils.change_tracker import flushed_objects, track_changes
+from app.utils.user_cache import user_cache
+
+logger = logging.getLogger(__name__)
+
+SUBSCRIPTIONS = "subscriptions"
+_ALL_USERS = object()  # 구독 일괄 변경으로 어떤 user_id가 바뀌었는지 알 수 없음을 나타내는 표시
+
+# 변경 시 응답 캐시를 무효화해야 하는 모델 → 네임스페이스
+_DATA_MODELS = {
+    Employee: "employee",
+    EmployeeCategory: "employee",
+    News: "news",
+    Category: "news",  # 뉴스 응답에는 카테고리 이름이 포함됨
+}
+
+
+def load_response_cache_options() -> dict:
+    """환경 변수에서 추천 응답 캐시 설정을 읽어옵니다.
+
+    환경 변수:
+        RESPONSE_CACHE (str): memory, redis 또는 none (기본값: REDIS_URL이 있으면 redis, 없으면 memory).
+        RESPONSE_CACHE_SIZE (int): memory 백엔드에 보관할 최대 항목 수 (기본값: 10000).
+        RESPONSE_CACHE_TTL (float): 항목 유지 시간(초) (기본값: 300).
+        REDIS_URL (str): redis 백엔드가 연결할 주소 (기본값: redis://localhost:6379/0).
+
+    Returns:
+        dict: backend, max_size, ttl, redis_url 값.
+    """
+    default_backend = "redis" if os.getenv("REDIS_URL") else "memory"
+    return {
+        "backend": (os.getenv("RESPONSE_CACHE") or default_backend).lower(),
+        "max_size": int(os.getenv("RESPONSE_CACHE_SIZE") or 10000),
+        "ttl": float(os.getenv("RESPONSE_CACHE_TTL") or 300),
+        "redis_url": os.getenv("REDIS_URL") or "redis://localhost:6379/0",
+    }
+
+
+class ResponseCache(ABC):
+    """네임스페이스별 세대 번호로 무효화하는 응답 캐시의 추상 기본 클래스.
+
+    호출자는 version()으로 세대 번호를 먼저 읽고 같은 번호로 get/set 합니다. 조회와 저장 사이에
+    무효화되면 저장한 항목은 이전 세대에 남으므로, 무효화 전에 만든 응답이 다시 조회되지 않습니다.
+
+    Attributes:
+        shared (bool): 모든 API 워커와 수집 작업이 같은 캐시와 무효화를 공유하면 True.
+        blocking (bool): 메서드 호출이 네트워크 I/O로 블로킹되면 True (이벤트 루프에서 직접 호출하지 않음).
+    """
+
+    shared = False
+    blocking = False
+
+    @abstractmethod
+    def version(self, namespace: str) -> int:
+        """namespace의 현재 세대 번호를 반환합니다."""
+
+    @abstractmethod
+    def get(self, namespace: str, key: str, version: int):
+        """캐시된 값을 반환합니다. 없거나 만료되었으면 None."""
+
+    @abstractmethod
+    def set(self, namespace: str, key: str, value, version: int):
+        """값을 저장합니다. value는 JSON으로 직렬화할 수 있어야 합니다."""
+
+    @abstractmethod
+    def delete(self, namespace: str, key: str):
+        """현재 세대의 key 항목을 제거합니다."""
+
+    @abstractmethod
+    def invalidate(self, namespace: Optional[str] = None):
+        """namespace의 세대 번호를 올려 기존 항목을 모두 무효화합니다. namespace가 없으면 모든 항목을 무효화합니다."""
+
+
+class NullResponseCache(ResponseCache):
+    """캐시를 사용하지 않는 백엔드 (RESPONSE_CACHE=none)."""
+
+    def version(self, namespace):
+        return 0
+
+    def get(self, namespace, key, version):
+        return None
+
+    def set(self, namespace, key, value, version):
+        pass
+
+    def delete(self, namespace, key):
+        pass
+
+    def invalidate(self, namespace=None):
+        pass
+
+
+class MemoryResponseCache(ResponseCache):
+    """프로세스 내 LRU + TTL 백엔드.
+
+    다른 프로세스의 무효화는 전달되지 않으므로, 그 변경은 TTL이 지나야 반영됩니다.
+
+    Attributes:
+        max_size (int): 보관할 최대 항목 수. 초과하면 가장 오래 사용되지 않은 항목부터 제거합니다.
+        ttl (float): 항목 유지 시간(초).
+    """
+
+    def __init__(self, max_size: int = 10000, ttl: float = 300, clock=time.monotonic):
+        self.max_size = max_size
+        self.ttl = ttl
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._entries = OrderedDict()  # (namespace, version, key) -> (value, expires_at)
+        self._versions = {}
+        self.hits = 0
+        self.misses = 0
+
+    def version(self, namespace):
+        with self._lock:
+            return self._versions.get(namespace, 0)
+
+    def get(self, namespace, key, version):
+        entry_key = (namespace, version, key)
+        with self._lock:
+            entry = self._entries.get(entry_key)
+            if entry is None or entry[1] <= self._clock():
+                self._entries.pop(entry_key, None)
+                self.misses += 1
+                return None
+            self._entries.move_to_end(entry_key)
+            self.hits += 1
+            return entry[0]
+
+    def set(self, namespace, key, value, version):
+        if self.max_size <= 0:
+            return
+        entry_key = (namespace, version, key)
+        with self._lock:
+            if version != self._versions.get(namespace, 0):
+                return  # 조회 후 무효화되었으면 저장하지 않음
+            self._entries[entry_key] = (value, self._clock() + self.ttl)
+            self._entries.move_to_end(entry_key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+
+    def delete(self, namespace, key):
+        with self._lock:
+            self._entries.pop((namespace, self._versions.get(namespace, 0), key), None)
+
+    def invalidate(self, namespace=None):
+        with self._lock:
+            if namespace is None:
+                self._entries.clear()
+                self._versions = {name: version + 1 for name, version in self._versions.items()}
+                return
+            self._versions[namespace] = self._versions.get(namespace, 0) + 1
+            for entry_key in [entry_key for entry_key in self._entries if entry_key[0] == namespace]:
+                del self._entries[entry_key]
+
+    def stats(self) -> dict:
+        """현재 항목 수와 누적 hit/miss 횟수를 반환합니다."""
+        with self._lock:
+            return {"size": len(self._entries), "hits": self.hits, "misses": self.misses}
+
+
+class RedisResponseCache(ResponseCache):
+    """Redis 백엔드. 여러 API 워커와 수집 작업 프로세스가 같은 캐시와 무효화를 공유합니다.
+
+    값은 JSON 문자열로 저장하고 TTL은 Redis 만료(EX)로 처리합니다. Redis 오류는 캐시 미스로 처리하여
+    Redis 장애가 API 장애로 이어지지 않도록 합니다.
+
+    Attributes:
+        client: get/set/incr/delete를 지원하는 Redis 클라이언트 (redis.Redis 호환).
+        ttl (float): 항목 유지 시간(초).
+        prefix (str): 키 접두어.
+    """
+
+    NAMESPACES = ("employee", "news", SUBSCRIPTIONS)
+    shared = True
+    blocking = True
+
+    def __init__(self, client, ttl: float = 300, prefix: str = "recommend"):
+        self.client = client
+        self.ttl = ttl
+        self.prefix = prefix
+
+    def _version_key(self, namespace):
+        return f"{self.prefix}:{namespace}:version"
+
+    def _entry_key(self, namespace, key, version):
+        return f"{self.prefix}:{namespace}:{version}:{key}"
+
+    def version(self, namespace):
+        try:
+            return int(self.client.get(self._version_key(namespace)) or 0)
+        except Exception as e:
+            logger.warning(f"Redis 응답 캐시 조회 실패: {e}")
+            return -1  # 조회 실패 시 get/set을 건너뛰는 표시
+
+    def get(self, namespace, key, version):
+        if version < 0:
+            return None
+        try:
+            value = self.client.get(self._entry_key(namespace, key, version))
+        except Exception as e:
+            logger.warning(f"Redis 응답 캐시 조회 실패: {e}")
+            return None
+        return None if value is None else json.loads(value)
+
+    def set(self, namespace, key, value, version):
+        if version < 0:
+            return
+        try:
+            self.client.set(self._entry_key(namespace, key, version), json.dumps(value, ensure_ascii=False),
+                            ex=max(1, int(self.ttl)))
+        except Exception as e:
+            logger.warning(f"Redis 응답 캐시 저장 실패: {e}")
+
+    def delete(self, namespace, key):
+        version = self.version(namespace)
+        if version < 0:
+            return
+        try:
+            self.client.delete(self._entry_key(namespace, key, version))
+        except Exception as e:
+            logger.warning(f"Redis 응답 캐시 삭제 실패: {e}")
+
+    def invalidate(self, namespace=None):
+        for name in (namespace,) if namespace else self.NAMESPACES:
+            try:
+                self.client.incr(self._version_key(name))
+            except Exception as e:
+                logger.warning(f"Redis 응답 캐시 무효화 실패: {e}")
+
+
+def create_response_cache(backend: str = None, redis_client=None) -> ResponseCache:
+    """설정에 맞는 응답 캐시를 생성합니다.
+
+    Args:
+        backend (str): memory, redis 또는 none (기본값: RESPONSE_CACHE 환경 변수).
+        redis_client: redis 백엔드가 사용할 클라이언트. 없으면 REDIS_URL로 redis.Redis를 생성합니다.
+
+    Returns:
+        ResponseCache: 생성한 응답 캐시.
+
+    Raises:
+        ValueError: 알 수 없는 백엔드인 경우.
+    """
+    options = load_response_cache_options()
+    backend = backend or options["backend"]
+    if backend == "none":
+        return NullResponseCache()
+    if backend == "memory":
+        return MemoryResponseCache(max_size=options["max_size"], ttl=options["ttl"])
+    if backend == "redis":
+        if redis_client is None:
+            import redis  # redis 백엔드를 사용할 때만 불러옴
+
+            redis_client = redis.Redis.from_url(options["redis_url"], socket_timeout=0.5)
+        return RedisResponseCache(redis_client, ttl=options["ttl"])
+    raise ValueError(f"알 수 없는 RESPONSE_CACHE 값입니다: {backend}")
+
+
+response_cache = create_response_cache()
+
+
+def active_subscriptions(db: Session, user_id: str) -> list:
+    """사용자의 활성 구독 category_id를 구독 순서대로 DB에서 조회합니다."""
+    return list(db.scalars(
+        select(UserCategory.category_id)
+        .where(UserCategory.user_id == user_id, UserCategory.is_active.is_(True))
+        .order_by(UserCategory.id)
+    ))
+
+
+def _lookup(namespace: str, key: str) -> tuple:
+    """namespace의 현재 세대 번호와 key의 캐시된 값(없으면 None)을 반환합니다."""
+    version = response_cache.version(namespace)
+    return version, response_cache.get(namespace, key, version)
+
+
+def _response_key(category_ids: list, limit: int, ordered: bool, cursor: Optional[str]) -> str:
+    """구독 카테고리 조합, limit, 페이지 커서로 응답 캐시 키를 만듭니다."""
+    key_ids = category_ids if ordered else sorted(category_ids)
+    key = f"{','.join(map(str, key_ids))}:{limit}"
+    return f"{key}:{cursor}" if cursor else key
+
+
+def _skip_cache(user_id: str) -> bool:
+    """캐시를 사용하지 않거나 존재하지 않는 것으로 캐시된 사용자이면 True."""
+    return isinstance(response_cache, NullResponseCache) or user_cache.peek(user_id) is False
+
+
+def subscription_set(db: Session, user_id: str) -> Optional[list]:
+    """사용자의 활성 구독 category_id를 구독 순서대로 반환합니다.
+
+    공유 캐시(redis)에 없으면 db에서 조회하여 기록합니다. memory 백엔드는 다른 워커의 구독 변경을 알 수 없으므로
+    캐시하지 않고 매번 조회합니다.
+
+    Returns:
+        Optional[list[int]]: 활성 구독 category_id 목록. 사용자가 없거나 활성 구독이 없으면 None.
+    """
+    if not response_cache.shared:
+        return active_subscriptions(db, user_id) or None
+    version, cached = _lookup(SUBSCRIPTIONS, user_id)
+    if cached is not None:
+        return cached
+
+    category_ids = active_subscriptions(db, user_id)
+    if not category_ids:
+        return None  # 실패 원인(사용자 없음/구독 없음)은 실시간 조회에서 구분
+    response_cache.set(SUBSCRIPTIONS, user_id, category_ids, version)
+    return category_ids
+
+
+def cached_recommendations(db: Session, namespace: str, user_id: str, limit: int,
+                           fetch: Callable[[Session, str, int, Optional[str]], dict], ordered: bool = False,
+                           cursor: Optional[str] = None) -> dict:
+    """구독 카테고리 조합, limit, 페이지 커서로 캐시된 추천 응답을 반환하고, 없으면 fetch로 조회하여 기록합니다.
+
+    Args:
+        db (Session): 데이터베이스 세션 객체.
+        namespace (str): 응답 네임스페이스 ("employee" 또는 "news").
+        user_id (str): 추천을 받을 사용자 ID.
+        limit (int): 추천할 항목 수.
+        fetch (Callable): 캐시 미스 시 호출할 조회 함수 (db, user_id, limit, cursor).
+        ordered (bool): 응답이 구독 순서에 따라 달라지면 True (구독 순서 그대로 키를 만듦).
+        cursor (str): 이전 응답의 next_cursor (첫 페이지이면 None).
+
+    Returns:
+        dict: JSON으로 직렬화된 추천 응답.
+
+    Raises:
+        HTTPException 404: fetch가 발생시킨 예외 (사용자·구독·데이터가 없을 경우).
+    """
+    if _skip_cache(user_id):
+        return fetch(db, user_id, limit, cursor)
+
+    category_ids = subscription_set(db, user_id)
+    if category_ids is None:
+        return fetch(db, user_id, limit, cursor)
+
+    key = _response_key(category_ids, limit, ordered, cursor)
+    version, cached = _lookup(namespace, key)
+    if cached is not None:
+        user_cache.remember(user_id, True)
+        return cached
+
+    response = jsonable_encoder(fetch(db, user_id, limit, cursor))
+    response_cache.set(namespace, key, response, version)
+    return response
+
+
+async def _call_cache(func, *args):
+    """응답 캐시 호출을 실행합니다. 블로킹 백엔드(redis)는 이벤트 루프를 막지 않도록 스레드풀에서 실행합니다."""
+    if response_cache.blocking:
+        return await run_in_threadpool(func, *args)
+    return func(*args)
+
+
+async def subscription_set_async(db: AsyncSession, user_id: str) -> Optional[list]:
+    """subscription_set의 비동기 버전입니다."""
+    if not response_cache.shared:
+        return await db.run_sync(active_subscriptions, user_id) or None
+    version, cached = await _call_cache(_lookup, SUBSCRIPTIONS, user_id)
+    if cached is not None:
+        return cached
+
+    category_ids = await db.run_sync(active_subscriptions, user_id)
+    if not category_ids:
+        return None
+    await _call_cache(response_cache.set, SUBSCRIPTIONS, user_id, category_ids, version)
+    return category_ids
+
+
+async def cached_recommendations_async(db: AsyncSession, namespace: str, user_id: str, limit: int,
+                                       fetch: Callable[[Session, str, int, Optional[str]], dict],
+                                       ordered: bool = False, cursor: Optional[str] = None) -> dict:
+    """cached_recommendations의 비동기 버전입니다.
+
+    fetch와 구독 조회는 AsyncSession.run_sync로, 캐시 호출은 _call_cache로 실행하므로
+    Redis 왕복(장애 시 타임아웃 포함)이 이벤트 루프를 막지 않습니다.
+    """
+    if _skip_cache(user_id):
+        return await db.run_sync(fetch, user_id, limit, cursor)
+
+    category_ids = await subscription_set_async(db, user_id)
+    if category_ids is None:
+        return await db.run_sync(fetch, user_id, limit, cursor)
+
+    key = _response_key(category_ids, limit, ordered, cursor)
+    version, cached = await _call_cache(_lookup, namespace, key)
+    if cached is not None:
+        user_cache.remember(user_id, True)
+        return cached
+
+    response = jsonable_encoder(await db.run_sync(fetch, user_id, limit, cursor))
+    await _call_cache(response_cache.set, namespace, key, response, version)
+    return response
+
+
+def _response_flushed(session):
+    """flush 대상의 구독·사용자·추천 데이터 변경을 기록합니다."""
+    changes = set()
+    for obj in flushed_objects(session):
+        if isinstance(obj, (UserCategory, Users)):
+            changes.add((SUBSCRIPTIONS, obj.user_id))
+        elif type(obj) in _DATA_MODELS:
+            changes.add((_DATA_MODELS[type(obj)], None))
+    return changes
+
+
+def _response_bulk_written(model):
+    """일괄 INSERT/UPDATE/DELETE(수집 작업의 배치 upsert 포함)를 기록합니다."""
+    if model in (UserCategory, Users):
+        return {(SUBSCRIPTIONS, _ALL_USERS)}
+    if model in _DATA_MODELS:
+        return {(_DATA_MODELS[model], None)}
+    return ()
+
+
+def _invalidate_responses(changes):
+    """기록된 변경이 커밋되면 해당 응답·구독 캐시를 무효화합니다.
+
+    async 라우터의 커밋(AsyncSession.run_sync)은 이벤트 루프 스레드에서 실행되므로,
+    블로킹 백엔드의 무효화는 스레드풀로 넘기고 기다리지 않습니다.
+    """
+    if response_cache.blocking:
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            loop = None
+        if loop is not None:
+            loop.run_in_executor(None, _apply_invalidations, changes)
+            return
+    _apply_invalidations(changes)
+
+
+def _apply_invalidations(changes):
+    for namespace, user_id in changes:
+        if namespace != SUBSCRIPTIONS or user_id is _ALL_USERS:
+            response_cache.invalidate(namespace)
+    if (SUBSCRIPTIONS, _ALL_USERS) not in changes:
+        for namespace, user_id in changes:
+            if namespace == SUBSCRIPTIONS:
+                response_cache.delete(SUBSCRIPTIONS, user_id)
+
+
+track_changes("response_cache_changed", _response_flushed, _response_bulk_written, _invalidate_responses)
@@ -0,0 +1,43 @@
+"""데이터베이스 초기화 명령 모듈.
+
+테이블 생성과 기본 데이터 삽입을 한 번만 실행하는 CLI 진입점입니다.
+API 워커는 import 시점에 DB 작업을 하지 않으므로, 배포 시 서버 기동 전에
+이 명령을 한 번 실행합니다.
+
+실행 예시:
+    python -m app.utils.setup_database            # 테이블 생성 + 기본 데이터 삽입
+    python -m app.utils.setup_database --no-seed  # 테이블 생성만 수행
+"""
+
+import argparse
+
+from app.utils.db_manager import db_manager
+from app.utils.migrations import add_missing_columns, create_missing_indexes, drop_obsolete_indexes
+from app.utils.news_partitions import prepare_news_partitions
+
+
+def setup_database(seed: bool = True):
+    """DB 연결을 기다린 뒤 테이블과 누락된 컬럼·인덱스, 뉴스 월별 파티션을 생성하고, 필요 시 기본 데이터를 삽입합니다.
+
+    Args:
+        seed (bool): True이면 기본 데이터를 삽입합니다.
+    """
+    db_manager.wait_for_connection()
+    db_manager.init_db()
+    add_missing_columns(db_manager.engine)
+    create_missing_indexes(db_manager.engine)
+    drop_obsolete_indexes(db_manager.engine)
+    prepare_news_partitions(db_manager.engine)
+    if seed:
+        db_manager.init_default_data()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="데이터베이스 테이블 생성 및 기본 데이터 삽입")
+    parser.add_argument("--no-seed", action="store_true", help="기본 데이터 삽입을 건너뜁니다.")
+    args = parser.parse_args()
+    setup_database(seed=not args.no_seed)
+
+
+if __name__ == "__main__":
+    main()
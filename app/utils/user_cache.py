@@ -0,0 +1,146 @@
+"""사용자 존재 여부 캐시 모듈.
+
+거의 모든 엔드포인트는 요청을 처리하기 전에 사용자가 존재하는지 확인합니다.
+이 모듈은 user_id별 존재 여부를 크기 제한이 있는 LRU + TTL 캐시에 보관하여
+반복되는 확인 쿼리를 생략합니다. 존재하지 않는 user_id도 짧은 TTL로 캐시(negative caching)
+하므로, 임의의 user_id로 반복 요청하는 봇 트래픽이 DB까지 도달하지 않습니다.
+
+ORM 세션에서 Users를 추가·삭제하고 커밋하면 해당 user_id 항목이 자동으로 무효화되며,
+ORM을 거치지 않고 users 테이블을 변경했다면 invalidate()를 직접 호출해야 합니다.
+"""
+
+import os
+import threading
+import time
+from collections import OrderedDict
+from typing import Optional
+
+from sqlalchemy.orm import Session
+
+from app.models.users import Users
+from app.utils.change_tracker import flushed_objects, track_changes
+
+_ALL_USERS = object()  # 일괄 변경으로 어떤 user_id가 바뀌었는지 알 수 없음을 나타내는 표시
+
+
+def load_user_cache_options() -> dict:
+    """환경 변수에서 사용자 존재 여부 캐시 설정을 읽어옵니다.
+
+    환경 변수:
+        USER_CACHE_SIZE (int): 캐시에 보관할 최대 user_id 수, 0이면 비활성화 (기본값: 10000).
+        USER_CACHE_TTL (float): 존재하는 사용자 항목의 유지 시간(초) (기본값: 300).
+        USER_CACHE_NEGATIVE_TTL (float): 존재하지 않는 사용자 항목의 유지 시간(초) (기본값: 30).
+
+    Returns:
+        dict: max_size, ttl, negative_ttl 값.
+    """
+    return {
+        "max_size": int(os.getenv("USER_CACHE_SIZE") or 10000),
+        "ttl": float(os.getenv("USER_CACHE_TTL") or 300),
+        "negative_ttl": float(os.getenv("USER_CACHE_NEGATIVE_TTL") or 30),
+    }
+
+
+class UserExistenceCache:
+    """user_id별 존재 여부를 보관하는 LRU + TTL 캐시 클래스.
+
+    Attributes:
+        max_size (int): 보관할 최대 항목 수. 초과하면 가장 오래 사용되지 않은 항목부터 제거합니다.
+        ttl (float): 존재하는 사용자 항목의 유지 시간(초).
+        negative_ttl (float): 존재하지 않는 사용자 항목의 유지 시간(초).
+    """
+
+    def __init__(self, max_size: Optional[int] = None, ttl: Optional[float] = None,
+                 negative_ttl: Optional[float] = None, clock=time.monotonic):
+        options = load_user_cache_options()
+        self.max_size = options["max_size"] if max_size is None else max_size
+        self.ttl = options["ttl"] if ttl is None else ttl
+        self.negative_ttl = options["negative_ttl"] if negative_ttl is None else negative_ttl
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._entries = OrderedDict()  # user_id -> (exists, expires_at)
+        self.hits = 0
+        self.misses = 0
+
+    def peek(self, user_id: str) -> Optional[bool]:
+        """DB를 조회하지 않고 캐시된 존재 여부를 반환합니다.
+
+        Returns:
+            Optional[bool]: 캐시된 존재 여부. 캐시에 없거나 만료되었으면 None.
+        """
+        with self._lock:
+            entry = self._entries.get(user_id)
+            if entry is None or entry[1] <= self._clock():
+                self._entries.pop(user_id, None)
+                self.misses += 1
+                return None
+            self._entries.move_to_end(user_id)
+            self.hits += 1
+            return entry[0]
+
+    def remember(self, user_id: str, exists: bool):
+        """조회한 존재 여부를 캐시에 기록합니다."""
+        if self.max_size <= 0:
+            return
+        ttl = self.ttl if exists else self.negative_ttl
+        with self._lock:
+            self._entries[user_id] = (exists, self._clock() + ttl)
+            self._entries.move_to_end(user_id)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+
+    def exists(self, db: Session, user_id: str) -> bool:
+        """사용자 존재 여부를 캐시에서 확인하고, 없으면 db에서 조회하여 기록합니다.
+
+        Args:
+            db (Session): 캐시에 없을 때 사용할 데이터베이스 세션.
+            user_id (str): 확인할 사용자 ID.
+
+        Returns:
+            bool: 사용자가 존재하면 True.
+        """
+        cached = self.peek(user_id)
+        if cached is not None:
+            return cached
+
+        exists = db.query(Users.user_id).filter(Users.user_id == user_id).first() is not None
+        self.remember(user_id, exists)
+        return exists
+
+    def invalidate(self, user_id: Optional[str] = None):
+        """user_id 항목을 제거합니다. user_id가 없으면 전체 항목을 제거합니다."""
+        with self._lock:
+            if user_id is None:
+                self._entries.clear()
+            else:
+                self._entries.pop(user_id, None)
+
+    def stats(self) -> dict:
+        """현재 항목 수와 누적 hit/miss 횟수를 반환합니다."""
+        with self._lock:
+            return {"size": len(self._entries), "hits": self.hits, "misses": self.misses}
+
+
+user_cache = UserExistenceCache()
+
+
+def _user_flushed(session):
+    """flush 대상에 추가·삭제되는 Users의 user_id를 기록합니다."""
+    return {obj.user_id for obj in flushed_objects(session, dirty=False) if isinstance(obj, Users)}
+
+
+def _user_bulk_written(model):
+    """query().delete() 등 Users에 대한 일괄 변경은 전체 무효화 대상으로 기록합니다."""
+    return {_ALL_USERS} if model is Users else ()
+
+
+def _invalidate_users(changes):
+    """Users 변경이 커밋되면 해당 user_id 항목을 무효화합니다."""
+    if _ALL_USERS in changes:
+        user_cache.invalidate()
+        return
+    for user_id in changes:
+        user_cache.invalidate(user_id)
+
+
+track_changes("user_cache_changed", _user_flushed, _user_bulk_written, _invalidate_users)
@@ -8,8 +8,8 @@ import re
 from fastapi import Depends, HTTPException, Query
 from sqlalchemy.orm import Session
 
-from app.models.users import Users
 from app.utils.db_manager import db_manager
+from app.utils.user_cache import user_cache
 
 db_dependency = Depends(db_manager.get_db)
 
@@ -30,8 +30,7 @@ def verify_exists_user(
             HTTPException 404: 존재하지 않는 사용자일 경우.
     """
 
-    user_exists = db.query(Users).filter(Users.user_id == user_id).first()
-    if not user_exists:
+    if not user_cache.exists(db, user_id):
         raise HTTPException(status_code=404, detail="User not found.")
 
 def verify_special_character(content: str):
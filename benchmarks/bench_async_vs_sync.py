@@ -0,0 +1,88 @@
+"""동기/비동기 라우터 부하 비교 벤치마크.
+
+로컬 PostgreSQL(.env의 DB_* 설정)에 대해 동기 라우터와 AsyncSession 기반 비동기 라우터를
+동일한 동시성으로 호출하고 처리량과 지연 시간을 비교합니다.
+
+실행 예시:
+    poetry run python -m benchmarks.bench_async_vs_sync --requests 2000 --concurrency 200
+"""
+
+import argparse
+import asyncio
+import statistics
+import time
+
+import httpx
+from fastapi import FastAPI
+
+from app.main import include_routers
+from app.models import UserCategory, Users
+from app.utils.db_manager import db_manager
+
+BENCH_USER_ID = "bench_user"
+BENCH_CATEGORY_IDS = [24, 25, 29, 30, 33]  # 기본 데이터의 채용 카테고리
+
+
+def seed_bench_user():
+    """벤치마크용 사용자와 구독 정보를 준비합니다."""
+    db = next(db_manager.get_db())
+    try:
+        if not db.query(Users).filter(Users.user_id == BENCH_USER_ID).first():
+            db.add(Users(user_id=BENCH_USER_ID, user_name="bench"))
+            db.add_all(
+                UserCategory(user_id=BENCH_USER_ID, category_id=category_id, is_active=True)
+                for category_id in BENCH_CATEGORY_IDS
+            )
+            db.commit()
+    finally:
+        db.close()
+
+
+async def run_load(async_mode: bool, total: int, concurrency: int):
+    """지정된 모드의 앱에 동시 요청을 보내고 (처리 시간, 지연 시간 목록)을 반환합니다."""
+    app = FastAPI()
+    include_routers(app, async_mode)
+    semaphore = asyncio.Semaphore(concurrency)
+    latencies = []
+
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+
+        async def one_request():
+            async with semaphore:
+                started = time.perf_counter()
+                response = await client.get("/employee/recommend", params={"user_id": BENCH_USER_ID})
+                response.raise_for_status()
+                latencies.append(time.perf_counter() - started)
+
+        started = time.perf_counter()
+        await asyncio.gather(*(one_request() for _ in range(total)))
+        elapsed = time.perf_counter() - started
+
+    return elapsed, latencies
+
+
+def report(label: str, elapsed: float, latencies: list):
+    """측정 결과를 출력합니다."""
+    latencies = sorted(latencies)
+    p99 = latencies[int(len(latencies) * 0.99) - 1]
+    print(
+        f"{label:>5} | {len(latencies) / elapsed:8.1f} req/s | "
+        f"p50 {statistics.median(latencies) * 1000:7.2f} ms | p99 {p99 * 1000:7.2f} ms"
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description="동기/비동기 라우터 부하 비교")
+    parser.add_argument("--requests", type=int, default=2000, help="모드별 총 요청 수")
+    parser.add_argument("--concurrency", type=int, default=200, help="동시 요청 수")
+    args = parser.parse_args()
+
+    seed_bench_user()
+    for label, async_mode in (("sync", False), ("async", True)):
+        elapsed, latencies = asyncio.run(run_load(async_mode, args.requests, args.concurrency))
+        report(label, elapsed, latencies)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,138 @@
+"""카테고리 검색 방식 지연 시간 비교 벤치마크.
+
+로컬 Elasticsearch 컨테이너에 기본 카테고리를 운영과 같은 매핑으로 임시 인덱스에 색인하고,
+기존 두 단계 검색(match_phrase_prefix 후보 검색 → BM25 match 재검색)과
+build_category_search_body의 단일 요청 검색(rescore), 그리고 Elasticsearch 없이 프로세스 안에서
+매칭하는 LocalCategoryMatcher의 지연 시간(p50/p95)을 비교합니다.
+
+실행 예시:
+    poetry run python -m benchmarks.bench_category_search --local-only
+    docker run -d -p 9200:9200 -e discovery.type=single-node -e xpack.security.enabled=false \\
+        docker.elastic.co/elasticsearch/elasticsearch:8.12.0
+    poetry run python -m benchmarks.bench_category_search --es-url http://localhost:9200 --iterations 500
+"""
+
+import argparse
+import statistics
+import time
+import uuid
+
+from elasticsearch import Elasticsearch, helpers
+from sqlalchemy import create_engine, select
+from sqlalchemy.orm import sessionmaker
+
+from app.models import Base, Category, Feature
+from app.utils.catalog_cache import CatalogCache
+from app.utils.category_matcher import LocalCategoryMatcher, build_category_search_body
+from app.utils.init_default_data import add_default_categories, add_default_features
+from app.utils.init_elasticsearch_index import INDEX_BODY
+
+KEYWORDS = ["정보통신", "정보", "보건", "금융", "전기", "건설", "연구", "디자인", "영업", "없는키워드"]
+
+
+def default_category_session():
+    """init_default_data의 기본 기능 유형과 카테고리를 삽입한 메모리 SQLite 세션을 생성합니다."""
+    engine = create_engine("sqlite://")
+    Base.metadata.create_all(bind=engine)
+    db = sessionmaker(bind=engine)()
+    add_default_features(db)
+    db.commit()
+    add_default_categories(db)
+    db.commit()
+    return db
+
+
+def load_default_categories(db):
+    """기본 카테고리를 색인할 문서 목록으로 반환합니다."""
+    rows = db.execute(
+        select(Category.category_id, Category.category_name, Feature.feature_type)
+        .join(Feature, Category.feature_id == Feature.feature_id)
+    ).all()
+    return [
+        {"category_id": row.category_id, "category_name": row.category_name, "feature": row.feature_type}
+        for row in rows
+    ]
+
+
+def two_phase_search(client, index, keyword):
+    """기존 방식: prefix 후보 10개를 찾은 뒤 후보 이름으로 필터링한 BM25 검색을 한 번 더 요청합니다."""
+    prefix_hits = client.search(index=index, body={
+        "size": 10,
+        "query": {"bool": {
+            "must": {"match_phrase_prefix": {"category_name": {"query": keyword}}},
+            "filter": {"term": {"feature": "employee"}},
+        }},
+    })["hits"]["hits"]
+    if not prefix_hits:
+        return None
+    candidate_names = [hit["_source"]["category_name"] for hit in prefix_hits]
+    bm25_hits = client.search(index=index, body={
+        "size": 1,
+        "query": {"bool": {
+            "must": {"match": {"category_name": {"query": keyword, "operator": "and"}}},
+            "filter": {"terms": {"category_name.keyword": candidate_names}},
+        }},
+    })["hits"]["hits"]
+    return (bm25_hits or prefix_hits)[0]["_source"]["category_name"]
+
+
+def single_search(client, index, keyword):
+    """단일 요청 방식: prefix 후보 검색과 BM25 재정렬(rescore)을 한 번에 수행합니다."""
+    hits = client.search(index=index, body=build_category_search_body(keyword))["hits"]["hits"]
+    return hits[0]["_source"]["category_name"] if hits else None
+
+
+def measure(label, search, iterations):
+    """키워드를 돌아가며 search(keyword)를 iterations번 실행하여 지연 시간 분포를 출력합니다."""
+    for keyword in KEYWORDS:  # 워밍업
+        search(keyword)
+    latencies = []
+    for i in range(iterations):
+        started = time.perf_counter()
+        search(KEYWORDS[i % len(KEYWORDS)])
+        latencies.append((time.perf_counter() - started) * 1000)
+    latencies.sort()
+    p95 = latencies[int(len(latencies) * 0.95) - 1]
+    print(f"{label:>9} | p50 {statistics.median(latencies):8.4f} ms | p95 {p95:8.4f} ms | "
+          f"mean {statistics.fmean(latencies):8.4f} ms")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="카테고리 검색 방식 지연 시간 비교")
+    parser.add_argument("--es-url", default="http://localhost:9200", help="Elasticsearch 주소")
+    parser.add_argument("--iterations", type=int, default=500, help="방식별 검색 횟수")
+    parser.add_argument("--local-only", action="store_true", help="Elasticsearch 없이 로컬 매처만 측정")
+    args = parser.parse_args()
+
+    db = default_category_session()
+    catalog = CatalogCache(ttl=300).get(db)
+    documents = load_default_categories(db)
+    db.close()
+    matcher = LocalCategoryMatcher()
+
+    def local_search(keyword):
+        return matcher.match(keyword, catalog)[0]
+
+    if args.local_only:
+        measure("local", local_search, args.iterations)
+        return
+
+    client = Elasticsearch(args.es_url)
+    index = f"categories-bench-{uuid.uuid4().hex[:8]}"
+    client.indices.create(index=index, body=INDEX_BODY)
+    try:
+        helpers.bulk(client, (
+            {"_index": index, "_id": doc["category_id"], "_source": doc} for doc in documents
+        ), refresh="wait_for")
+        for keyword in KEYWORDS:
+            print(f"{keyword:>10} | two-phase: {two_phase_search(client, index, keyword)} | "
+                  f"single: {single_search(client, index, keyword)} | local: {local_search(keyword)}")
+        measure("two-phase", lambda keyword: two_phase_search(client, index, keyword), args.iterations)
+        measure("single", lambda keyword: single_search(client, index, keyword), args.iterations)
+        measure("local", local_search, args.iterations)
+    finally:
+        client.indices.delete(index=index)
+
+
+if __name__ == "__main__":
+    main()
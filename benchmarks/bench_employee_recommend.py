@@ -0,0 +1,116 @@
+"""/employee/recommend 조회 방식 비교 벤치마크.
+
+로컬 PostgreSQL(.env의 DB_* 설정)에 채용 공고 10만 건과 employee_category 100만 건을
+생성한 뒤, 기존 3단계 쿼리(사용자 확인 → 구독 조회 → 공고 조회)와
+단일 쿼리(build_recruit_recommendation_query)의 지연 시간을 비교합니다.
+
+실행 예시:
+    python -m app.utils.setup_database
+    poetry run python -m benchmarks.bench_employee_recommend --iterations 500
+"""
+
+import argparse
+import statistics
+import time
+
+from sqlalchemy import text
+
+from app.models import Employee, EmployeeCategory, UserCategory, Users
+from app.routers.employee import build_recruit_recommendation_query
+from app.utils.db_manager import db_manager
+
+BENCH_USER_ID = "bench_user"
+BENCH_CATEGORY_IDS = [12, 16, 24, 30, 35]
+RECRUIT_ID_OFFSET = 10_000_000
+EMPLOYEE_COUNT = 100_000
+CATEGORIES_PER_EMPLOYEE = 10  # 100,000 x 10 = 1,000,000 employee_category 행
+
+
+def seed_large_dataset(db):
+    """채용 공고 10만 건, employee_category 100만 건과 벤치마크 사용자를 생성합니다."""
+    exists = db.execute(
+        text("SELECT 1 FROM employee WHERE recruit_id = :recruit_id"),
+        {"recruit_id": RECRUIT_ID_OFFSET + 1},
+    ).first()
+    if exists:
+        return
+
+    db.execute(text("""
+        INSERT INTO employee (recruit_id, title, institution, start_date, end_date,
+                              recrut_se, detail_url, recrut_pblnt_sn)
+        SELECT :offset + g, 'bench posting ' || g, 'bench institution',
+               DATE '2020-01-01' + (g % 1800), DATE '2020-01-01' + (g % 1800) + 30,
+               'R2010', NULL, :offset + g
+        FROM generate_series(1, :count) AS g
+    """), {"offset": RECRUIT_ID_OFFSET, "count": EMPLOYEE_COUNT})
+    # 채용 카테고리 11~35 (25개) 중 공고마다 서로 다른 10개를 연결
+    db.execute(text("""
+        INSERT INTO employee_category (recruit_id, category_id)
+        SELECT :offset + g, 11 + (g + k) % 25
+        FROM generate_series(1, :count) AS g, generate_series(0, :per_employee - 1) AS k
+    """), {"offset": RECRUIT_ID_OFFSET, "count": EMPLOYEE_COUNT, "per_employee": CATEGORIES_PER_EMPLOYEE})
+
+    if not db.query(Users).filter(Users.user_id == BENCH_USER_ID).first():
+        db.add(Users(user_id=BENCH_USER_ID, user_name="bench"))
+        db.add_all(
+            UserCategory(user_id=BENCH_USER_ID, category_id=category_id, is_active=True)
+            for category_id in BENCH_CATEGORY_IDS
+        )
+    db.commit()
+    db.execute(text("ANALYZE"))
+
+
+def legacy_three_queries(db, user_id, limit):
+    """기존 라우터의 3단계 조회 방식 (비교 기준)."""
+    db.query(Users).filter(Users.user_id == user_id).first()
+    category_ids = [
+        row.category_id
+        for row in db.query(UserCategory.category_id)
+        .filter(UserCategory.user_id == user_id, UserCategory.is_active.is_(True))
+        .all()
+    ]
+    return (
+        db.query(Employee)
+        .join(EmployeeCategory, Employee.recruit_id == EmployeeCategory.recruit_id)
+        .filter(EmployeeCategory.category_id.in_(category_ids))
+        .order_by(Employee.start_date.desc(), Employee.end_date.asc())
+        .limit(limit)
+        .all()
+    )
+
+
+def single_query(db, user_id, limit):
+    """단일 쿼리 조회 방식."""
+    return db.execute(build_recruit_recommendation_query(user_id, limit)).all()
+
+
+def measure(label, func, db, iterations, limit):
+    """func를 반복 실행하여 p50/p99 지연 시간을 출력합니다."""
+    latencies = []
+    for _ in range(iterations):
+        started = time.perf_counter()
+        func(db, BENCH_USER_ID, limit)
+        latencies.append(time.perf_counter() - started)
+        db.rollback()
+    latencies.sort()
+    p99 = latencies[int(len(latencies) * 0.99) - 1]
+    print(f"{label:>14} | p50 {statistics.median(latencies) * 1000:7.2f} ms | p99 {p99 * 1000:7.2f} ms")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="/employee/recommend 조회 방식 비교")
+    parser.add_argument("--iterations", type=int, default=500, help="방식별 반복 횟수")
+    parser.add_argument("--limit", type=int, default=10, help="추천 공고 수")
+    args = parser.parse_args()
+
+    db = next(db_manager.get_db())
+    try:
+        seed_large_dataset(db)
+        measure("three queries", legacy_three_queries, db, args.iterations, args.limit)
+        measure("single query", single_query, db, args.iterations, args.limit)
+    finally:
+        db.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,82 @@
+"""네이버 뉴스 수집 방식 비교 벤치마크.
+
+로컬 모의 네이버 서버(benchmarks.mock_naver_server)와 로컬 PostgreSQL(.env의 DB_* 설정)을
+사용하여, 기존 방식(카테고리별 순차 requests.get + 기사마다 존재 여부 SELECT 후 add)과
+ingest_subscribed_news(동시 수집 + 메모리 중복 제거 + 배치 INSERT ON CONFLICT DO NOTHING)의
+초당 처리 기사 수를 비교합니다.
+
+실행 예시:
+    python -m app.utils.setup_database
+    poetry run python -m benchmarks.bench_news_ingestion --limit 100 --latency-ms 80
+"""
+
+import argparse
+import time
+
+from sqlalchemy import text
+
+from app.models import Category, News
+from app.utils import news_client
+from app.utils.db_manager import db_manager
+from benchmarks.mock_naver_server import start_mock_server
+
+
+def clear_mock_news(db):
+    """이전 실행에서 저장된 모의 기사와 모의 기사를 가리키는 수집 워터마크를 삭제합니다."""
+    db.execute(text("DELETE FROM news WHERE url LIKE 'https://n.news.naver.com/mock/%'"))
+    db.execute(text("DELETE FROM news_crawl_state WHERE last_link LIKE 'https://n.news.naver.com/mock/%'"))
+    db.commit()
+
+
+def legacy_ingest(db, limit):
+    """기존 get_subscribed_news_list의 순차 수집 방식 (비교 기준)."""
+    fetched = 0
+    saved_count = 0
+    for category in db.query(Category).all():
+        news_list = news_client.get_news_list_from_naver(category, limit)
+        fetched += len(news_list)
+        for news in news_list:
+            if not db.query(News).filter(News.news_id == news.news_id).first():
+                db.add(news)
+                db.flush()  # 카테고리 간 중복 링크가 같은 세션에 두 번 추가되지 않도록 반영
+                saved_count += 1
+    db.commit()
+    return fetched
+
+
+def pipeline_ingest(db, limit, workers, rate):
+    """동시 수집 + 배치 저장 방식."""
+    return news_client.ingest_subscribed_news(db, limit, max_workers=workers, rate=rate)["fetched"]
+
+
+def measure(label, func, db):
+    """func를 한 번 실행하여 소요 시간과 초당 처리 기사 수를 출력합니다."""
+    clear_mock_news(db)
+    started = time.perf_counter()
+    fetched = func(db)
+    elapsed = time.perf_counter() - started
+    print(f"{label:>9} | {fetched:6d} articles | {elapsed:7.2f} s | {fetched / elapsed:9.1f} articles/s")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="네이버 뉴스 수집 방식 비교")
+    parser.add_argument("--limit", type=int, default=100, help="카테고리별 수집 기사 수 (네이버 최대 100)")
+    parser.add_argument("--latency-ms", type=float, default=80, help="모의 서버 응답 지연 시간(ms)")
+    parser.add_argument("--workers", type=int, default=8, help="동시 수집 워커 수")
+    parser.add_argument("--rate", type=float, default=10, help="초당 최대 API 요청 수")
+    args = parser.parse_args()
+
+    server, url = start_mock_server(latency_ms=args.latency_ms)
+    news_client.NAVER_API_URL = url
+    db = next(db_manager.get_db())
+    try:
+        measure("legacy", lambda session: legacy_ingest(session, args.limit), db)
+        measure("pipeline", lambda session: pipeline_ingest(session, args.limit, args.workers, args.rate), db)
+        clear_mock_news(db)
+    finally:
+        db.close()
+        server.shutdown()
+
+
+if __name__ == "__main__":
+    main()
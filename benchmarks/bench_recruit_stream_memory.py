@@ -0,0 +1,160 @@
+"""채용 공고 응답 스트리밍 파싱 메모리 벤치마크.
+
+합성한 대용량(기본 200MB) 채용 공고 API 응답을 로컬 HTTP 서버로 제공하고, 기존 방식
+(response.json()으로 전체 응답을 읽은 뒤 parse_recruit_jobs)과 스트리밍 방식
+(iter_recruit_jobs로 result 배열을 점진적으로 파싱하여 STREAM_BATCH_SIZE건씩 처리)의
+최대 메모리 사용량(tracemalloc peak, 프로세스 최대 RSS)을 비교합니다.
+각 방식은 서로 영향을 주지 않도록 별도 프로세스에서 실행합니다.
+
+--write 옵션을 주면 임시 SQLite DB에 upsert_recruit_jobs로 저장하는 단계까지 측정합니다.
+
+실행 예시:
+    poetry run python -m benchmarks.bench_recruit_stream_memory --size-mb 200
+    poetry run python -m benchmarks.bench_recruit_stream_memory --size-mb 50 --write
+"""
+
+import argparse
+import json
+import multiprocessing
+import os
+import resource
+import shutil
+import tempfile
+import threading
+import time
+import tracemalloc
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from app.models import Base
+from app.utils import insert_employee_data
+from app.utils.json_stream import iter_batches
+
+PADDING = "우대 조건 및 지원 자격 상세 안내 " * 24  # 실제 응답의 긴 본문 필드를 흉내 냄
+
+
+def build_job(index: int) -> dict:
+    """index로 결정되는 가짜 채용 공고를 생성합니다."""
+    return {
+        "recrutPblntSn": str(100000000 + index),
+        "recrutPbancTtl": f"합성 채용 공고 {index}",
+        "instNm": f"합성 기관 {index % 500}",
+        "pbancBgngYmd": "20250101",
+        "pbancEndYmd": "20250131",
+        "recrutSe": "R2010",
+        "ncsCdLst": f"R6000{str(index % 25 + 1).zfill(2)},R6000{str((index + 7) % 25 + 1).zfill(2)}",
+        "hireTypeLst": "R1010,R1020" if index % 2 else "R1030",
+        "prefCondCn": PADDING,
+    }
+
+
+def write_response(path: str, size_mb: float) -> int:
+    """size_mb 크기 이상의 채용 공고 API 응답 JSON을 path에 기록하고 공고 수를 반환합니다."""
+    target = size_mb * 1024 * 1024
+    count = 0
+    with open(path, "w", encoding="utf-8") as file:
+        file.write('{"resultCode":200,"resultMsg":"성공","result":[')
+        while file.tell() < target:
+            if count:
+                file.write(",")
+            file.write(json.dumps(build_job(count), ensure_ascii=False))
+            count += 1
+        file.write(f'],"totalCount":{count}}}')
+    return count
+
+
+def start_file_server(path: str):
+    """모든 GET 요청에 path 파일을 그대로 반환하는 서버를 백그라운드 스레드에서 시작합니다."""
+
+    class Handler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            self.send_response(200)
+            self.send_header("Content-Type", "application/json; charset=utf-8")
+            self.send_header("Content-Length", str(os.path.getsize(path)))
+            self.end_headers()
+            with open(path, "rb") as file:
+                shutil.copyfileobj(file, self.wfile)
+
+        def log_message(self, format, *args):
+            pass
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server, f"http://127.0.0.1:{server.server_address[1]}/recruitment/list"
+
+
+def buffered_ingest(num_of_rows, db_session):
+    """기존 방식: 응답 전체를 response.json()으로 읽은 뒤 한 번에 처리합니다."""
+    result_list = insert_employee_data.fetch_recruit_jobs("2025-01-01", num_of_rows)
+    if db_session is not None:
+        insert_employee_data.upsert_recruit_jobs(db_session, result_list)
+    else:
+        insert_employee_data.parse_recruit_jobs(result_list)
+    return len(result_list)
+
+
+def streaming_ingest(num_of_rows, db_session):
+    """스트리밍 방식: result 배열을 점진적으로 파싱하여 STREAM_BATCH_SIZE건씩 처리합니다."""
+    jobs = insert_employee_data.iter_recruit_jobs("2025-01-01", num_of_rows)
+    count = 0
+    for batch in iter_batches(jobs, insert_employee_data.STREAM_BATCH_SIZE):
+        if db_session is not None:
+            insert_employee_data.upsert_recruit_jobs(db_session, batch)
+        else:
+            insert_employee_data.parse_recruit_jobs(batch)
+        count += len(batch)
+    return count
+
+
+def run_mode(mode, url, num_of_rows, db_path, queue):
+    """하위 프로세스에서 한 가지 방식을 실행하고 (공고 수, 소요 시간, tracemalloc peak, 최대 RSS)를 전달합니다."""
+    insert_employee_data.API_URL = url
+    db_session = None
+    if db_path:
+        engine = create_engine(f"sqlite:///{db_path}")
+        Base.metadata.create_all(bind=engine)
+        db_session = sessionmaker(bind=engine)()
+
+    ingest = buffered_ingest if mode == "buffered" else streaming_ingest
+    tracemalloc.start()
+    started = time.perf_counter()
+    count = ingest(num_of_rows, db_session)
+    elapsed = time.perf_counter() - started
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    max_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss  # Linux 기준 KB
+    queue.put((count, elapsed, peak, max_rss * 1024))
+
+
+def main():
+    parser = argparse.ArgumentParser(description="채용 공고 응답 스트리밍 파싱 메모리 비교")
+    parser.add_argument("--size-mb", type=float, default=200, help="합성 응답 크기(MB)")
+    parser.add_argument("--write", action="store_true", help="임시 SQLite DB에 저장하는 단계까지 측정")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as workdir:
+        response_path = os.path.join(workdir, "recruit.json")
+        job_count = write_response(response_path, args.size_mb)
+        size_mb = os.path.getsize(response_path) / 1024 / 1024
+        print(f"synthetic response: {size_mb:.1f} MB, {job_count} jobs")
+
+        server, url = start_file_server(response_path)
+        context = multiprocessing.get_context("spawn")
+        try:
+            for mode in ("buffered", "streaming"):
+                db_path = os.path.join(workdir, f"{mode}.db") if args.write else None
+                queue = context.Queue()
+                process = context.Process(target=run_mode, args=(mode, url, job_count + 1, db_path, queue))
+                process.start()
+                count, elapsed, peak, max_rss = queue.get()
+                process.join()
+                print(f"{mode:>9} | {count:7d} jobs | {elapsed:7.2f} s | "
+                      f"peak {peak / 1024 / 1024:8.1f} MB | max RSS {max_rss / 1024 / 1024:8.1f} MB")
+        finally:
+            server.shutdown()
+
+
+if __name__ == "__main__":
+    main()
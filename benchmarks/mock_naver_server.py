@@ -0,0 +1,110 @@
+"""로컬 네이버 뉴스 검색 API 모의 서버.
+
+/v1/search/news.json 요청에 대해 query, display, start 값으로 결정되는 가짜 기사를
+네이버 응답 형식으로 반환합니다. 일부 기사 링크는 모든 query에 공통으로 포함되므로
+카테고리 간 중복 제거 동작도 확인할 수 있습니다.
+
+실행 예시:
+    python -m benchmarks.mock_naver_server --port 8765 --latency-ms 80
+    NAVER_API_URL=http://127.0.0.1:8765/v1/search/news.json uvicorn app.main:app
+"""
+
+import argparse
+import json
+import threading
+import time
+from datetime import datetime, timedelta, timezone
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, quote, urlparse
+
+KST = timezone(timedelta(hours=9))
+BASE_DATE = datetime(2025, 1, 1, tzinfo=KST)
+SHARED_EVERY = 4  # start 기준 4번째 기사마다 모든 query에 공통인 링크를 반환
+
+
+def build_items(query: str, display: int, start: int) -> list:
+    """query, display, start 값으로 결정되는 가짜 기사 목록을 생성합니다."""
+    items = []
+    for index in range(start, start + display):
+        if index % SHARED_EVERY == 0:
+            link = f"https://n.news.naver.com/mock/shared/{index}"
+        else:
+            link = f"https://n.news.naver.com/mock/{quote(query)}/{index}"
+        published = BASE_DATE - timedelta(minutes=index)
+        items.append({
+            "title": f"<b>{query}</b> 모의 기사 {index}",
+            "originallink": f"https://www.asiatoday.co.kr/view/{index}",
+            "link": link,
+            "description": f"<b>{query}</b> 관련 모의 기사 본문 {index}",
+            "pubDate": published.strftime("%a, %d %b %Y %H:%M:%S %z"),
+        })
+    return items
+
+
+class MockNaverHandler(BaseHTTPRequestHandler):
+    """네이버 뉴스 검색 API 응답을 흉내 내는 요청 처리기."""
+
+    latency = 0.0
+
+    def do_GET(self):
+        parsed = urlparse(self.path)
+        if parsed.path != "/v1/search/news.json":
+            self.send_error(404)
+            return
+
+        params = parse_qs(parsed.query)
+        query = params.get("query", [""])[0]
+        display = int(params.get("display", ["10"])[0])
+        start = int(params.get("start", ["1"])[0])
+        if self.latency:
+            time.sleep(self.latency)
+
+        body = json.dumps({
+            "lastBuildDate": BASE_DATE.strftime("%a, %d %b %Y %H:%M:%S %z"),
+            "total": 1000,
+            "start": start,
+            "display": display,
+            "items": build_items(query, display, start),
+        }, ensure_ascii=False).encode("utf-8")
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json; charset=utf-8")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+def start_mock_server(port: int = 0, latency_ms: float = 0.0):
+    """모의 서버를 백그라운드 스레드에서 시작합니다.
+
+    Args:
+        port (int): 사용할 포트. 0이면 빈 포트를 자동으로 사용합니다.
+        latency_ms (float): 응답마다 추가할 지연 시간(ms).
+
+    Returns:
+        tuple: (ThreadingHTTPServer, API URL).
+    """
+    handler = type("Handler", (MockNaverHandler,), {"latency": latency_ms / 1000})
+    server = ThreadingHTTPServer(("127.0.0.1", port), handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server, f"http://127.0.0.1:{server.server_address[1]}/v1/search/news.json"
+
+
+def main():
+    parser = argparse.ArgumentParser(description="로컬 네이버 뉴스 검색 API 모의 서버")
+    parser.add_argument("--port", type=int, default=8765, help="수신 포트")
+    parser.add_argument("--latency-ms", type=float, default=80, help="응답 지연 시간(ms)")
+    args = parser.parse_args()
+
+    server, url = start_mock_server(args.port, args.latency_ms)
+    print(f"mock naver api: {url}")
+    try:
+        threading.Event().wait()
+    except KeyboardInterrupt:
+        server.shutdown()
+
+
+if __name__ == "__main__":
+    main()
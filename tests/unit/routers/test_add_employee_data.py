@@ -1,8 +1,18 @@
+import json
 from unittest.mock import MagicMock, patch
 
 import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
 
-from app.utils.insert_employee_data import fetch_and_insert_recent_jobs
+from app.models import Base, Category, Employee, EmployeeCategory, EmployeeHireType, Feature, HireType
+from app.utils import insert_employee_data
+from app.utils.insert_employee_data import (
+    HIRE_TYPE_CODE_TO_ID,
+    fetch_and_insert_recent_jobs,
+    iter_recruit_jobs,
+    upsert_recruit_jobs,
+)
 
 
 @pytest.fixture
@@ -13,11 +23,27 @@ def mock_db_session():
     mock.commit = MagicMock()
     return mock
 
-@patch("app.utils.insert_employee_data.requests.get")
-def test_fetch_and_insert_recent_jobs_success(mock_get, mock_db_session):
-    """API 응답이 정상적이고, 데이터가 잘 저장되는 경우 테스트"""
+@pytest.fixture
+def db_session(tmp_path):
+    """채용 카테고리(11~35)와 고용형태가 들어 있는 SQLite 세션을 생성합니다."""
+    engine = create_engine(f"sqlite:///{tmp_path / 'employee.db'}")
+    Base.metadata.create_all(bind=engine)
+    session = sessionmaker(bind=engine)()
+    session.add(Feature(feature_id=2, feature_type="employee"))
+    session.add_all(Category(category_id=i, feature_id=2, category_name=f"카테고리{i}") for i in range(11, 36))
+    session.add_all(
+        HireType(hire_type_id=hire_type_id, hire_type_name=code, hire_type_code=code)
+        for code, hire_type_id in HIRE_TYPE_CODE_TO_ID.items()
+    )
+    session.commit()
+    yield session
+    session.close()
+    engine.dispose()
 
-    mock_response_data = {
+@pytest.fixture
+def mock_response_data():
+    """채용 공고 API 응답 예시 (4개 공고, 7개 카테고리 연결, 6개 고용형태 연결)."""
+    return {
         "result": [
             {
                 "recrutPblntSn": "12345678",
@@ -61,14 +87,50 @@ def test_fetch_and_insert_recent_jobs_success(mock_get, mock_db_session):
             }
         ]
     }
+
+@patch("app.utils.insert_employee_data.requests.get")
+def test_fetch_and_insert_recent_jobs_success(mock_get, db_session, mock_response_data):
+    """API 응답이 정상적이고, 데이터가 잘 저장되는 경우 테스트"""
     mock_get.return_value.status_code = 200
     mock_get.return_value.json.return_value = mock_response_data
 
-    inserted = fetch_and_insert_recent_jobs(days=1, db_session=mock_db_session)
+    inserted = fetch_and_insert_recent_jobs(days=1, db_session=db_session)
 
     assert inserted == 4
-    assert mock_db_session.add.call_count == 13  # 7개의 카테고리 + 6개의 고용형태 (4개의 공고는 이미 존재하므로 제외)
-    mock_db_session.commit.assert_called_once()
+    assert db_session.query(Employee).count() == 4
+    assert db_session.query(EmployeeCategory).count() == 7
+    assert db_session.query(EmployeeHireType).count() == 6
+
+def test_upsert_recruit_jobs_rerun_reports_counts(db_session, mock_response_data):
+    """같은 공고를 다시 저장하면 키 충돌 없이 신규/갱신/건너뜀 건수가 집계되는지 테스트"""
+    jobs = mock_response_data["result"]
+    assert upsert_recruit_jobs(db_session, jobs) == {"inserted": 4, "updated": 0, "skipped": 0}
+
+    changed = [dict(jobs[0], recrutPbancTtl="수정된 제목"), *jobs[1:]]
+    unmapped = {**jobs[0], "recrutPblntSn": "1", "ncsCdLst": "R699999"}
+    new_job = {**jobs[0], "recrutPblntSn": "2", "ncsCdLst": "R600003,R600004"}
+
+    stats = upsert_recruit_jobs(db_session, [*changed, unmapped, new_job], batch_size=2)
+
+    assert stats == {"inserted": 1, "updated": 1, "skipped": 4}  # 변경 없음 3건 + 매핑 실패 1건
+    assert db_session.get(Employee, 12345678).title == "수정된 제목"
+    assert db_session.query(EmployeeCategory).count() == 9
+    assert db_session.query(EmployeeHireType).count() == 7
+
+def test_upsert_recruit_jobs_removes_stale_links(db_session, mock_response_data):
+    """다시 수집한 공고의 NCS 코드·고용형태가 줄어들면 응답에 없는 연결이 삭제되는지 테스트"""
+    jobs = mock_response_data["result"]
+    upsert_recruit_jobs(db_session, jobs)
+
+    retitled = dict(jobs[3], recrutPbancTtl="수정된 제목", ncsCdLst="R600002", hireTypeLst="R1040")
+    relinked = dict(jobs[2], ncsCdLst="R600005")  # 공고 값은 그대로이고 연결만 바뀜
+    stats = upsert_recruit_jobs(db_session, [jobs[0], jobs[1], relinked, retitled], batch_size=3)
+
+    assert stats == {"inserted": 0, "updated": 1, "skipped": 3}
+    categories = db_session.query(EmployeeCategory.recruit_id, EmployeeCategory.category_id)
+    assert sorted(categories) == [(12345678, 11), (55667788, 12), (77889900, 15), (99001122, 12)]
+    hire_types = db_session.query(EmployeeHireType.recruit_id, EmployeeHireType.hire_type_id)
+    assert sorted(hire_types) == [(12345678, 1), (55667788, 1), (55667788, 2), (77889900, 3), (99001122, 4)]
 
 @patch("app.utils.insert_employee_data.requests.get")
 def test_fetch_and_insert_recent_jobs_api_fail(mock_get, mock_db_session):
@@ -89,3 +151,66 @@ def test_fetch_and_insert_recent_jobs_invalid_json(mock_get, mock_db_session):
 
     assert inserted == 0
     mock_db_session.add.assert_not_called()
+
+@patch("app.utils.insert_employee_data.requests.get")
+def test_fetch_and_insert_recent_jobs_page_limit(mock_get, mock_db_session, mock_response_data, monkeypatch):
+    """MAX_PAGES 페이지를 조회해도 끝나지 않으면 일부만 조회된 공고를 저장하지 않는지 테스트"""
+    monkeypatch.setattr(insert_employee_data, "MAX_PAGES", 2)
+    mock_get.return_value.status_code = 200
+    mock_get.return_value.json.return_value = {"result": mock_response_data["result"] * 25}
+
+    inserted = fetch_and_insert_recent_jobs(days=1, db_session=mock_db_session)
+
+    assert inserted == 0
+    assert mock_get.call_count == 2
+    mock_db_session.execute.assert_not_called()
+
+def streaming_response(body: dict, status_code: int = 200, chunk_size: int = 16):
+    """iter_content()로 본문을 chunk_size 바이트씩 반환하는 응답 객체를 생성합니다."""
+    raw = json.dumps(body, ensure_ascii=False).encode("utf-8")
+    response = MagicMock(status_code=status_code)
+    response.iter_content.side_effect = lambda size: (
+        raw[offset:offset + chunk_size] for offset in range(0, len(raw), chunk_size)
+    )
+    return response
+
+def test_iter_recruit_jobs_pages_until_short_page(mock_response_data):
+    """스트리밍 조회가 페이지 단위로 공고를 반환하고 조회 건수가 적은 페이지에서 멈추는지 테스트"""
+    jobs = mock_response_data["result"]
+    pages = [{"result": jobs[:2], "totalCount": 3}, {"result": jobs[2:3], "totalCount": 3}]
+    get = MagicMock(side_effect=[streaming_response(page) for page in pages])
+
+    result = list(iter_recruit_jobs("2024-05-01", num_of_rows=2, get=get))
+
+    assert result == jobs[:3]
+    assert [call.kwargs["params"]["pageNo"] for call in get.call_args_list] == [1, 2]
+    assert all(call.kwargs["stream"] for call in get.call_args_list)
+
+@patch("app.utils.insert_employee_data.requests.get")
+def test_fetch_and_insert_recent_jobs_stream(mock_get, db_session, mock_response_data, monkeypatch):
+    """스트리밍 모드에서 STREAM_BATCH_SIZE건씩 나누어 저장해도 결과가 같은지 테스트"""
+    monkeypatch.setattr(insert_employee_data, "STREAM_BATCH_SIZE", 3)
+    mock_get.return_value = streaming_response(mock_response_data)
+
+    with patch.object(insert_employee_data, "upsert_recruit_jobs", wraps=upsert_recruit_jobs) as upsert:
+        inserted = fetch_and_insert_recent_jobs(days=1, db_session=db_session, stream=True)
+
+    assert inserted == 4
+    assert [len(call.args[1]) for call in upsert.call_args_list] == [3, 1]
+    assert db_session.query(Employee).count() == 4
+    assert db_session.query(EmployeeCategory).count() == 7
+    assert db_session.query(EmployeeHireType).count() == 6
+
+@patch("app.utils.insert_employee_data.requests.get")
+def test_fetch_and_insert_recent_jobs_stream_truncated(mock_get, db_session, mock_response_data, monkeypatch):
+    """스트리밍 도중 응답이 잘리면 그때까지 저장한 배치만 남기고 중단하는지 테스트"""
+    monkeypatch.setattr(insert_employee_data, "STREAM_BATCH_SIZE", 2)
+    raw = json.dumps(mock_response_data, ensure_ascii=False).encode("utf-8")
+    truncated = MagicMock(status_code=200)
+    truncated.iter_content.return_value = iter([raw[:-60]])
+    mock_get.return_value = truncated
+
+    inserted = fetch_and_insert_recent_jobs(days=1, db_session=db_session, stream=True)
+
+    assert inserted == 2
+    assert db_session.query(Employee).count() == 2
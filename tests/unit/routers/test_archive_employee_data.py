@@ -0,0 +1,120 @@
+"""마감된 채용 공고 보관 명령 테스트 모듈.
+
+이 모듈은 archive_employee_data의 기능을 테스트합니다.
+
+주요 테스트 항목:
+    - 마감된 공고와 연결 정보가 보관 테이블로 이동하고 지원 가능한 공고는 남는지 확인
+    - 배치 단위 커밋과 재실행 시 이동할 공고가 없는지 확인
+    - 이미 보관된 공고가 다시 마감되면 보관 행이 교체되는지 확인
+    - 공고 이동 후 추천 피드가 다시 계산되는지 확인
+"""
+
+import datetime
+
+import pytest
+from sqlalchemy import create_engine, func, select
+from sqlalchemy.orm import sessionmaker
+
+from app.models import (
+    Base,
+    Category,
+    Employee,
+    EmployeeArchive,
+    EmployeeCategory,
+    EmployeeCategoryArchive,
+    EmployeeHireType,
+    EmployeeHireTypeArchive,
+    Feature,
+    HireType,
+    UserCategory,
+    UserFeed,
+    Users,
+)
+from app.utils.archive_employee_data import archive_expired_postings
+from app.utils.feed_materializer import EMPLOYEE_FEED, refresh_feeds
+
+TODAY = datetime.date.today()  # 피드 계산은 실행일 기준으로 마감 여부를 판단
+
+
+def make_job(recruit_id: int, end_date: datetime.date) -> Employee:
+    return Employee(recruit_id=recruit_id, title=f"공고 {recruit_id}", institution="기관",
+                    start_date=end_date - datetime.timedelta(days=30), end_date=end_date, recrut_pblnt_sn=recruit_id)
+
+
+@pytest.fixture
+def db(tmp_path):
+    """마감된 공고 3건과 지원 가능한 공고 2건이 들어 있는 SQLite 세션을 생성합니다."""
+    engine = create_engine(f"sqlite:///{tmp_path / 'archive.db'}")
+    Base.metadata.create_all(bind=engine)
+    session = sessionmaker(bind=engine)()
+    session.add_all([
+        Feature(feature_id=1, feature_type="employee"),
+        Category(category_id=11, feature_id=1, category_name="사업관리"),
+        HireType(hire_type_id=1, hire_type_name="정규직", hire_type_code="R1010"),
+        Users(user_id="user123", user_name="홍길동"),
+        UserCategory(user_id="user123", category_id=11, is_active=True),
+    ])
+    end_dates = {
+        1: TODAY - datetime.timedelta(days=30),
+        2: TODAY - datetime.timedelta(days=2),
+        3: TODAY - datetime.timedelta(days=1),
+        4: TODAY,  # 오늘 마감 공고는 아직 지원 가능
+        5: TODAY + datetime.timedelta(days=10),
+    }
+    session.add_all([make_job(recruit_id, end_date) for recruit_id, end_date in end_dates.items()])
+    session.add_all([EmployeeCategory(recruit_id=recruit_id, category_id=11) for recruit_id in end_dates])
+    session.add_all([EmployeeHireType(recruit_id=recruit_id, hire_type_id=1) for recruit_id in end_dates])
+    session.commit()
+
+    yield session
+    session.close()
+    engine.dispose()
+
+
+def ids(db, column) -> list:
+    return sorted(db.scalars(select(column)))
+
+
+def test_archive_moves_expired_postings_with_links(db):
+    """마감된 공고와 카테고리·채용형태 연결이 보관 테이블로 옮겨지는지 테스트합니다."""
+    result = archive_expired_postings(db, today=TODAY, batch_size=2)
+
+    assert result["archived"] == 3 and result["batches"] == 2
+    assert ids(db, Employee.recruit_id) == [4, 5]
+    assert ids(db, EmployeeCategory.recruit_id) == [4, 5]
+    assert ids(db, EmployeeHireType.recruit_id) == [4, 5]
+    assert ids(db, EmployeeArchive.recruit_id) == [1, 2, 3]
+    assert ids(db, EmployeeCategoryArchive.recruit_id) == [1, 2, 3]
+    assert ids(db, EmployeeHireTypeArchive.recruit_id) == [1, 2, 3]
+
+    archived = db.get(EmployeeArchive, 2)
+    assert archived.title == "공고 2" and archived.end_date == TODAY - datetime.timedelta(days=2)
+    assert archived.archived_at is not None
+
+    assert archive_expired_postings(db, today=TODAY)["archived"] == 0
+
+
+def test_rearchive_replaces_archived_rows(db):
+    """보관된 공고가 다시 수집되어 마감되면 보관 행을 새 값으로 교체하는지 테스트합니다."""
+    archive_expired_postings(db, today=TODAY)
+
+    job = make_job(1, TODAY - datetime.timedelta(days=1))
+    job.title = "공고 1 (재수집)"
+    db.add(job)
+    db.add(EmployeeCategory(recruit_id=1, category_id=11))
+    db.commit()
+
+    assert archive_expired_postings(db, today=TODAY)["archived"] == 1
+    assert db.get(EmployeeArchive, 1).title == "공고 1 (재수집)"
+    assert db.scalar(select(func.count()).select_from(EmployeeCategoryArchive)) == 3
+
+
+def test_archive_refreshes_feeds(db):
+    """공고를 옮기면 옮긴 공고가 빠지도록 피드가 다시 계산되는지 테스트합니다."""
+    refresh_feeds(db, EMPLOYEE_FEED, feed_size=10)
+    assert ids(db, UserFeed.item_id) == [4, 5]  # 피드에는 지원 가능한 공고만 포함
+
+    result = archive_expired_postings(db, today=TODAY + datetime.timedelta(days=1))
+
+    assert result == {"archived": 4, "batches": 1, "feeds": 1}
+    assert ids(db, UserFeed.item_id) == [5]
@@ -0,0 +1,111 @@
+"""비동기(DB_ASYNC_MODE) 라우터 테스트 모듈.
+
+이 모듈은 AsyncSession 기반으로 등록되는 async 라우터가
+동기 라우터와 동일한 응답을 반환하는지 테스트합니다.
+
+주요 테스트 항목:
+    - 비동기 채용 공고 추천 성공
+    - 비동기 라우터에서 존재하지 않는 사용자 처리
+    - 비동기 카테고리 구독
+"""
+
+import datetime
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+
+from app.main import include_routers
+from app.models import Base, Category, Employee, EmployeeCategory, Feature, UserCategory, Users
+from app.utils.catalog_cache import catalog_cache
+from app.utils.db_manager import db_manager
+from app.utils.user_cache import user_cache
+
+pytest.importorskip("aiosqlite")
+
+TODAY = datetime.date.today()  # 마감된 공고는 추천·검색에서 제외되므로 공고 기간은 실행일 기준으로 생성
+
+# 테스트용 SQLite 파일 DB (동기 엔진으로 데이터 준비, 비동기 엔진으로 조회)
+TEST_DATABASE_URL = "sqlite:///./test.db"
+engine = create_engine(TEST_DATABASE_URL, connect_args={"check_same_thread": False})
+async_engine = create_async_engine("sqlite+aiosqlite:///./test.db")
+TestingAsyncSessionLocal = async_sessionmaker(bind=async_engine, autoflush=False, expire_on_commit=False)
+
+# 비동기 라우터만 등록한 테스트용 앱
+async_app = FastAPI()
+include_routers(async_app, async_mode=True)
+
+
+@pytest.fixture(scope="function")
+def test_db():
+    """테스트용 테이블을 생성하고 사용자, 카테고리, 채용 공고 데이터를 삽입합니다."""
+    Base.metadata.drop_all(bind=engine)
+    Base.metadata.create_all(bind=engine)
+    with engine.begin() as conn:
+        conn.execute(Users.__table__.insert(), [{"user_id": "user123", "user_name": "홍길동"}])
+        conn.execute(Feature.__table__.insert(), [{"feature_id": 1, "feature_type": "employee"}])
+        conn.execute(Category.__table__.insert(), [
+            {"category_id": 1, "feature_id": 1, "category_name": "AI"},
+            {"category_id": 2, "feature_id": 1, "category_name": "정보통신"},
+        ])
+        conn.execute(UserCategory.__table__.insert(), [{"user_id": "user123", "category_id": 1, "is_active": True}])
+        conn.execute(Employee.__table__.insert(), [{
+            "recruit_id": 1,
+            "title": "AI 연구원",
+            "institution": "OpenAI",
+            "start_date": TODAY - datetime.timedelta(days=10),
+            "end_date": TODAY + datetime.timedelta(days=20),
+            "recrut_se": "R2030",
+            "detail_url": "https://example.com/openai",
+            "recrut_pblnt_sn": 280271,
+        }])
+        conn.execute(EmployeeCategory.__table__.insert(), [{"recruit_id": 1, "category_id": 1}])
+    catalog_cache.invalidate()  # Core insert는 ORM 커밋 훅을 거치지 않음
+    user_cache.invalidate()
+    yield
+    Base.metadata.drop_all(bind=engine)
+
+
+async def override_get_async_db():
+    """테스트용 비동기 DB 세션을 제공하는 의존성 주입 함수입니다."""
+    async with TestingAsyncSessionLocal() as db:
+        yield db
+
+async_app.dependency_overrides[db_manager.get_async_db] = override_get_async_db
+
+
+@pytest.fixture(scope="function")
+def async_client():
+    """비동기 라우터가 등록된 테스트 클라이언트를 생성합니다."""
+    with TestClient(async_app) as client:
+        yield client
+
+
+def test_async_recruit_recommendation_success(async_client: TestClient, test_db):
+    """비동기 라우터에서 구독 카테고리 기반 채용 공고 추천이 동작하는지 테스트합니다."""
+    response = async_client.get("/employee/recommend", params={"user_id": "user123", "limit": 1})
+    assert response.status_code == 200
+
+    data = response.json()
+    assert len(data["results"]) == 1
+    assert data["results"][0]["institution"] == "OpenAI"
+    assert data["message"] is None
+
+
+def test_async_recruit_recommendation_user_not_found(async_client: TestClient, test_db):
+    """비동기 라우터에서도 존재하지 않는 사용자는 404를 반환하는지 테스트합니다."""
+    response = async_client.get("/employee/recommend", params={"user_id": "ghost"})
+    assert response.status_code == 404
+    assert response.json() == {"detail": "User not found"}
+
+
+def test_async_subscribe_category(async_client: TestClient, test_db):
+    """비동기 라우터에서 카테고리 구독 후 구독 목록에 반영되는지 테스트합니다."""
+    response = async_client.post("/user/subscribe", json={"user_id": "user123", "category_id": 2})
+    assert response.status_code == 200
+
+    response = async_client.get("/user/user123")
+    assert response.status_code == 200
+    assert {item["category_name"] for item in response.json()} == {"AI", "정보통신"}
@@ -0,0 +1,145 @@
+"""채용 공고 백필 명령 테스트 모듈.
+
+이 모듈은 backfill_employee_data의 기능을 테스트합니다.
+
+주요 테스트 항목:
+    - 날짜 단위 분할과 numOfRows/pageNo 페이지 조회
+    - 조회 실패 날짜를 제외한 저장 및 체크포인트 기록
+    - 재실행 시 완료된 날짜를 건너뛰는 이어하기
+    - API가 이후 날짜의 공고까지 돌려줘도 날짜 구간끼리 겹치지 않고, 그 날짜를 넘으면 조회를 멈추는지 확인
+    - 페이지 상한(MAX_PAGES)에 걸린 날짜는 체크포인트를 남기지 않는지 확인
+"""
+
+from datetime import date
+from unittest.mock import MagicMock
+
+import pytest
+import requests
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from app.models import Base, Category, Employee, EmployeeCategory, Feature, RecruitBackfillCheckpoint
+from app.utils import insert_employee_data
+from app.utils.backfill_employee_data import backfill_recruit_jobs, date_shards
+
+
+@pytest.fixture
+def db_session(tmp_path):
+    """채용 카테고리(11~35)가 들어 있는 SQLite 세션을 생성합니다."""
+    engine = create_engine(f"sqlite:///{tmp_path / 'backfill.db'}")
+    Base.metadata.create_all(bind=engine)
+    session = sessionmaker(bind=engine)()
+    session.add(Feature(feature_id=2, feature_type="employee"))
+    session.add_all(Category(category_id=i, feature_id=2, category_name=f"카테고리{i}") for i in range(11, 36))
+    session.commit()
+    yield session
+    session.close()
+    engine.dispose()
+
+
+def fake_api(jobs_per_day, broken_days=(), through=None, newest_first=False):
+    """날짜별로 jobs_per_day건의 공고를 pageNo/numOfRows로 나누어 반환하는 가짜 HTTP 세션을 생성합니다.
+
+    through(date)가 있으면 요청한 날짜부터 through까지의 공고를 모두 반환합니다 ("이후" 조건).
+    공고는 공고 시작일 오름차순이며, newest_first=True이면 내림차순으로 반환합니다.
+    """
+    def fake_get(url, params, timeout):
+        day = params["pbancBgngYmd"]
+        if day in broken_days:
+            raise requests.ConnectionError("boom")
+        first = date.fromisoformat(day)
+        days = date_shards(first, through) if through else [first]
+        jobs = [
+            {
+                "recrutPblntSn": f"{shard:%Y%m%d}{index:03d}",
+                "recrutPbancTtl": f"{shard} 공고 {index}",
+                "instNm": "기관",
+                "pbancBgngYmd": f"{shard:%Y%m%d}",
+                "pbancEndYmd": f"{shard:%Y%m%d}",
+                "recrutSe": "R2010",
+                "ncsCdLst": "R600001",
+                "hireTypeLst": "",
+            }
+            for shard in days for index in range(jobs_per_day)
+        ]
+        if newest_first:
+            jobs.reverse()
+        offset = (params["pageNo"] - 1) * params["numOfRows"]
+        response = MagicMock(status_code=200)
+        response.json.return_value = {"totalCount": len(jobs), "result": jobs[offset:offset + params["numOfRows"]]}
+        return response
+
+    session = MagicMock(spec=requests.Session)
+    session.get.side_effect = fake_get
+    return session
+
+
+def test_date_shards():
+    assert date_shards(date(2024, 2, 28), date(2024, 3, 1)) == [date(2024, 2, 28), date(2024, 2, 29), date(2024, 3, 1)]
+
+
+def test_backfill_pages_shards_and_records_checkpoints(db_session):
+    session = fake_api(jobs_per_day=25, broken_days={"2024-05-02"})
+
+    result = backfill_recruit_jobs(db_session, date(2024, 5, 1), date(2024, 5, 3), workers=2, num_of_rows=10,
+                                   deadline=0, session=session)
+
+    assert result == {"shards": 2, "fetched": 50, "inserted": 50, "updated": 0, "skipped": 0,
+                      "failed": [date(2024, 5, 2)]}
+    assert session.get.call_count == 3 + 1 + 3  # 하루 25건 = 3페이지, 실패한 날은 1회
+    assert db_session.query(Employee).count() == 50
+    assert db_session.query(EmployeeCategory).count() == 50
+    assert {row.shard_date for row in db_session.query(RecruitBackfillCheckpoint)} == {
+        date(2024, 5, 1), date(2024, 5, 3)
+    }
+
+
+def test_backfill_resumes_from_checkpoint(db_session):
+    backfill_recruit_jobs(db_session, date(2024, 5, 1), date(2024, 5, 3), workers=2, num_of_rows=10,
+                          deadline=0, session=fake_api(jobs_per_day=5, broken_days={"2024-05-02"}))
+
+    session = fake_api(jobs_per_day=5)
+    result = backfill_recruit_jobs(db_session, date(2024, 5, 1), date(2024, 5, 3), workers=2, num_of_rows=10,
+                                   session=session)
+
+    assert (result["shards"], result["inserted"], result["failed"]) == (1, 5, [])
+    assert [call.kwargs["params"]["pbancBgngYmd"] for call in session.get.call_args_list] == ["2024-05-02"]
+    assert db_session.query(RecruitBackfillCheckpoint).count() == 3
+
+
+def test_backfill_shards_do_not_overlap(db_session):
+    end = date(2024, 5, 3)
+    session = fake_api(jobs_per_day=4, through=end)
+
+    result = backfill_recruit_jobs(db_session, date(2024, 5, 1), end, workers=2, num_of_rows=10, session=session)
+
+    # 5/1 조회는 5/1~5/3 공고 12건을 돌려주지만 5/1 공고 4건만 저장
+    assert (result["fetched"], result["inserted"], result["updated"]) == (12, 12, 0)
+    checkpoints = db_session.query(RecruitBackfillCheckpoint).order_by(RecruitBackfillCheckpoint.shard_date)
+    assert [row.fetched for row in checkpoints] == [4, 4, 4]
+    assert db_session.query(Employee).count() == 12
+    # 5/1 조회의 첫 페이지(10건)에 5/3 공고가 있으므로 두 번째 페이지는 조회하지 않음
+    assert session.get.call_count == 3
+
+
+def test_backfill_reads_every_page_when_results_are_not_ascending(db_session):
+    end = date(2024, 5, 3)
+    session = fake_api(jobs_per_day=4, through=end, newest_first=True)
+
+    result = backfill_recruit_jobs(db_session, date(2024, 5, 1), end, workers=2, num_of_rows=10, session=session)
+
+    assert (result["fetched"], result["inserted"]) == (12, 12)
+    assert session.get.call_count == 2 + 1 + 1  # 5/1 공고는 마지막 페이지에 있으므로 끝까지 조회
+
+
+def test_backfill_page_limit_fails_shard(db_session, monkeypatch):
+    monkeypatch.setattr(insert_employee_data, "MAX_PAGES", 2)
+    session = fake_api(jobs_per_day=25)
+
+    result = backfill_recruit_jobs(db_session, date(2024, 5, 1), date(2024, 5, 1), num_of_rows=10,
+                                   deadline=60, session=session)
+
+    assert (result["shards"], result["failed"]) == (0, [date(2024, 5, 1)])
+    assert session.get.call_count == 2  # 일부만 조회된 결과는 재시도하거나 저장하지 않음
+    assert db_session.query(Employee).count() == 0
+    assert db_session.query(RecruitBackfillCheckpoint).count() == 0
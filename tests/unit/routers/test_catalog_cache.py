@@ -0,0 +1,96 @@
+"""카테고리/기능 카탈로그 캐시 테스트 모듈.
+
+이 모듈은 catalog_cache의 기능을 테스트합니다.
+
+주요 테스트 항목:
+    - 스냅샷을 한 번 읽은 뒤 DB 조회 없이 재사용하는지 확인
+    - TTL 만료 및 invalidate() 호출 시 버전이 올라가며 다시 읽는지 확인
+    - ORM으로 Category를 변경하고 커밋하면 자동 무효화되는지 확인
+"""
+
+import pytest
+from sqlalchemy import create_engine, event
+from sqlalchemy.orm import sessionmaker
+
+from app.models import Base, Category, Feature
+from app.utils.catalog_cache import CatalogCache, catalog_cache
+
+
+@pytest.fixture
+def session_local(tmp_path):
+    """기능 2개와 카테고리 3개가 들어 있는 SQLite 세션 팩토리를 생성합니다."""
+    engine = create_engine(f"sqlite:///{tmp_path / 'catalog.db'}")
+    Base.metadata.create_all(bind=engine)
+    session_local = sessionmaker(bind=engine)
+    with session_local() as db:
+        db.add_all([Feature(feature_type="news"), Feature(feature_type="employee")])
+        db.add_all([
+            Category(feature_id=1, category_name="AI"),
+            Category(feature_id=2, category_name="정보통신"),
+            Category(feature_id=2, category_name="디자인"),
+        ])
+        db.commit()
+    yield session_local
+    engine.dispose()
+
+
+def count_selects(engine):
+    """engine에서 실행되는 SELECT 문 목록을 반환합니다."""
+    statements = []
+
+    @event.listens_for(engine, "before_cursor_execute")
+    def capture(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    return statements
+
+
+def test_snapshot_is_reused(session_local):
+    """스냅샷을 읽은 뒤에는 DB를 조회하지 않고 같은 스냅샷을 반환하는지 테스트합니다."""
+    cache = CatalogCache(ttl=60)
+    with session_local() as db:
+        statements = count_selects(db.get_bind())
+        snapshot = cache.get(db)
+        loaded = len(statements)
+        again = cache.get(db)
+
+    assert again is snapshot
+    assert len(statements) == loaded
+    assert snapshot.version == 1
+    assert snapshot.features == {"news": 1, "employee": 2}
+    assert snapshot.get_category(2).category_name == "정보통신"
+    assert snapshot.get_category(99) is None
+    assert [c.category_name for c in snapshot.categories_of("employee")] == ["정보통신", "디자인"]
+
+
+def test_snapshot_refreshes_on_ttl_and_invalidate(session_local):
+    """TTL이 지나거나 invalidate()가 호출되면 새 버전의 스냅샷을 읽는지 테스트합니다."""
+    now = [0.0]
+    cache = CatalogCache(ttl=10, clock=lambda: now[0])
+    with session_local() as db:
+        first = cache.get(db)
+        now[0] = 5.0
+        assert cache.get(db) is first
+
+        now[0] = 11.0
+        second = cache.get(db)
+        assert second.version == 2
+
+        cache.invalidate()
+        assert cache.get(db).version == 3
+
+
+def test_orm_commit_invalidates_global_cache(session_local):
+    """ORM으로 카테고리를 추가하거나 일괄 삭제하고 커밋하면 전역 캐시가 무효화되는지 테스트합니다."""
+    with session_local() as db:
+        before = catalog_cache.get(db)
+
+        db.add(Category(feature_id=1, category_name="Cloud"))
+        db.commit()
+        added = catalog_cache.get(db)
+        assert added.version > before.version
+        assert [c.category_name for c in added.categories_of("news")] == ["AI", "Cloud"]
+
+        db.query(Category).filter(Category.category_name == "Cloud").delete()
+        db.commit()
+        assert catalog_cache.get(db).categories_of("news")[-1].category_name == "AI"
@@ -0,0 +1,91 @@
+import time
+from types import MappingProxyType
+from unittest.mock import MagicMock
+
+import pytest
+
+from app.utils.catalog_cache import CatalogCategory, CatalogSnapshot
+from app.utils.category_matcher import (
+    ElasticsearchCategoryMatcher,
+    LocalCategoryMatcher,
+    create_category_matcher,
+)
+
+
+def make_catalog(names, version=1):
+    """채용 카테고리 이름 목록으로 카탈로그 스냅샷을 생성합니다. (뉴스 카테고리 "디자인" 포함)"""
+    categories = {1: CatalogCategory(1, 1, "news", "디자인")}
+    for offset, name in enumerate(names):
+        categories[11 + offset] = CatalogCategory(11 + offset, 2, "employee", name)
+    return CatalogSnapshot(
+        version=version,
+        loaded_at=0.0,
+        features=MappingProxyType({"news": 1, "employee": 2}),
+        categories=MappingProxyType(categories),
+    )
+
+
+CATALOG = make_catalog(["사회복지·종교", "교육·자연·사회과학", "정보통신", "문화·예술·디자인·방송", "경영·회계·사무"])
+
+
+@pytest.mark.parametrize("keyword,expected", [
+    ("정", ("정보통신", 13)),  # 한 글자 접두어
+    ("정보통신", ("정보통신", 13)),
+    ("디자인", ("문화·예술·디자인·방송", 14)),  # 뉴스 카테고리는 제외
+    ("경영 회계", ("경영·회계·사무", 15)),  # 연속된 단어의 구(phrase) 접두어
+    ("회계 경영", ("기타", 0)),  # 단어 순서가 다르면 후보가 아님
+    ("정보통신기술자격증", ("기타", 0)),
+    ("  ", ("기타", 0)),
+])
+def test_local_matcher(keyword, expected):
+    """로컬 매처가 Elasticsearch 검색과 같은 후보 규칙으로 카테고리를 찾는지 테스트"""
+    assert LocalCategoryMatcher().match(keyword, CATALOG) == expected
+
+
+def test_local_matcher_prefers_bm25_match():
+    """prefix 후보가 여러 개면 BM25 match 점수(짧은 이름)가 높은 카테고리를 선택하는지 테스트"""
+    assert LocalCategoryMatcher().match("사회", CATALOG) == ("사회복지·종교", 11)
+    # "사회복" 은 '사회복지' 의 n-gram이므로 BM25로도 매칭됨
+    assert LocalCategoryMatcher().match("사회복", CATALOG) == ("사회복지·종교", 11)
+
+
+def test_local_matcher_rebuilds_on_catalog_version():
+    """카탈로그 스냅샷 버전이 바뀌면 역색인을 다시 만드는지 테스트"""
+    matcher = LocalCategoryMatcher()
+    assert matcher.match("연구", CATALOG) == ("기타", 0)
+
+    updated = make_catalog(["사회복지·종교", "연구"], version=CATALOG.version + 1)
+    assert matcher.match("연구", updated) == ("연구", 12)
+
+
+def test_local_matcher_is_fast():
+    """역색인 조회이므로 매칭 한 번이 수십 마이크로초 안에 끝나는지 테스트"""
+    matcher = LocalCategoryMatcher()
+    matcher.match("정보", CATALOG)  # 역색인 생성
+
+    started = time.perf_counter()
+    for _ in range(1000):
+        matcher.match("정보", CATALOG)
+    assert (time.perf_counter() - started) / 1000 < 0.0005
+
+
+def test_elasticsearch_matcher():
+    """Elasticsearch 매처가 한 번의 검색으로 1순위 카테고리를 반환하는지 테스트"""
+    client = MagicMock()
+    client.search.return_value = {"hits": {"hits": [{"_source": {"category_name": "정보통신", "category_id": 30}}]}}
+
+    assert ElasticsearchCategoryMatcher(client).match("정보", CATALOG) == ("정보통신", 30)
+    client.search.assert_called_once()
+
+    client.search.return_value = {"hits": {"hits": []}}
+    assert ElasticsearchCategoryMatcher(client).match("없음", CATALOG) == ("기타", 0)
+
+
+def test_create_category_matcher(monkeypatch):
+    """CATEGORY_MATCHER 설정에 따라 매처를 선택하는지 테스트"""
+    monkeypatch.setenv("CATEGORY_MATCHER", "local")
+    assert isinstance(create_category_matcher(), LocalCategoryMatcher)
+    monkeypatch.delenv("CATEGORY_MATCHER")
+    assert isinstance(create_category_matcher(es_client=MagicMock()), ElasticsearchCategoryMatcher)
+    with pytest.raises(ValueError):
+        create_category_matcher("solr")
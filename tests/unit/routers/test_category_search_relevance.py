@@ -0,0 +1,118 @@
+"""
+/employee/DB_search 카테고리 매칭 품질(relevance) 회귀 테스트 모듈.
+
+기본 카테고리(init_default_data)를 대상으로, 키워드별로 기대한 카테고리가 1순위로 반환되는지
+두 매처(CATEGORY_MATCHER)에서 모두 확인합니다.
+
+- local: 카탈로그 스냅샷으로 만든 프로세스 내 역색인 (항상 실행)
+- elasticsearch: 운영과 같은 매핑(INDEX_BODY)으로 색인한 실제 Elasticsearch 임시 인덱스.
+  Elasticsearch가 필요하므로 ES_TEST_URL 환경 변수가 있을 때만 실행됩니다.
+    docker run -d -p 9200:9200 -e discovery.type=single-node -e xpack.security.enabled=false \\
+        docker.elastic.co/elasticsearch/elasticsearch:8.12.0
+    ES_TEST_URL=http://localhost:9200 pytest tests/unit/routers/test_category_search_relevance.py
+"""
+
+import os
+import uuid
+
+import pytest
+from elasticsearch import Elasticsearch, helpers
+from sqlalchemy import create_engine, select
+from sqlalchemy.orm import sessionmaker
+
+from app.models import Base, Category, Feature
+from app.utils.catalog_cache import CatalogCache
+from app.utils.category_matcher import ElasticsearchCategoryMatcher, LocalCategoryMatcher
+from app.utils.init_default_data import add_default_categories, add_default_features
+from app.utils.init_elasticsearch_index import INDEX_BODY
+
+ES_TEST_URL = os.getenv("ES_TEST_URL")
+
+# (검색 키워드, 기대하는 1순위 카테고리명). 후보가 없으면 "기타"로 처리되어야 함
+RELEVANCE_CASES = [
+    ("정보통신", "정보통신"),
+    ("정보", "정보통신"),
+    ("보건", "보건·의료"),
+    ("의료", "보건·의료"),
+    ("금융", "금융·보험"),
+    ("보험", "금융·보험"),
+    ("전기", "전기·전자"),
+    ("건설", "건설"),
+    ("연구", "연구"),
+    ("디자인", "문화·예술·디자인·방송"),  # 뉴스 카테고리 "디자인"은 제외되어야 함
+    ("영업", "영업판매"),  # 뉴스 카테고리 "영업/제휴"는 제외되어야 함
+    ("음식", "음식서비스"),
+    ("경영 회계", "경영·회계·사무"),
+    ("사회복지", "사회복지·종교"),
+    ("숙박 여행", "이용·숙박·여행·오락·스포츠"),
+    ("존재하지않는키워드", "기타"),
+]
+
+
+def default_category_session():
+    """init_default_data의 기본 기능 유형과 카테고리를 삽입한 메모리 SQLite 세션을 생성합니다."""
+    engine = create_engine("sqlite://")
+    Base.metadata.create_all(bind=engine)
+    db = sessionmaker(bind=engine)()
+    add_default_features(db)
+    db.commit()
+    add_default_categories(db)
+    db.commit()
+    return db
+
+
+@pytest.fixture(scope="module")
+def catalog():
+    """기본 카테고리의 카탈로그 스냅샷."""
+    db = default_category_session()
+    snapshot = CatalogCache(ttl=300).get(db)
+    db.close()
+    return snapshot
+
+
+@pytest.fixture(scope="module")
+def es_matcher():
+    """운영과 같은 매핑의 임시 인덱스에 기본 카테고리를 색인한 Elasticsearch 매처를 만듭니다.
+
+    테스트가 끝나면 임시 인덱스를 삭제합니다.
+    """
+    if not ES_TEST_URL:
+        pytest.skip("ES_TEST_URL이 설정되지 않아 Elasticsearch 테스트를 건너뜁니다.")
+    db = default_category_session()
+    rows = db.execute(
+        select(Category.category_id, Category.category_name, Feature.feature_type)
+        .join(Feature, Category.feature_id == Feature.feature_id)
+    ).all()
+    db.close()
+
+    client = Elasticsearch(ES_TEST_URL)
+    index = f"categories-relevance-{uuid.uuid4().hex[:8]}"
+    client.indices.create(index=index, body=INDEX_BODY)
+    helpers.bulk(client, (
+        {
+            "_index": index,
+            "_id": row.category_id,
+            "_source": {
+                "category_id": row.category_id,
+                "category_name": row.category_name,
+                "feature": row.feature_type,
+            },
+        }
+        for row in rows
+    ), refresh="wait_for")
+    yield ElasticsearchCategoryMatcher(client, index=index)
+    client.indices.delete(index=index)
+
+
+@pytest.mark.parametrize("keyword,expected", RELEVANCE_CASES)
+def test_local_category_relevance(catalog, keyword, expected):
+    """로컬 매처의 키워드별 1순위 카테고리가 기대값과 같은지 테스트"""
+    matched_category, _ = LocalCategoryMatcher().match(keyword, catalog)
+    assert matched_category == expected
+
+
+@pytest.mark.parametrize("keyword,expected", RELEVANCE_CASES)
+def test_elasticsearch_category_relevance(es_matcher, catalog, keyword, expected):
+    """Elasticsearch 매처의 키워드별 1순위 카테고리가 기대값과 같은지 테스트"""
+    matched_category, _ = es_matcher.match(keyword, catalog)
+    assert matched_category == expected
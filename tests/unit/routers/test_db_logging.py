@@ -0,0 +1,104 @@
+"""데이터베이스 쿼리 로깅 테스트 모듈.
+
+이 모듈은 db_logging의 기능을 테스트합니다.
+
+주요 테스트 항목:
+    - DB_LOG_MODE 환경 변수 로딩 (기본값 off, 잘못된 값 검증)
+    - 임계값을 넘는 쿼리만 route/파라미터와 함께 기록
+    - HTTP 요청 중에는 실제 경로 대신 라우트 템플릿을 기록
+    - 실패한 쿼리의 시작 시각이 다음 쿼리 측정에 남지 않는지 확인
+"""
+
+import logging
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine, exc, text
+
+from app.utils.db_logging import (
+    RouteContextMiddleware,
+    current_route,
+    install_slow_query_logging,
+    load_log_options,
+)
+
+
+def test_load_log_options_default_off(monkeypatch):
+    """환경 변수가 없으면 echo 없이 off 모드가 사용되는지 테스트합니다."""
+    monkeypatch.delenv("DB_LOG_MODE", raising=False)
+    monkeypatch.delenv("DB_SLOW_QUERY_MS", raising=False)
+    monkeypatch.delenv("DB_SLOW_QUERY_SAMPLE_RATE", raising=False)
+
+    assert load_log_options() == {"mode": "off", "slow_query_ms": 200, "sample_rate": 1.0}
+
+
+def test_load_log_options_invalid_mode(monkeypatch):
+    """지원하지 않는 로그 모드일 경우 ValueError가 발생하는지 테스트합니다."""
+    monkeypatch.setenv("DB_LOG_MODE", "verbose")
+
+    with pytest.raises(ValueError):
+        load_log_options()
+
+
+def test_slow_query_logged_with_route_and_parameters(caplog):
+    """임계값(0ms)을 넘는 쿼리가 route와 파라미터를 포함해 기록되는지 테스트합니다."""
+    engine = create_engine("sqlite://")
+    install_slow_query_logging(engine, slow_query_ms=0)
+
+    token = current_route.set("/employee/recommend")
+    try:
+        with caplog.at_level(logging.WARNING, logger="app.db.slow_query"):
+            with engine.connect() as conn:
+                conn.execute(text("SELECT :value"), {"value": 42})
+    finally:
+        current_route.reset(token)
+
+    record = caplog.records[-1]
+    assert record.route == "/employee/recommend"
+    assert record.parameters == (42,)
+    assert "SELECT" in record.statement
+
+
+def test_fast_query_not_logged(caplog):
+    """임계값보다 빠른 쿼리는 기록되지 않는지 테스트합니다."""
+    engine = create_engine("sqlite://")
+    install_slow_query_logging(engine, slow_query_ms=60_000)
+
+    with caplog.at_level(logging.WARNING, logger="app.db.slow_query"):
+        with engine.connect() as conn:
+            conn.execute(text("SELECT 1"))
+
+    assert not caplog.records
+
+
+def test_slow_query_logged_with_route_template(caplog):
+    """HTTP 요청 중 기록되는 route가 경로 파라미터 값이 아닌 라우트 템플릿인지 테스트합니다."""
+    engine = create_engine("sqlite://")
+    install_slow_query_logging(engine, slow_query_ms=0)
+    app = FastAPI()
+    app.add_middleware(RouteContextMiddleware)
+
+    @app.get("/user/{user_id}")
+    def read_user(user_id: str):
+        with engine.connect() as conn:
+            conn.execute(text("SELECT :user_id"), {"user_id": user_id})
+        return {}
+
+    with caplog.at_level(logging.WARNING, logger="app.db.slow_query"):
+        assert TestClient(app).get("/user/user-42").status_code == 200
+
+    assert [record.route for record in caplog.records] == ["/user/{user_id}"]
+
+
+def test_failed_query_discards_timer():
+    """실패한 쿼리의 시작 시각이 연결에 남지 않는지 테스트합니다."""
+    engine = create_engine("sqlite://")
+    install_slow_query_logging(engine, slow_query_ms=60_000)
+
+    with engine.connect() as conn:
+        with pytest.raises(exc.OperationalError):
+            conn.execute(text("SELECT * FROM missing_table"))
+        conn.execute(text("SELECT 1"))
+
+        assert conn.connection.info.get("query_start_time") == []
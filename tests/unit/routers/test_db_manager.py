@@ -0,0 +1,73 @@
+"""DBManager 지연 초기화 테스트 모듈.
+
+이 모듈은 db_manager와 setup_database의 기능을 테스트합니다.
+
+주요 테스트 항목:
+    - 생성 시점에 DB 연결/엔진 생성을 하지 않는지 확인
+    - 최초 사용 시 엔진 생성 및 풀 통계 노출
+    - 기본 데이터가 이미 있으면 재삽입을 건너뛰는지 확인
+    - API 서버 기동(lifespan) 시 DB 연결을 기다리는지 확인
+"""
+
+from fastapi.testclient import TestClient
+
+from app.main import app
+from app.models import Feature, Users
+from app.utils.db_manager import DBManager, db_manager
+
+
+def make_manager(tmp_path, monkeypatch):
+    """SQLite 파일 DB를 바라보는 DBManager를 생성합니다."""
+    monkeypatch.setenv("DB_CONNECT_TIMEOUT", "0")  # sqlite는 connect_timeout 인자를 받지 않음
+    manager = DBManager()
+    manager.db_url = f"sqlite:///{tmp_path / 'manager.db'}"
+    return manager
+
+
+def test_db_manager_is_lazy():
+    """DBManager 생성만으로는 엔진이 만들어지지 않는지 테스트합니다."""
+    manager = DBManager()
+
+    assert manager._engine is None
+    assert manager._async_engine is None
+    assert manager.pool_status() == {"sync": None, "async": None}
+
+
+def test_engine_created_on_first_use(tmp_path, monkeypatch):
+    """엔진 접근 시 한 번만 생성되고 풀 통계가 노출되는지 테스트합니다."""
+    manager = make_manager(tmp_path, monkeypatch)
+
+    engine = manager.engine
+    manager.wait_for_connection(deadline=1)
+
+    assert manager.engine is engine
+    assert manager.pool_status()["sync"]["checkouts"] >= 1
+
+
+def test_init_default_data_runs_once(tmp_path, monkeypatch):
+    """기본 데이터가 한 번만 삽입되고, 두 번째 실행은 건너뛰는지 테스트합니다."""
+    manager = make_manager(tmp_path, monkeypatch)
+    manager.init_db()
+
+    manager.init_default_data()
+    manager.init_default_data()
+
+    db = manager.SessionLocal()
+    try:
+        assert db.query(Feature).count() == 2
+        assert db.query(Users).filter(Users.user_id == "admin").count() == 1
+    finally:
+        db.close()
+        manager.SessionLocal.remove()
+        manager.engine.dispose()
+
+
+def test_app_startup_waits_for_connection(monkeypatch):
+    """API 서버가 기동될 때 요청을 받기 전에 DB 연결을 기다리는지 테스트합니다."""
+    calls = []
+    monkeypatch.setenv("CATEGORY_MATCHER", "local")
+    monkeypatch.setattr(db_manager, "wait_for_connection", lambda: calls.append("wait"))
+
+    with TestClient(app) as client:
+        assert calls == ["wait"]
+        assert client.get("/health/live").status_code == 200
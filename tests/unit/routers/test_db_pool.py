@@ -0,0 +1,69 @@
+"""데이터베이스 커넥션 풀 설정 테스트 모듈.
+
+이 모듈은 db_pool의 기능을 테스트합니다.
+
+주요 테스트 항목:
+    - 환경 변수 기반 풀 설정 로딩
+    - 커넥션 체크아웃/overflow/대기 시간 통계 수집
+"""
+
+from sqlalchemy import create_engine
+
+from app.utils.db_pool import InstrumentedQueuePool, load_pool_options, pool_stats
+
+
+def test_load_pool_options_defaults(monkeypatch):
+    """환경 변수가 없으면 기본 풀 설정이 사용되는지 테스트합니다."""
+    for name in ("DB_POOL_SIZE", "DB_MAX_OVERFLOW", "DB_POOL_TIMEOUT", "DB_POOL_RECYCLE",
+                 "DB_POOL_PRE_PING", "DB_STATEMENT_TIMEOUT_MS", "DB_CONNECT_TIMEOUT"):
+        monkeypatch.delenv(name, raising=False)
+
+    options = load_pool_options()
+
+    assert options == {
+        "pool_size": 5,
+        "max_overflow": 10,
+        "pool_timeout": 30,
+        "pool_recycle": 1800,
+        "pool_pre_ping": True,
+        "connect_args": {"connect_timeout": 5},
+    }
+
+
+def test_load_pool_options_from_env(monkeypatch):
+    """환경 변수로 풀 크기와 statement timeout을 설정할 수 있는지 테스트합니다."""
+    monkeypatch.setenv("DB_POOL_SIZE", "20")
+    monkeypatch.setenv("DB_MAX_OVERFLOW", "0")
+    monkeypatch.setenv("DB_POOL_PRE_PING", "false")
+    monkeypatch.setenv("DB_STATEMENT_TIMEOUT_MS", "3000")
+    monkeypatch.setenv("DB_CONNECT_TIMEOUT", "0")
+
+    options = load_pool_options()
+
+    assert options["pool_size"] == 20
+    assert options["max_overflow"] == 0
+    assert options["pool_pre_ping"] is False
+    assert options["connect_args"] == {"options": "-c statement_timeout=3000"}
+
+
+def test_pool_stats_tracks_checkout_and_overflow(tmp_path):
+    """체크아웃된 커넥션 수, overflow, 대기 시간 통계가 집계되는지 테스트합니다."""
+    engine = create_engine(
+        f"sqlite:///{tmp_path / 'pool.db'}",
+        poolclass=InstrumentedQueuePool,
+        pool_size=1,
+        max_overflow=1,
+    )
+
+    first = engine.connect()
+    second = engine.connect()
+    stats = pool_stats(engine.pool)
+
+    assert stats["checked_out"] == 2
+    assert stats["overflow"] == 1
+    assert stats["checkouts"] == 2
+    assert stats["wait_max_ms"] >= 0
+
+    first.close()
+    second.close()
+    engine.dispose()
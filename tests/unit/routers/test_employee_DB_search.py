@@ -9,6 +9,7 @@
     - Elasticsearch에서 카테고리 미검색 시 기본 카테고리 처리
     - 해당 카테고리에 채용 공고가 없을 경우 처리
     - limit 파라미터 동작 확인 (최대 개수 제한 등)
+    - next_cursor로 다음 페이지를 조회하는 커서 페이지네이션
 """
 
 import datetime
@@ -33,6 +34,8 @@ from app.models import (
 )
 from app.utils.db_manager import db_manager
 
+TODAY = datetime.date.today()  # 마감된 공고는 추천·검색에서 제외되므로 공고 기간은 실행일 기준으로 생성
+
 # 테스트용 SQLite DB 설정
 TEST_DATABASE_URL = "sqlite:///./test.db"
 engine = create_engine(TEST_DATABASE_URL, connect_args={"check_same_thread": False})
@@ -101,8 +104,8 @@ def test_db(setup_database):
         recruit_id=1,
         title="정보통신 개발자",
         institution="TechCorp",
-        start_date=datetime.date(2025, 5, 1),
-        end_date=datetime.date(2025, 5, 31),
+        start_date=TODAY - datetime.timedelta(days=5),
+        end_date=TODAY + datetime.timedelta(days=25),
         recrut_se="R2010",
         detail_url="https://example.com/job1",
         recrut_pblnt_sn=123456,
@@ -192,6 +195,13 @@ def test_search_employees_success(mock_es_search, client, test_db):
     assert data["results"][0]["title"] == "정보통신 개발자"
     assert data["results"][0]["institution"] == "TechCorp"
 
+    # prefix 후보 검색과 BM25 재정렬이 한 번의 요청으로 수행되는지 확인
+    mock_es_search.assert_called_once()
+    body = mock_es_search.call_args.kwargs["body"]
+    assert body["size"] == 1
+    assert body["query"]["bool"]["must"]["match_phrase_prefix"]["category_name"]["query"] == "정보통신"
+    assert body["rescore"]["query"]["rescore_query"]["match"]["category_name"]["operator"] == "and"
+
 # 🔹 사용자 미존재 테스트
 def test_search_employees_user_not_found(client, setup_database):
     """
@@ -307,3 +317,35 @@ def test_search_employees_es_other_error(mock_es_search, client, test_db):
     response = client.get("/employee/DB_search", params={"user_id": "user123", "keyword": "정보통신"})
     assert response.status_code == 500
     assert "ES 오류" in response.json()["detail"]
+
+
+# 🔹 커서 페이지네이션 테스트
+@patch("app.routers.employee.es.search")
+def test_search_employees_cursor_pagination(mock_es_search, client, test_db):
+    """
+    next_cursor로 다음 페이지를 요청하면 이전 페이지 다음 공고부터 반환되고,
+    마지막 페이지에서는 next_cursor가 None인지 확인합니다.
+    """
+    mock_es_search.return_value = {
+        "hits": {"hits": [{"_source": {"category_name": "정보통신", "category_id": 1, "feature": "employee"}}]}
+    }
+    for recruit_id, days_ago in ((2, 5), (3, 1)):
+        test_db.add(Employee(
+            recruit_id=recruit_id,
+            title=f"정보통신 개발자 {recruit_id}",
+            institution="TechCorp",
+            start_date=TODAY - datetime.timedelta(days=days_ago),
+            end_date=TODAY + datetime.timedelta(days=25),
+            recrut_pblnt_sn=123456 + recruit_id,
+        ))
+        test_db.add(EmployeeCategory(recruit_id=recruit_id, category_id=1))
+    test_db.commit()
+
+    params = {"user_id": "user123", "keyword": "정보통신", "limit": 2}
+    first = client.get("/employee/DB_search", params=params).json()
+    assert [job["title"] for job in first["results"]] == ["정보통신 개발자 3", "정보통신 개발자 2"]
+    assert first["next_cursor"] is not None
+
+    second = client.get("/employee/DB_search", params={**params, "cursor": first["next_cursor"]}).json()
+    assert [job["title"] for job in second["results"]] == ["정보통신 개발자"]
+    assert second["next_cursor"] is None
@@ -8,13 +8,18 @@
     - 존재하지 않는 사용자 처리
     - 구독 중인 카테고리가 없을 경우 처리
     - 카테고리에 해당하는 채용 공고가 없을 경우 처리
+    - 마감된 채용 공고 제외
+    - 추천 조회가 단일 쿼리로 수행되는지 확인
+    - 같은 구독 조합의 반복 요청이 응답 캐시에서 DB 조회 없이 처리되는지 확인
+    - next_cursor로 다음 페이지를 조회하는 커서 페이지네이션
 """
 
 import datetime
 
 import pytest
 from fastapi.testclient import TestClient
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, event
+from sqlalchemy.engine import Engine
 from sqlalchemy.orm import sessionmaker
 from sqlalchemy.sql import text
 
@@ -30,7 +35,11 @@ from app.models import (
     UserCategory,
     Users,
 )
+from app.utils import response_cache as response_cache_module
 from app.utils.db_manager import db_manager
+from app.utils.response_cache import NullResponseCache
+
+TODAY = datetime.date.today()  # 마감된 공고는 추천·검색에서 제외되므로 공고 기간은 실행일 기준으로 생성
 
 # 테스트용 SQLite 파일 DB (세션 유지)
 TEST_DATABASE_URL = "sqlite:///./test.db"
@@ -99,8 +108,8 @@ def test_db(setup_database):
         recruit_id=1,
         title="AI 연구원",
         institution="OpenAI",
-        start_date=datetime.date(2025, 4, 1),
-        end_date=datetime.date(2025, 4, 30),
+        start_date=TODAY - datetime.timedelta(days=10),
+        end_date=TODAY + datetime.timedelta(days=20),
         recrut_se="R2030", # 신입 + 경력
         detail_url="https://example.com/openai",
         recrut_pblnt_sn=280271,
@@ -109,8 +118,8 @@ def test_db(setup_database):
         recruit_id=2,
         title="AI 엔지니어",
         institution="Naver",
-        start_date=datetime.date(2025, 4, 5),
-        end_date=datetime.date(2025, 5, 5),
+        start_date=TODAY - datetime.timedelta(days=6),
+        end_date=TODAY + datetime.timedelta(days=25),
         recrut_se="R2010", # 신입
         detail_url="https://example.com/naver",
         recrut_pblnt_sn=280272,
@@ -251,6 +260,25 @@ def test_recruit_recommendation_no_jobs(test_client: TestClient, test_db):
     assert response.status_code == 404
     assert response.json() == {"detail": "No recruitment posts found for user's interests"}
 
+# ✅ 마감된 공고 제외 테스트
+def test_recruit_recommendation_excludes_expired_postings(test_client: TestClient, test_db):
+    """마감일이 지난 공고는 시작일이 가장 최근이어도 추천되지 않는지 테스트합니다."""
+    expired = Employee(
+        recruit_id=3,
+        title="마감된 AI 공고",
+        institution="Kakao",
+        start_date=TODAY,
+        end_date=TODAY - datetime.timedelta(days=1),
+        recrut_pblnt_sn=280273,
+    )
+    test_db.add(expired)
+    test_db.add(EmployeeCategory(recruit_id=3, category_id=1))
+    test_db.commit()
+
+    response = test_client.get("/employee/recommend", params={"user_id": "user123", "limit": 10})
+    assert response.status_code == 200
+    assert [job["recruit_id"] for job in response.json()["results"]] == [2, 1]
+
 # ✅ limit보다 적은 결과가 반환되는 경우 테스트
 def test_recruit_recommendation_limit_less_than_requested(test_client: TestClient, test_db):
     """limit 값보다 적은 채용 공고가 존재할 때 메시지가 포함되는지 테스트합니다."""
@@ -263,3 +291,94 @@ def test_recruit_recommendation_limit_less_than_requested(test_client: TestClien
     assert len(data["results"]) == 2
     assert data["message"] == "채용공고 데이터가 부족하여, 요청하신 채용공고 10개 중 2개의 채용공고만 조회되었습니다."
 
+# ✅ 단일 쿼리 수행 테스트
+def test_recruit_recommendation_single_query(test_client: TestClient, test_db, monkeypatch):
+    """피드가 없을 때 사용자 확인, 구독 조회, 채용 공고 조회가 한 번의 DB 왕복으로 처리되는지 테스트합니다.
+
+    응답 캐시는 사용하지 않습니다.
+    """
+    monkeypatch.setattr(response_cache_module, "response_cache", NullResponseCache())
+    statements = []
+
+    def count_statement(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    # 다른 테스트 모듈의 엔진이 의존성으로 주입될 수 있으므로 모든 엔진의 쿼리를 집계
+    event.listen(Engine, "before_cursor_execute", count_statement)
+    try:
+        response = test_client.get("/employee/recommend", params={"user_id": "user123", "limit": 2})
+    finally:
+        event.remove(Engine, "before_cursor_execute", count_statement)
+
+    assert response.status_code == 200
+    assert len(statements) == 1
+
+# ✅ 구독 조합 응답 캐시 테스트
+def test_recruit_recommendation_cached_by_subscription_set(test_client: TestClient, test_db):
+    """같은 카테고리를 구독한 다른 사용자는 캐시된 응답을 받는지 테스트합니다.
+
+    memory 백엔드는 구독 조합을 캐시하지 않으므로, 요청마다 구독 조회 한 번만 수행하는지도 확인합니다.
+    """
+    first = test_client.get("/employee/recommend", params={"user_id": "user123", "limit": 2})
+
+    test_db.add(Users(user_id="user456", user_name="김철수"))
+    test_db.add(UserCategory(user_id="user456", category_id=1, is_active=True))
+    test_db.commit()
+
+    statements = []
+
+    def count_statement(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    event.listen(Engine, "before_cursor_execute", count_statement)
+    try:
+        second = test_client.get("/employee/recommend", params={"user_id": "user456", "limit": 2})
+        subscription_lookups = len(statements)
+        third = test_client.get("/employee/recommend", params={"user_id": "user456", "limit": 2})
+    finally:
+        event.remove(Engine, "before_cursor_execute", count_statement)
+
+    assert first.json() == second.json() == third.json()
+    assert subscription_lookups == 1  # 구독 조합 조회만 수행
+    assert len(statements) == 2  # 세 번째 요청도 구독 조합 조회만 수행
+
+    # 채용 공고가 변경되면 캐시된 응답은 무효화됨
+    test_db.query(Employee).filter(Employee.recruit_id == 2).update({"title": "AI 엔지니어 (수정)"})
+    test_db.commit()
+    response = test_client.get("/employee/recommend", params={"user_id": "user456", "limit": 2})
+    assert "AI 엔지니어 (수정)" in [job["title"] for job in response.json()["results"]]
+
+# ✅ 커서 페이지네이션 테스트
+def test_recruit_recommendation_cursor_pagination(test_client: TestClient, test_db):
+    """next_cursor로 시작일이 같은 공고도 빠짐없이 (start_date, recruit_id) 역순으로 이어서 조회되는지 테스트합니다."""
+    test_db.add(Employee(
+        recruit_id=3,
+        title="AI 데이터 엔지니어",
+        institution="Kakao",
+        start_date=TODAY - datetime.timedelta(days=6),  # recruit_id=2와 시작일이 같음
+        end_date=TODAY + datetime.timedelta(days=15),
+        recrut_pblnt_sn=280273,
+    ))
+    test_db.add(EmployeeCategory(recruit_id=3, category_id=1))
+    test_db.commit()
+
+    pages = []
+    cursor = None
+    while True:
+        params = {"user_id": "user123", "limit": 2}
+        if cursor:
+            params["cursor"] = cursor
+        response = test_client.get("/employee/recommend", params=params)
+        assert response.status_code == 200
+        data = response.json()
+        pages.append([job["recruit_id"] for job in data["results"]])
+        cursor = data["next_cursor"]
+        if cursor is None:
+            break
+
+    assert pages == [[3, 2], [1]]
+    assert data["message"] == "채용공고 데이터가 부족하여, 요청하신 채용공고 2개 중 1개의 채용공고만 조회되었습니다."
+
+    response = test_client.get("/employee/recommend", params={"user_id": "user123", "cursor": "잘못된커서"})
+    assert response.status_code == 400
+    assert response.json() == {"detail": "Invalid cursor"}
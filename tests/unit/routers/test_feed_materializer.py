@@ -0,0 +1,229 @@
+"""사용자별 추천 피드 테스트 모듈.
+
+이 모듈은 feed_materializer의 기능을 테스트합니다.
+
+주요 테스트 항목:
+    - 피드를 갱신하면 추천 API가 피드 조회 쿼리 하나로 실시간 조회와 같은 결과를 반환하는지 확인
+    - 구독 변경 시 해당 사용자의 피드가 삭제되어 실시간 조회로 대체되는지 확인
+    - FEED_SIZE보다 큰 limit은 실시간 조회로 대체되는지 확인
+    - 피드의 공고 일부가 마감되어 한 페이지가 안 되면 실시간 조회로 대체되는지 확인
+    - 뉴스가 없는 구독 카테고리의 부족 메시지 유지
+    - 뉴스 피드가 (news_id, publish_date)로 뉴스에 조인되는지 확인
+    - 채용 공고 수집 후 수집된 카테고리의 피드 갱신
+"""
+
+import datetime
+from unittest.mock import patch
+
+import pytest
+from sqlalchemy import create_engine, event, select
+from sqlalchemy.orm import sessionmaker
+
+from app.models import Base, Category, Employee, EmployeeCategory, Feature, News, UserCategory, UserFeed, Users
+from app.routers.employee import fetch_recruit_recommendations
+from app.routers.news import fetch_news_recommendations
+from app.utils import insert_employee_data
+from app.utils.feed_materializer import EMPLOYEE_FEED, NEWS_FEED, news_feed_query, refresh_feeds
+from app.utils.user_cache import user_cache
+
+
+@pytest.fixture
+def db(tmp_path, monkeypatch):
+    """채용 카테고리 2개, 뉴스 카테고리 2개와 구독 사용자 2명이 들어 있는 SQLite 세션을 생성합니다."""
+    monkeypatch.setenv("FEED_SIZE", "3")
+    engine = create_engine(f"sqlite:///{tmp_path / 'feed.db'}")
+    Base.metadata.create_all(bind=engine)
+    session = sessionmaker(bind=engine)()
+    today = datetime.date.today()
+    now = datetime.datetime.now()
+
+    session.add_all([
+        Feature(feature_id=1, feature_type="employee"),
+        Feature(feature_id=2, feature_type="news"),
+        Users(user_id="user123", user_name="홍길동"),
+        Users(user_id="user456", user_name="김철수"),
+    ])
+    session.add_all([
+        Category(category_id=11, feature_id=1, category_name="사업관리"),
+        Category(category_id=12, feature_id=1, category_name="경영.회계.사무"),
+        Category(category_id=1, feature_id=2, category_name="AI"),
+        Category(category_id=2, feature_id=2, category_name="Cloud"),
+    ])
+    session.add_all([
+        Employee(recruit_id=recruit_id, title=f"공고 {recruit_id}", institution="기관",
+                 start_date=today - datetime.timedelta(days=recruit_id), end_date=today + datetime.timedelta(days=30),
+                 recrut_pblnt_sn=recruit_id)
+        for recruit_id in range(1, 6)
+    ])
+    session.add_all([
+        EmployeeCategory(recruit_id=recruit_id, category_id=11 if recruit_id <= 3 else 12)
+        for recruit_id in range(1, 6)
+    ])
+    session.add_all([
+        News(news_id=news_id, category_id=1, title=f"AI 뉴스 {news_id}", contents="내용", source="AI News",
+             publish_date=now - datetime.timedelta(hours=news_id), category="AI",
+             url=f"https://news.example.com/{news_id}", original_url=f"https://news.example.com/{news_id}")
+        for news_id in range(1, 5)
+    ])
+    session.add_all([
+        UserCategory(user_id="user123", category_id=11, is_active=True),
+        UserCategory(user_id="user123", category_id=12, is_active=True),
+        UserCategory(user_id="user123", category_id=1, is_active=True),
+        UserCategory(user_id="user123", category_id=2, is_active=True),
+        UserCategory(user_id="user456", category_id=12, is_active=True),
+    ])
+    session.commit()
+    user_cache.invalidate()
+
+    yield session
+    session.close()
+    engine.dispose()
+    user_cache.invalidate()
+
+
+def count_statements(db, call):
+    """call을 실행하고 (결과, 실행된 SQL 목록)을 반환합니다."""
+    statements = []
+
+    def record(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    event.listen(db.get_bind(), "before_cursor_execute", record)
+    try:
+        return call(), statements
+    finally:
+        event.remove(db.get_bind(), "before_cursor_execute", record)
+
+
+def test_employee_feed_matches_live_query_in_one_statement(db):
+    """피드를 갱신하면 추천 결과는 실시간 조회와 같고, 피드 조회 쿼리 하나로 처리되는지 테스트합니다."""
+    live = fetch_recruit_recommendations(db, "user123", 3)
+
+    assert refresh_feeds(db, EMPLOYEE_FEED) == 2
+    feed, statements = count_statements(db, lambda: fetch_recruit_recommendations(db, "user123", 3))
+
+    assert len(statements) == 1 and "user_feed" in statements[0]
+    assert [job.recruit_id for job in feed["results"]] == [job.recruit_id for job in live["results"]] == [1, 2, 3]
+    assert feed["message"] is None
+    assert [job.recruit_id for job in fetch_recruit_recommendations(db, "user123", 2)["results"]] == [1, 2]
+
+
+def test_refresh_only_touches_subscribers_of_changed_categories(db):
+    """category_ids를 지정하면 해당 카테고리를 구독 중인 사용자의 피드만 다시 계산하는지 테스트합니다."""
+    assert refresh_feeds(db, EMPLOYEE_FEED, {11}) == 1
+
+    users = set(db.scalars(select(UserFeed.user_id).where(UserFeed.feature_type == EMPLOYEE_FEED)))
+    assert users == {"user123"}
+    assert refresh_feeds(db, EMPLOYEE_FEED, []) == 0
+
+
+def test_subscription_change_invalidates_feed(db):
+    """구독을 해지하면 해당 사용자의 피드가 삭제되고 실시간 조회 결과가 반환되는지 테스트합니다."""
+    refresh_feeds(db, EMPLOYEE_FEED)
+    refresh_feeds(db, NEWS_FEED)
+
+    subscription = db.scalars(
+        select(UserCategory).where(UserCategory.user_id == "user123", UserCategory.category_id == 11)
+    ).one()
+    subscription.is_active = False
+    db.commit()
+
+    assert db.scalars(select(UserFeed).where(UserFeed.user_id == "user123")).all() == []
+    assert db.scalars(select(UserFeed).where(UserFeed.user_id == "user456")).all() != []
+    results = fetch_recruit_recommendations(db, "user123", 3)["results"]
+    assert [job.recruit_id for job in results] == [4, 5]
+
+
+def test_bulk_subscription_change_invalidates_all_feeds(db):
+    """query().update()로 구독을 일괄 변경하면 모든 피드가 삭제되는지 테스트합니다."""
+    refresh_feeds(db, EMPLOYEE_FEED)
+
+    db.query(UserCategory).filter(UserCategory.category_id == 12).update({"is_active": False})
+    db.commit()
+
+    assert db.scalars(select(UserFeed)).all() == []
+
+
+def test_limit_above_feed_size_falls_back_to_live_query(db):
+    """FEED_SIZE보다 큰 limit은 피드를 건너뛰고 실시간 조회로 모든 공고를 반환하는지 테스트합니다."""
+    refresh_feeds(db, EMPLOYEE_FEED)
+
+    result, statements = count_statements(db, lambda: fetch_recruit_recommendations(db, "user123", 10))
+
+    assert len(statements) == 1 and "user_feed" not in statements[0]
+    assert [job.recruit_id for job in result["results"]] == [1, 2, 3, 4, 5]
+    assert result["message"] == "채용공고 데이터가 부족하여, 요청하신 채용공고 10개 중 5개의 채용공고만 조회되었습니다."
+
+
+def test_partly_expired_feed_falls_back_to_live_query(db):
+    """피드 계산 후 공고 일부가 마감되어 피드로 한 페이지를 채울 수 없으면 실시간 조회로 대체되는지 테스트합니다."""
+    refresh_feeds(db, EMPLOYEE_FEED)
+    db.get(Employee, 2).end_date = datetime.date.today() - datetime.timedelta(days=1)
+    db.commit()
+
+    result, statements = count_statements(db, lambda: fetch_recruit_recommendations(db, "user123", 3))
+
+    assert len(statements) == 1
+    assert [job.recruit_id for job in result["results"]] == [1, 3, 4]
+    assert result["message"] is None
+    assert result["next_cursor"] is not None  # 5번 공고가 다음 페이지에 남아 있음
+
+
+def test_news_feed_keeps_empty_categories_and_messages(db):
+    """뉴스 피드가 구독 순서를 유지하고, 뉴스가 없는 카테고리에 부족 메시지를 붙이는지 테스트합니다."""
+    live = fetch_news_recommendations(db, "user123", 2)
+
+    assert refresh_feeds(db, NEWS_FEED) == 2
+    feed, statements = count_statements(db, lambda: fetch_news_recommendations(db, "user123", 2))
+
+    assert len(statements) == 1
+    summary = [
+        (group["category"], group["message"], [news.news_id for news in group["news_list"]])
+        for group in feed["results"]
+    ]
+    assert summary[2:] == [
+        ("AI", None, [1, 2]),
+        ("Cloud", "Cloud 카테고리의 뉴스가 부족하여 0개만 조회되었습니다.", []),
+    ]
+    assert summary == [
+        (group["category"], group["message"], [news.news_id for news in group["news_list"]])
+        for group in live["results"]
+    ]
+
+
+def test_news_feed_joins_on_news_id_and_publish_date(db):
+    """다른 publish_date(파티션)에 같은 news_id가 있어도 피드 항목이 그 날짜의 뉴스 하나에만 조인되는지 테스트합니다."""
+    newest = db.get(News, (1, db.scalars(select(News.publish_date).where(News.news_id == 1)).one()))
+    db.add(News(news_id=1, category_id=1, title="AI 뉴스 1 (이전)", contents="내용", source="AI News",
+                publish_date=newest.publish_date - datetime.timedelta(days=30), category="AI",
+                url=newest.url, original_url=newest.original_url))
+    db.commit()
+
+    refresh_feeds(db, NEWS_FEED)
+    feed_news = db.scalars(news_feed_query("user123", 4)).all()
+
+    assert sorted((news.news_id, news.title) for news in feed_news) == [
+        (1, "AI 뉴스 1"), (2, "AI 뉴스 2"), (3, "AI 뉴스 3"), (4, "AI 뉴스 4")
+    ]
+    assert db.scalars(select(UserFeed.item_date).where(UserFeed.item_id == 1)).all() == [newest.publish_date]
+
+
+def test_recent_jobs_ingestion_refreshes_feeds_of_collected_categories(db):
+    """채용 공고가 저장되면 수집된 공고의 카테고리로 피드 갱신을 요청하는지 테스트합니다."""
+    jobs = [{
+        "recrutPblntSn": "100",
+        "recrutPbancTtl": "신규 공고",
+        "instNm": "기관",
+        "pbancBgngYmd": datetime.date.today().strftime("%Y%m%d"),
+        "pbancEndYmd": (datetime.date.today() + datetime.timedelta(days=10)).strftime("%Y%m%d"),
+        "ncsCdLst": "R600001,R600002",
+        "hireTypeLst": "R1010",
+    }]
+
+    with patch.object(insert_employee_data, "fetch_recruit_jobs", return_value=jobs), \
+            patch.object(insert_employee_data, "refresh_feeds", wraps=refresh_feeds) as refresh:
+        assert insert_employee_data.fetch_and_insert_recent_jobs(db_session=db) == 1
+
+    refresh.assert_called_once_with(db, EMPLOYEE_FEED, {11, 12})
+    results = fetch_recruit_recommendations(db, "user456", 1)["results"]
+    assert [job.recruit_id for job in results] == [100]
@@ -1,6 +1,7 @@
 import pytest
 from fastapi.testclient import TestClient
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, event
+from sqlalchemy.engine import Engine
 from sqlalchemy.orm import sessionmaker
 from sqlalchemy.sql import text
 
@@ -98,3 +99,30 @@ def test_get_category_list_user_not_found(test_client: TestClient, test_db):
     response = test_client.get("/user/invalid_user")
     assert response.status_code == 404
     assert response.json() == {"detail": "User not found."}
+
+# ✅ 구독 수와 무관하게 쿼리 수가 일정한지 확인 (N+1 방지)
+def test_get_category_list_query_count(test_client: TestClient, test_db):
+    """구독 카테고리가 많아도 사용자 확인 + 목록 조회 2개의 쿼리만 실행되는지 테스트"""
+    db = test_db
+    feature = db.query(Feature).first()
+    categories = [Category(feature_id=feature.feature_id, category_name=f"Tech{i}") for i in range(20)]
+    db.add_all(categories)
+    db.commit()
+    db.add_all(UserCategory(user_id="user123", category_id=c.category_id, is_active=True) for c in categories)
+    db.commit()
+
+    statements = []
+
+    def count_statement(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    event.listen(Engine, "before_cursor_execute", count_statement)
+    try:
+        response = test_client.get("/user/user123")
+    finally:
+        event.remove(Engine, "before_cursor_execute", count_statement)
+
+    assert response.status_code == 200
+    assert len(response.json()) == 21
+    assert response.json()[0] == {"feature_name": "News", "category_name": "Tech"}
+    assert len(statements) <= 2
@@ -11,6 +11,8 @@
     - 여러 카테고리에 대한 뉴스 추천
     - 최신 뉴스 우선 정렬
     - limit 파라미터 경계값 테스트
+    - 카테고리 수와 무관한 단일 쿼리 조회
+    - 카테고리별 next_cursor로 해당 카테고리의 다음 페이지를 조회하는 커서 페이지네이션
 """
 
 import datetime
@@ -18,13 +20,18 @@ from unittest.mock import patch
 
 import pytest
 from fastapi.testclient import TestClient
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, event
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.engine import Engine
 from sqlalchemy.orm import sessionmaker
 from sqlalchemy.sql import text
 
 from app.main import app
 from app.models import Base, Category, Feature, News, UserCategory, Users
+from app.routers.news import build_news_recommendation_query
+from app.utils import response_cache as response_cache_module
 from app.utils.db_manager import db_manager
+from app.utils.response_cache import NullResponseCache
 
 # 테스트용 SQLite 파일 DB (세션 유지)
 TEST_DATABASE_URL = "sqlite:///./test.db"
@@ -304,3 +311,80 @@ def test_news_recommendation_limit_less_than_requested(test_client: TestClient,
     assert isinstance(data["results"], list)
     total_news = sum(len(group["news_list"]) for group in data["results"])
     assert total_news == 3
+
+# ✅ 단일 쿼리 수행 테스트
+def test_news_recommendation_single_query(test_client: TestClient, test_db, monkeypatch):
+    """피드가 없을 때 구독 카테고리 수와 관계없이 한 번의 DB 왕복으로 뉴스를 조회하는지 테스트합니다.
+
+    응답 캐시는 사용하지 않습니다.
+    """
+    monkeypatch.setattr(response_cache_module, "response_cache", NullResponseCache())
+    statements = []
+
+    def count_statement(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    # 다른 테스트 모듈의 엔진이 의존성으로 주입될 수 있으므로 모든 엔진의 쿼리를 집계
+    event.listen(Engine, "before_cursor_execute", count_statement)
+    try:
+        response = test_client.get("/news/recommend", params={"user_id": "user123", "limit": 1})
+    finally:
+        event.remove(Engine, "before_cursor_execute", count_statement)
+
+    assert response.status_code == 200
+    assert len(statements) == 1
+    results = response.json()["results"]
+    assert [group["category"] for group in results] == ["AI", "Blockchain"]
+    assert [news["title"] for news in results[0]["news_list"]] == ["AI 뉴스 1"]
+    assert all(group["message"] is None for group in results)
+
+# ✅ PostgreSQL LATERAL 쿼리 테스트
+def test_news_recommendation_query_uses_lateral_on_postgresql():
+    """PostgreSQL에서는 카테고리별 상위 N개를 LATERAL JOIN으로 조회하는지 테스트합니다."""
+    statement = build_news_recommendation_query("user123", 5, use_lateral=True)
+    sql = str(statement.compile(dialect=postgresql.dialect()))
+
+    assert "LEFT OUTER JOIN LATERAL" in sql
+    assert "row_number" not in sql
+
+# ✅ 존재하지 않는 사용자 캐시 테스트
+def test_news_recommendation_unknown_user_skips_db(test_client: TestClient, test_db):
+    """존재하지 않는 사용자로 반복 요청하면 두 번째부터 DB를 조회하지 않는지 테스트합니다."""
+    statements = []
+
+    def count_statement(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    test_client.get("/news/recommend", params={"user_id": "probe-bot"})
+    event.listen(Engine, "before_cursor_execute", count_statement)
+    try:
+        response = test_client.get("/news/recommend", params={"user_id": "probe-bot"})
+    finally:
+        event.remove(Engine, "before_cursor_execute", count_statement)
+
+    assert response.status_code == 404
+    assert response.json() == {"detail": "User not found"}
+    assert statements == []
+
+# ✅ 카테고리별 커서 페이지네이션 테스트
+def test_news_recommendation_cursor_pagination(test_client: TestClient, test_db):
+    """카테고리 결과의 next_cursor로 해당 카테고리의 다음 뉴스만 이어서 조회되는지 테스트합니다."""
+    response = test_client.get("/news/recommend", params={"user_id": "user123", "limit": 1})
+    assert response.status_code == 200
+    ai, blockchain = response.json()["results"]
+    assert [news["news_id"] for news in ai["news_list"]] == [1]
+    assert ai["next_cursor"] is not None
+    assert blockchain["next_cursor"] is None  # Blockchain 뉴스는 1개뿐
+
+    params = {"user_id": "user123", "limit": 1, "cursor": ai["next_cursor"]}
+    response = test_client.get("/news/recommend", params=params)
+    assert response.status_code == 200
+    results = response.json()["results"]
+    assert [(group["category"], [news["news_id"] for news in group["news_list"]]) for group in results] == [
+        ("AI", [3])
+    ]
+    assert results[0]["next_cursor"] is None
+
+    response = test_client.get("/news/recommend", params={"user_id": "user123", "cursor": "bm90LWEtY3Vyc29y"})
+    assert response.status_code == 400
+    assert response.json() == {"detail": "Invalid cursor"}
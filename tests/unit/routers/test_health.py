@@ -0,0 +1,95 @@
+"""서버 상태 확인 API 테스트 모듈.
+
+이 모듈은 /health 엔드포인트와 readiness 유틸리티의 기능을 테스트합니다.
+
+주요 테스트 항목:
+    - 지수 백오프 재시도 성공 및 deadline 초과
+    - liveness 응답
+    - DB/Elasticsearch 상태에 따른 readiness 응답 (200 / 503)
+"""
+
+from unittest.mock import patch
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine
+
+from app.main import app
+from app.utils.readiness import retry_with_backoff
+
+
+@pytest.fixture(scope="function")
+def test_client():
+    """테스트용 FastAPI 클라이언트를 생성합니다."""
+    return TestClient(app)
+
+
+def test_retry_with_backoff_succeeds_after_failures():
+    """실패 후 재시도하여 성공하면 결과를 반환하고, 대기 시간이 상한을 넘지 않는지 테스트합니다."""
+    attempts = []
+    delays = []
+
+    def flaky():
+        attempts.append(1)
+        if len(attempts) < 3:
+            raise ConnectionError("down")
+        return "ok"
+
+    result = retry_with_backoff(flaky, ConnectionError, deadline=10, base_delay=1, max_delay=2, sleep=delays.append)
+
+    assert result == "ok"
+    assert len(attempts) == 3
+    assert delays[0] <= 1 and delays[1] <= 2
+
+
+def test_retry_with_backoff_deadline_exceeded():
+    """deadline을 넘기면 TimeoutError로 빠르게 실패하는지 테스트합니다."""
+    def always_fail():
+        raise ConnectionError("down")
+
+    with pytest.raises(TimeoutError):
+        retry_with_backoff(always_fail, ConnectionError, deadline=0, sleep=lambda _: None)
+
+
+def test_liveness(test_client: TestClient):
+    """liveness 엔드포인트가 외부 의존성과 무관하게 200을 반환하는지 테스트합니다."""
+    response = test_client.get("/health/live")
+    assert response.status_code == 200
+    assert response.json() == {"status": "ok"}
+
+
+@patch("app.routers.health.es.ping", return_value=True)
+def test_readiness_ok(mock_ping, test_client: TestClient):
+    """DB와 Elasticsearch가 모두 정상이면 200을 반환하는지 테스트합니다."""
+    with patch("app.routers.health.db_manager._engine", create_engine("sqlite://")):
+        response = test_client.get("/health/ready")
+
+    assert response.status_code == 200
+    data = response.json()
+    assert data["status"] == "ok"
+    assert data["checks"]["database"]["status"] == "ok"
+    assert data["checks"]["elasticsearch"]["status"] == "ok"
+
+
+@patch("app.routers.health.es.ping", side_effect=ConnectionError("refused"))
+def test_readiness_elasticsearch_down(mock_ping, test_client: TestClient):
+    """Elasticsearch가 응답하지 않으면 503과 실패 원인을 반환하는지 테스트합니다."""
+    with patch("app.routers.health.db_manager._engine", create_engine("sqlite://")):
+        response = test_client.get("/health/ready")
+
+    assert response.status_code == 503
+    data = response.json()
+    assert data["status"] == "unavailable"
+    assert data["checks"]["elasticsearch"] == {"status": "error", "error": "refused"}
+
+
+@patch("app.routers.health.es.ping", side_effect=ConnectionError("refused"))
+def test_readiness_local_matcher_skips_elasticsearch(mock_ping, test_client: TestClient, monkeypatch):
+    """CATEGORY_MATCHER=local이면 Elasticsearch를 점검하지 않는지 테스트합니다."""
+    monkeypatch.setenv("CATEGORY_MATCHER", "local")
+    with patch("app.routers.health.db_manager._engine", create_engine("sqlite://")):
+        response = test_client.get("/health/ready")
+
+    assert response.status_code == 200
+    assert "elasticsearch" not in response.json()["checks"]
+    mock_ping.assert_not_called()
@@ -0,0 +1,183 @@
+from datetime import datetime
+from unittest.mock import MagicMock, patch
+
+import pytest
+from sqlalchemy import create_engine, update
+from sqlalchemy.orm import sessionmaker
+
+from app.models import Base, Category, Feature
+from app.utils.init_elasticsearch_index import (
+    CATEGORY_ALIAS,
+    INDEX_BODY,
+    WATERMARK_KEY,
+    WATERMARK_SAFETY_MARGIN,
+    create_category_index,
+    index_hash,
+    sync_categories,
+    versioned_index_name,
+)
+
+CURRENT_INDEX = versioned_index_name(index_hash())
+SEEDED_AT = datetime(2025, 1, 1, 9, 0, 0)
+
+
+@pytest.fixture
+def db_session(tmp_path):
+    """뉴스 카테고리 2개, 채용 카테고리 1개가 들어 있는 SQLite 세션을 생성합니다."""
+    engine = create_engine(f"sqlite:///{tmp_path / 'categories.db'}")
+    Base.metadata.create_all(bind=engine)
+    session = sessionmaker(bind=engine)()
+    session.add_all([
+        Feature(feature_id=1, feature_type="news", updated_at=SEEDED_AT),
+        Feature(feature_id=2, feature_type="employee", updated_at=SEEDED_AT),
+        Category(category_id=1, feature_id=1, category_name="IT/과학", updated_at=SEEDED_AT),
+        Category(category_id=2, feature_id=1, category_name="마케팅", updated_at=SEEDED_AT),
+        Category(category_id=11, feature_id=2, category_name="사업관리", updated_at=SEEDED_AT),
+    ])
+    session.commit()
+    yield session
+    session.close()
+    engine.dispose()
+
+
+def make_client(alias_indices=None, legacy_index=False, watermark=None, doc_count=0):
+    """별칭/인덱스/워터마크 상태를 흉내 내는 Elasticsearch 클라이언트 모킹 객체를 생성합니다."""
+    client = MagicMock()
+    client.indices.exists_alias.return_value = alias_indices is not None
+    client.indices.get_alias.return_value = {name: {"aliases": {CATEGORY_ALIAS: {}}} for name in alias_indices or []}
+    client.indices.exists.side_effect = lambda index: legacy_index and index == CATEGORY_ALIAS
+    meta = {WATERMARK_KEY: watermark.isoformat()} if watermark else {}
+    client.indices.get_mapping.return_value = {CURRENT_INDEX: {"mappings": {"_meta": meta}}}
+    client.count.return_value = {"count": doc_count}
+    client.delete_by_query.return_value = {"deleted": 1}
+    return client
+
+
+@pytest.fixture
+def mock_bulk():
+    """helpers.bulk를 모킹하고, 전달된 색인 요청을 bulk.actions에 기록합니다."""
+    with patch("app.utils.init_elasticsearch_index.helpers.bulk") as bulk:
+        def record(client, actions, **kwargs):
+            bulk.actions = list(actions)
+            return len(bulk.actions), []
+
+        bulk.side_effect = record
+        yield bulk
+
+
+def test_index_hash_changes_with_mapping():
+    """매핑이 바뀌면 버전 인덱스 해시가 달라지는지 테스트"""
+    changed = {**INDEX_BODY, "mappings": {"properties": {"category_id": {"type": "keyword"}}}}
+    assert index_hash() == index_hash(INDEX_BODY)
+    assert index_hash(changed) != index_hash()
+
+
+def test_sync_categories_full_from_db(db_session, mock_bulk):
+    """워터마크가 없으면 DB의 모든 카테고리를 category_id를 문서 ID로 색인하는지 테스트"""
+    client = make_client(doc_count=3)
+
+    stats = sync_categories(db_session, client)
+
+    assert stats == {"indexed": 3, "deleted": 0, "watermark": SEEDED_AT}
+    assert [action["_id"] for action in mock_bulk.actions] == [1, 2, 11]
+    assert mock_bulk.actions[2]["_source"] == {"category_id": 11, "category_name": "사업관리", "feature": "employee"}
+    client.indices.put_mapping.assert_called_once_with(
+        index=CATEGORY_ALIAS, body={"_meta": {WATERMARK_KEY: SEEDED_AT.isoformat()}}
+    )
+    client.delete_by_query.assert_not_called()
+
+
+def test_sync_categories_only_changed_rows(db_session, mock_bulk):
+    """워터마크 이후 변경된 카테고리만 다시 색인하고 삭제된 카테고리 문서를 지우는지 테스트"""
+    changed_at = datetime(2025, 2, 1, 9, 0, 0)
+    category = db_session.get(Category, 2)
+    category.category_name = "마케팅/광고"
+    category.updated_at = changed_at
+    db_session.delete(db_session.get(Category, 11))
+    db_session.commit()
+    client = make_client(watermark=datetime(2025, 1, 15), doc_count=3)
+
+    stats = sync_categories(db_session, client)
+
+    assert [action["_source"]["category_name"] for action in mock_bulk.actions] == ["마케팅/광고"]
+    assert stats == {"indexed": 1, "deleted": 1, "watermark": changed_at}
+    query = client.delete_by_query.call_args.kwargs["body"]["query"]
+    assert query == {"bool": {"must_not": {"terms": {"category_id": [1, 2]}}}}
+
+
+def test_sync_categories_rereads_late_commits_and_missing_updated_at(db_session, mock_bulk):
+    """워터마크보다 조금 이른 시각으로 늦게 커밋된 변경과 updated_at이 없는 카테고리를 다시 색인하는지 테스트"""
+    watermark = datetime(2025, 2, 1, 9, 0, 0)
+    db_session.get(Category, 1).updated_at = watermark - WATERMARK_SAFETY_MARGIN / 2
+    db_session.commit()
+    db_session.execute(update(Category).where(Category.category_id == 2).values(updated_at=None))
+    db_session.commit()
+    client = make_client(watermark=watermark, doc_count=3)
+
+    stats = sync_categories(db_session, client)
+
+    assert [action["_id"] for action in mock_bulk.actions] == [1, 2]
+    assert stats["watermark"] == watermark
+    client.indices.put_mapping.assert_not_called()
+
+
+def test_sync_categories_nothing_changed(db_session, mock_bulk):
+    """변경된 카테고리가 없으면 워터마크를 다시 쓰지 않는지 테스트"""
+    client = make_client(watermark=datetime(2025, 1, 2), doc_count=3)
+
+    stats = sync_categories(db_session, client)
+
+    assert stats["indexed"] == 0
+    client.indices.put_mapping.assert_not_called()
+
+
+def test_create_category_index_syncs_when_mapping_unchanged(db_session, mock_bulk):
+    """별칭이 이미 같은 해시의 인덱스를 가리키면 재색인 없이 증분 동기화만 하는지 테스트"""
+    client = make_client(alias_indices=[CURRENT_INDEX], watermark=SEEDED_AT, doc_count=3)
+
+    assert create_category_index(db_session, client) == CURRENT_INDEX
+    client.indices.create.assert_not_called()
+    client.indices.update_aliases.assert_not_called()
+    assert all(action["_index"] == CATEGORY_ALIAS for action in mock_bulk.actions)
+
+
+def test_create_category_index_bulk_and_swap(db_session, mock_bulk):
+    """새 버전 인덱스에 전체 카테고리를 bulk로 색인한 뒤 별칭을 원자적으로 옮기는지 테스트"""
+    client = make_client(alias_indices=["categories-old"], doc_count=3)
+
+    assert create_category_index(db_session, client) == CURRENT_INDEX
+
+    assert client.indices.create.call_args.kwargs["index"] == CURRENT_INDEX
+    mock_bulk.assert_called_once()
+    assert {action["_index"] for action in mock_bulk.actions} == {CURRENT_INDEX}
+    assert len(mock_bulk.actions) == 3
+    client.index.assert_not_called()
+    client.indices.update_aliases.assert_called_once_with(body={"actions": [
+        {"remove": {"index": "categories-old", "alias": CATEGORY_ALIAS}},
+        {"add": {"index": CURRENT_INDEX, "alias": CATEGORY_ALIAS}},
+    ]})
+    client.indices.delete.assert_called_once_with(index="categories-old")
+
+
+def test_create_category_index_replaces_legacy_index(db_session, mock_bulk):
+    """예전 방식의 'categories' 실제 인덱스는 별칭 전환과 같은 요청에서 삭제하는지 테스트"""
+    client = make_client(legacy_index=True, doc_count=3)
+
+    create_category_index(db_session, client)
+
+    actions = client.indices.update_aliases.call_args.kwargs["body"]["actions"]
+    assert actions == [
+        {"remove_index": {"index": CATEGORY_ALIAS}},
+        {"add": {"index": CURRENT_INDEX, "alias": CATEGORY_ALIAS}},
+    ]
+    client.indices.delete.assert_not_called()
+
+
+def test_create_category_index_keeps_alias_on_failure(db_session, mock_bulk):
+    """색인에 실패하면 별칭을 옮기지 않고 기존 인덱스를 유지하는지 테스트"""
+    client = make_client(alias_indices=["categories-old"])
+    mock_bulk.side_effect = RuntimeError("bulk failed")
+
+    assert create_category_index(db_session, client) is None
+    client.indices.update_aliases.assert_not_called()
+    client.indices.delete.assert_not_called()
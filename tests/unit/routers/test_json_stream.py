@@ -0,0 +1,50 @@
+import json
+
+import pytest
+
+from app.utils.json_stream import iter_batches, iter_json_array
+
+DOCUMENT = {
+    "resultCode": 200,
+    "resultMsg": "성공 \"result\":[0]",
+    "meta": {"result": [0]},
+    "result": [{"recrutPblntSn": "1", "instNm": "기관 ✅"}, [1, {"a": None}], -1.5e3, 12345, "s", True, None],
+    "totalCount": 7,
+}
+
+def chunked(raw: bytes, size: int):
+    return [raw[offset:offset + size] for offset in range(0, len(raw), size)]
+
+@pytest.mark.parametrize("size", [1, 2, 3, 7, 64, 1 << 20])
+def test_iter_json_array_across_chunk_boundaries(size):
+    """청크 경계가 문자열, 숫자, 다중 바이트 문자 중간에 걸려도 같은 결과를 반환하는지 테스트"""
+    raw = json.dumps(DOCUMENT, ensure_ascii=False, indent=2).encode("utf-8")
+
+    assert list(iter_json_array(chunked(raw, size), "result")) == DOCUMENT["result"]
+
+@pytest.mark.parametrize("document", [{}, {"a": 1}, {"result": []}, {"result": None, "z": 1}])
+def test_iter_json_array_empty(document):
+    """key가 없거나 빈 배열, null이면 아무것도 반환하지 않는지 테스트"""
+    assert list(iter_json_array([json.dumps(document).encode()], "result")) == []
+
+@pytest.mark.parametrize("raw", [b'{"result":[1,2', b'{"result":[1 2]}', b'[1]', b'{"result":[{"a":}]}'])
+def test_iter_json_array_invalid(raw):
+    """잘리거나 형식이 잘못된 JSON은 ValueError를 발생시키는지 테스트"""
+    with pytest.raises(ValueError):
+        list(iter_json_array(chunked(raw, 3), "result"))
+
+def test_iter_json_array_stops_after_array():
+    """배열을 모두 읽으면 나머지 입력은 읽지 않는지 테스트"""
+    read = []
+
+    def chunks():
+        for chunk in (b'{"result":[1,2]', b',"totalCount":2}'):
+            read.append(chunk)
+            yield chunk
+
+    assert list(iter_json_array(chunks(), "result")) == [1, 2]
+    assert len(read) == 1
+
+def test_iter_batches():
+    assert list(iter_batches(iter(range(7)), 3)) == [[0, 1, 2], [3, 4, 5], [6]]
+    assert list(iter_batches([], 3)) == []
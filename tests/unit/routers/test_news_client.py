@@ -4,16 +4,33 @@
 
 주요 테스트 항목:
     - 외부 네이버 뉴스 API의 Response를 json -> news 파싱
+    - 배치 INSERT ON CONFLICT DO NOTHING 저장
+    - 파티션 확인과 저장에 네이버 작성일(+0900)을 현지 시각(naive)으로 바꿔 사용
+    - 카테고리 동시 수집, 중복 제거 및 실패 카테고리 처리
+    - 워터마크까지만 페이지를 넘기는 증분 수집
+    - 페이지 한도로 워터마크에 도달하지 못하면 워터마크를 유지하고 다음 수집에서 남은 구간부터 이어서 조회
+    - 요청 속도 제한
 """
 
 from datetime import datetime, timedelta
+from unittest.mock import MagicMock
 
 import pytest
+import requests
 from sqlalchemy import create_engine
 from sqlalchemy.orm import sessionmaker
 
+from app.models import Base, Category, Feature, NewsCrawlState
 from app.models.news import News
-from app.utils.news_client import parse_naver_news
+from app.utils import news_client
+from app.utils.news_client import (
+    RateLimiter,
+    bulk_insert_news,
+    crawl_category_news,
+    ingest_subscribed_news,
+    parse_naver_news,
+    parse_naver_news_rows,
+)
 
 # 테스트용 SQLite 파일 DB (세션 유지)
 TEST_DATABASE_URL = "sqlite:///./test.db"
@@ -59,3 +76,164 @@ def test_parse_naver_news_basic(sample_json):
     assert isinstance(news.news_id, int)
     assert len(str(news.news_id)) <= 10  # 최대 10자리
 
+
+
+@pytest.fixture
+def ingest_db(tmp_path):
+    """뉴스 카테고리 2개가 들어 있는 SQLite 세션을 생성합니다."""
+    ingest_engine = create_engine(f"sqlite:///{tmp_path / 'ingest.db'}")
+    Base.metadata.create_all(bind=ingest_engine)
+    db = sessionmaker(bind=ingest_engine)()
+    db.add(Feature(feature_type="news"))
+    db.add_all([Category(feature_id=1, category_name="AI"), Category(feature_id=1, category_name="Cloud")])
+    db.commit()
+    yield db
+    db.close()
+    ingest_engine.dispose()
+
+
+def naver_item(link):
+    return {
+        "title": "뉴스",
+        "originallink": "https://example.com/original",
+        "link": link,
+        "description": "내용",
+        "pubDate": "Mon, 13 May 2024 15:00:00 +0900",
+    }
+
+
+def test_bulk_insert_news_skips_existing(ingest_db):
+    rows = parse_naver_news_rows({"items": [naver_item("https://example.com/a")]}, 1, "AI")
+    assert bulk_insert_news(ingest_db, rows) == 1
+
+    more = parse_naver_news_rows(
+        {"items": [naver_item("https://example.com/a"), naver_item("https://example.com/b")]}, 1, "AI"
+    )
+    assert bulk_insert_news(ingest_db, more, batch_size=1) == 1
+    assert ingest_db.query(News).count() == 2
+
+
+def test_bulk_insert_news_uses_local_publish_date(ingest_db, monkeypatch):
+    """파티션 확인과 INSERT 모두 +0900 작성일 대신 같은 현지 시각(naive)을 사용하는지 테스트합니다."""
+    partition_dates = []
+    monkeypatch.setattr(news_client, "ensure_partitions_for",
+                        lambda db, publish_dates: partition_dates.extend(publish_dates))
+    item = dict(naver_item("https://example.com/a"), pubDate="Sun, 01 Feb 2026 05:00:00 +0900")
+    rows = parse_naver_news_rows({"items": [item]}, 1, "AI")
+
+    assert bulk_insert_news(ingest_db, rows) == 1
+    assert partition_dates == [datetime(2026, 2, 1, 5, 0)]
+    assert ingest_db.query(News.publish_date).scalar() == datetime(2026, 2, 1, 5, 0)
+    assert rows[0]["publish_date"].utcoffset() == timedelta(hours=9)  # 호출자의 행은 바꾸지 않음
+
+
+def test_ingest_subscribed_news_dedupes_and_tolerates_failures(ingest_db):
+    ingest_db.add(Category(feature_id=1, category_name="Broken"))
+    ingest_db.commit()
+
+    def fake_get(url, params, timeout):
+        if params["query"] == "Broken":
+            raise requests.ConnectionError("boom")
+        response = MagicMock()
+        response.json.return_value = {"items": [
+            naver_item("https://example.com/shared"),
+            naver_item(f"https://example.com/{params['query']}"),
+        ]}
+        return response
+
+    session = MagicMock(spec=requests.Session)
+    session.get.side_effect = fake_get
+
+    result = ingest_subscribed_news(ingest_db, limit=2, max_workers=3, rate=0, session=session)
+
+    assert result == {"fetched": 4, "unique": 3, "saved": 3, "pages": 2, "failed": ["Broken"]}
+    assert session.get.call_count == 3
+    assert ingest_db.query(News).count() == 3
+    assert ingest_subscribed_news(ingest_db, limit=2, rate=0, session=session)["saved"] == 0
+
+
+def test_rate_limiter_spaces_requests():
+    now = [0.0]
+    sleeps = []
+    limiter = RateLimiter(rate=4, clock=lambda: now[0], sleep=sleeps.append)
+
+    for _ in range(3):
+        limiter.acquire()
+
+    assert sleeps == [0.25, 0.5]
+
+
+def paged_session(items):
+    """start/display 파라미터에 맞춰 items를 잘라 반환하는 가짜 HTTP 세션을 생성합니다."""
+    def fake_get(url, params, timeout):
+        start, display = params["start"], params["display"]
+        response = MagicMock()
+        response.json.return_value = {"items": items[start - 1:start - 1 + display]}
+        return response
+
+    session = MagicMock(spec=requests.Session)
+    session.get.side_effect = fake_get
+    return session
+
+
+def dated_item(index):
+    published = datetime(2024, 5, 13, 15, 0) - timedelta(minutes=index)
+    item = naver_item(f"https://example.com/{index}")
+    item["pubDate"] = published.strftime("%a, %d %b %Y %H:%M:%S +0900")
+    return item
+
+
+def test_crawl_category_news_stops_at_watermark():
+    items = [dated_item(index) for index in range(100)]  # 최신순
+    session = paged_session(items)
+    watermark = (datetime(2024, 5, 13, 15, 0) - timedelta(minutes=25), "https://example.com/25")
+    position = {"watermark": watermark, "pending": None, "resume_start": None, "resume_publish_date": None}
+
+    rows, pages, position = crawl_category_news(session, RateLimiter(0), 1, "AI", position, display=10)
+
+    assert pages == 3
+    assert [row["url"] for row in rows] == [f"https://example.com/{index}" for index in range(25)]
+    assert position["watermark"] == (datetime(2024, 5, 13, 15, 0), "https://example.com/0")
+
+    rows, pages, _ = crawl_category_news(session, RateLimiter(0), 1, "AI", None, display=10)
+    assert (len(rows), pages) == (10, 1)  # 워터마크가 없으면 첫 페이지만 수집
+
+
+def test_ingest_subscribed_news_advances_watermark(ingest_db):
+    items = [dated_item(index) for index in range(30)]
+    session = paged_session(items[20:])
+
+    first = ingest_subscribed_news(ingest_db, limit=5, rate=0, session=session)
+    state = ingest_db.get(NewsCrawlState, 1)
+    assert state.last_link == "https://example.com/20"
+    assert state.last_publish_date == datetime(2024, 5, 13, 14, 40)
+
+    session = paged_session(items)  # 새 기사 20개가 추가됨
+    second = ingest_subscribed_news(ingest_db, limit=5, rate=0, session=session)
+
+    assert first["saved"] == 5
+    assert (second["saved"], second["pages"]) == (20, 10)  # 카테고리 2개 x 5페이지
+    assert ingest_db.get(NewsCrawlState, 1).last_link == "https://example.com/0"
+
+
+def test_ingest_resumes_after_page_limit(ingest_db):
+    items = [dated_item(index) for index in range(30)]
+    ingest_subscribed_news(ingest_db, limit=5, rate=0, session=paged_session(items[20:]))
+
+    # 새 기사 20개 중 2페이지(10개)만 수집하면 워터마크는 그대로 두고 이어서 조회할 위치를 저장
+    ingest_subscribed_news(ingest_db, limit=5, rate=0, session=paged_session(items), max_pages=2)
+    state = ingest_db.get(NewsCrawlState, 1)
+    assert state.last_link == "https://example.com/20"
+    assert (state.pending_link, state.resume_start) == ("https://example.com/0", 11)
+    assert state.resume_publish_date == datetime(2024, 5, 13, 14, 51)
+
+    # 그 사이 새 기사 3개가 추가되어 위치가 밀려도 남은 구간(10~19)을 이어서 채우고 워터마크를 옮김
+    items = [dated_item(index) for index in range(-3, 0)] + items
+    ingest_subscribed_news(ingest_db, limit=5, rate=0, session=paged_session(items), max_pages=3)
+    state = ingest_db.get(NewsCrawlState, 1)
+    assert (state.last_link, state.pending_link, state.resume_start) == ("https://example.com/0", None, None)
+    assert ingest_db.query(News).count() == 25  # 첫 수집 5개 + 새 기사 20개
+
+    result = ingest_subscribed_news(ingest_db, limit=5, rate=0, session=paged_session(items))
+    assert result["saved"] == 3
+    assert ingest_db.get(NewsCrawlState, 1).last_link == "https://example.com/-3"
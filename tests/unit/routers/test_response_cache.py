@@ -0,0 +1,213 @@
+"""추천 응답 캐시 테스트 모듈.
+
+이 모듈은 response_cache의 백엔드 기능을 테스트합니다.
+
+주요 테스트 항목:
+    - memory 백엔드의 LRU 크기 제한, TTL 만료, 네임스페이스별 무효화
+    - 조회 후 무효화된 응답이 저장되지 않는지 확인
+    - redis 백엔드의 세대 번호 무효화와 Redis 오류 시 캐시 미스 처리
+    - 알 수 없는 백엔드 설정 처리와 REDIS_URL에 따른 기본 백엔드
+    - 사용자별 구독 조합은 공유 캐시(redis)에만 캐시되는지 확인
+    - async 경로에서 블로킹 백엔드 호출이 이벤트 루프 밖 스레드에서 실행되는지 확인
+"""
+
+import asyncio
+import threading
+from unittest.mock import MagicMock
+
+import pytest
+
+from app.utils import response_cache as response_cache_module
+from app.utils.response_cache import (
+    SUBSCRIPTIONS,
+    MemoryResponseCache,
+    NullResponseCache,
+    RedisResponseCache,
+    cached_recommendations_async,
+    create_response_cache,
+    load_response_cache_options,
+    subscription_set,
+)
+
+
+class LocalRedis:
+    """테스트용 Redis 대체 객체 (get/set/incr/delete만 지원, 만료는 기록만 함)."""
+
+    def __init__(self):
+        self.data = {}
+        self.expires = {}
+
+    def get(self, key):
+        return self.data.get(key)
+
+    def set(self, key, value, ex=None):
+        self.data[key] = value.encode() if isinstance(value, str) else value
+        self.expires[key] = ex
+
+    def incr(self, key):
+        self.data[key] = str(int(self.data.get(key, 0)) + 1).encode()
+        return int(self.data[key])
+
+    def delete(self, key):
+        self.data.pop(key, None)
+
+
+class ThreadRecordingRedis(LocalRedis):
+    """호출된 스레드를 기록하는 Redis 대체 객체."""
+
+    def __init__(self):
+        super().__init__()
+        self.threads = set()
+
+    def get(self, key):
+        self.threads.add(threading.get_ident())
+        return super().get(key)
+
+    def set(self, key, value, ex=None):
+        self.threads.add(threading.get_ident())
+        super().set(key, value, ex)
+
+
+class FakeAsyncSession:
+    """run_sync만 지원하는 AsyncSession 대체 객체 (이벤트 루프 스레드에서 바로 실행)."""
+
+    def __init__(self, db):
+        self.db = db
+
+    async def run_sync(self, fn, *args, **kwargs):
+        return fn(self.db, *args, **kwargs)
+
+
+class BrokenRedis:
+    """모든 요청이 실패하는 Redis 대체 객체."""
+
+    def __getattr__(self, name):
+        def fail(*args, **kwargs):
+            raise ConnectionError("redis down")
+        return fail
+
+
+def test_memory_cache_lru_ttl_and_invalidation():
+    """memory 백엔드가 크기·TTL 제한을 지키고 네임스페이스별로 무효화되는지 테스트합니다."""
+    now = [0.0]
+    cache = MemoryResponseCache(max_size=2, ttl=10, clock=lambda: now[0])
+    cache.set("employee", "1:10", {"results": [1]}, cache.version("employee"))
+    cache.set("news", "1:10", {"results": [2]}, cache.version("news"))
+    assert cache.get("employee", "1:10", 0) == {"results": [1]}  # employee를 최근 사용으로 갱신
+    cache.set("employee", "2:10", {"results": [3]}, 0)
+
+    assert cache.get("news", "1:10", 0) is None
+    assert cache.stats()["size"] == 2
+
+    cache.invalidate("employee")
+    assert cache.version("employee") == 1
+    assert cache.get("employee", "1:10", 1) is None
+
+    cache.set("employee", "1:10", {"results": [4]}, 1)
+    now[0] = 11.0
+    assert cache.get("employee", "1:10", 1) is None
+
+
+def test_memory_cache_skips_store_after_invalidation():
+    """조회와 저장 사이에 무효화되면 이전 세대로 만든 응답을 저장하지 않는지 테스트합니다."""
+    cache = MemoryResponseCache(max_size=10, ttl=60)
+    version = cache.version("news")
+    cache.invalidate("news")
+    cache.set("news", "1:5", {"results": []}, version)
+
+    assert cache.stats()["size"] == 0
+    assert cache.get("news", "1:5", cache.version("news")) is None
+
+
+def test_redis_cache_round_trip_and_generation_invalidation():
+    """redis 백엔드가 JSON으로 저장·조회하고, 무효화 시 세대 번호를 올리는지 테스트합니다."""
+    client = LocalRedis()
+    cache = RedisResponseCache(client, ttl=30)
+
+    version = cache.version("employee")
+    cache.set("employee", "1,2:10", {"results": [{"title": "AI 연구원"}], "message": None}, version)
+    assert cache.get("employee", "1,2:10", version) == {"results": [{"title": "AI 연구원"}], "message": None}
+    assert client.expires["recommend:employee:0:1,2:10"] == 30
+
+    cache.invalidate("employee")
+    assert cache.version("employee") == 1
+    assert cache.get("employee", "1,2:10", cache.version("employee")) is None
+
+    cache.set("subscriptions", "user123", [1, 2], cache.version("subscriptions"))
+    cache.delete("subscriptions", "user123")
+    assert cache.get("subscriptions", "user123", cache.version("subscriptions")) is None
+
+    cache.invalidate()
+    assert [cache.version(name) for name in ("employee", "news", "subscriptions")] == [2, 1, 1]
+
+
+def test_redis_errors_are_cache_misses():
+    """Redis 오류가 발생해도 예외 없이 캐시 미스로 처리되는지 테스트합니다."""
+    cache = RedisResponseCache(BrokenRedis())
+
+    version = cache.version("employee")
+    assert cache.get("employee", "1:10", version) is None
+    cache.set("employee", "1:10", {"results": []}, version)
+    cache.delete("subscriptions", "user123")
+    cache.invalidate("employee")
+
+
+def test_create_response_cache_backends():
+    """설정한 백엔드를 생성하고, 알 수 없는 값은 거절하는지 테스트합니다."""
+    assert isinstance(create_response_cache("memory"), MemoryResponseCache)
+    assert isinstance(create_response_cache("none"), NullResponseCache)
+    assert isinstance(create_response_cache("redis", redis_client=LocalRedis()), RedisResponseCache)
+    with pytest.raises(ValueError):
+        create_response_cache("memcached")
+
+
+def test_default_backend_follows_redis_url(monkeypatch):
+    """RESPONSE_CACHE가 없으면 REDIS_URL이 있을 때 redis, 없으면 memory 백엔드를 기본값으로 사용하는지 테스트합니다."""
+    monkeypatch.delenv("RESPONSE_CACHE", raising=False)
+    monkeypatch.delenv("REDIS_URL", raising=False)
+    assert load_response_cache_options()["backend"] == "memory"
+
+    monkeypatch.setenv("REDIS_URL", "redis://cache:6379/0")
+    assert load_response_cache_options()["backend"] == "redis"
+
+    monkeypatch.setenv("RESPONSE_CACHE", "memory")
+    assert load_response_cache_options()["backend"] == "memory"
+
+
+def test_subscription_sets_cached_only_in_shared_backend(monkeypatch):
+    """memory 백엔드는 구독 조합을 매번 조회하고, redis 백엔드만 구독 조합을 캐시하는지 테스트합니다."""
+    db = MagicMock()
+    db.scalars.return_value = [2, 1]
+
+    monkeypatch.setattr(response_cache_module, "response_cache", MemoryResponseCache())
+    assert subscription_set(db, "user123") == subscription_set(db, "user123") == [2, 1]
+    assert db.scalars.call_count == 2  # 다른 워커의 구독 변경을 알 수 없으므로 캐시하지 않음
+
+    db.scalars.reset_mock()
+    monkeypatch.setattr(response_cache_module, "response_cache", RedisResponseCache(LocalRedis()))
+    assert subscription_set(db, "user123") == subscription_set(db, "user123") == [2, 1]
+    assert db.scalars.call_count == 1
+
+
+def test_async_recommendations_call_redis_off_the_event_loop(monkeypatch):
+    """async 경로에서 Redis 호출은 이벤트 루프 스레드가 아닌 스레드풀에서 실행되는지 테스트합니다."""
+    client = ThreadRecordingRedis()
+    cache = RedisResponseCache(client)
+    cache.set(SUBSCRIPTIONS, "user123", [1, 2], cache.version(SUBSCRIPTIONS))
+    client.threads.clear()
+    monkeypatch.setattr(response_cache_module, "response_cache", cache)
+    fetch = MagicMock(return_value={"results": [1], "message": None, "next_cursor": None})
+
+    async def recommend():
+        loop_thread = threading.get_ident()
+        responses = [
+            await cached_recommendations_async(FakeAsyncSession(None), "employee", "user123", 1, fetch)
+            for _ in range(2)
+        ]
+        return loop_thread, responses
+
+    loop_thread, responses = asyncio.run(recommend())
+
+    assert responses[0] == responses[1] == fetch.return_value
+    assert fetch.call_count == 1  # 두 번째 요청은 캐시된 응답
+    assert client.threads and loop_thread not in client.threads
@@ -0,0 +1,79 @@
+"""사용자 존재 여부 캐시 테스트 모듈.
+
+이 모듈은 user_cache의 기능을 테스트합니다.
+
+주요 테스트 항목:
+    - 존재/부재 결과를 캐시하여 반복 조회 시 DB를 거치지 않는지 확인
+    - LRU 크기 제한과 positive/negative TTL 만료
+    - ORM으로 사용자를 추가하고 커밋하면 해당 항목이 무효화되는지 확인
+"""
+
+import pytest
+from sqlalchemy import create_engine, event
+from sqlalchemy.orm import sessionmaker
+
+from app.models import Base, Users
+from app.utils.user_cache import UserExistenceCache, user_cache
+
+
+@pytest.fixture
+def session_local(tmp_path):
+    """사용자 user123이 들어 있는 SQLite 세션 팩토리를 생성합니다."""
+    engine = create_engine(f"sqlite:///{tmp_path / 'users.db'}")
+    Base.metadata.create_all(bind=engine)
+    session_local = sessionmaker(bind=engine)
+    with session_local() as db:
+        db.add(Users(user_id="user123", user_name="홍길동"))
+        db.commit()
+    yield session_local
+    engine.dispose()
+
+
+def test_exists_caches_hits_and_misses(session_local):
+    """존재하는 사용자와 존재하지 않는 사용자 모두 두 번째 조회부터 DB를 거치지 않는지 테스트합니다."""
+    cache = UserExistenceCache(max_size=10, ttl=60, negative_ttl=60)
+    statements = []
+    with session_local() as db:
+        event.listen(db.get_bind(), "before_cursor_execute",
+                     lambda conn, cursor, statement, *args: statements.append(statement))
+        assert cache.exists(db, "user123") is True
+        assert cache.exists(db, "ghost") is False
+        assert cache.exists(db, "user123") is True
+        assert cache.exists(db, "ghost") is False
+
+    assert len(statements) == 2
+    assert cache.stats() == {"size": 2, "hits": 2, "misses": 2}
+
+
+def test_lru_eviction_and_ttl():
+    """최대 크기를 넘으면 오래된 항목이 제거되고, negative 항목은 더 빨리 만료되는지 테스트합니다."""
+    now = [0.0]
+    cache = UserExistenceCache(max_size=2, ttl=100, negative_ttl=10, clock=lambda: now[0])
+    cache.remember("a", True)
+    cache.remember("b", False)
+    assert cache.peek("a") is True  # a를 최근 사용으로 갱신
+    cache.remember("c", True)
+
+    assert cache.peek("b") is None
+    assert cache.peek("a") is True and cache.peek("c") is True
+
+    cache.invalidate()
+    cache.remember("d", False)
+    cache.remember("e", True)
+    now[0] = 11.0
+    assert cache.peek("d") is None
+    assert cache.peek("e") is True
+    now[0] = 101.0
+    assert cache.peek("e") is None
+
+
+def test_orm_commit_invalidates_created_user(session_local):
+    """존재하지 않는 것으로 캐시된 사용자를 ORM으로 생성하면 캐시가 무효화되는지 테스트합니다."""
+    with session_local() as db:
+        assert user_cache.exists(db, "newbie") is False
+
+        db.add(Users(user_id="newbie", user_name="신규"))
+        db.commit()
+
+        assert user_cache.peek("newbie") is None
+        assert user_cache.exists(db, "newbie") is True